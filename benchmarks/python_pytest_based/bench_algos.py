@@ -224,6 +224,19 @@ def bench_weakly_connected_components(gpubenchmark,
                  anyGraphWithAdjListComputed)
 
 
+def bench_strongly_connected_components(gpubenchmark,
+                                        anyGraphWithAdjListComputed):
+    gpubenchmark(cugraph.strongly_connected_components,
+                 anyGraphWithAdjListComputed)
+
+
+@pytest.mark.parametrize("engine", ["gpu", "cpu"])
+def bench_proto_strong_connected_component(gpubenchmark, edgelistCreated,
+                                           engine):
+    gpubenchmark(cugraph.strong_connected_component,
+                 edgelistCreated["0"], edgelistCreated["1"], engine=engine)
+
+
 def bench_overlap(gpubenchmark, anyGraphWithAdjListComputed):
     gpubenchmark(cugraph.overlap, anyGraphWithAdjListComputed)
 
@@ -263,3 +276,51 @@ def bench_edge_betweenness_centrality(gpubenchmark,
                                       anyGraphWithAdjListComputed):
     gpubenchmark(cugraph.edge_betweenness_centrality,
                  anyGraphWithAdjListComputed, k=10, seed=123)
+
+
+@pytest.mark.ETL
+@pytest.mark.parametrize("num_lookups", [1, 100, 10000, 1000000])
+@pytest.mark.parametrize("use_lookup_index", [True, False])
+def bench_add_internal_vertex_id(gpubenchmark, edgelistCreated,
+                                 num_lookups, use_lookup_index):
+    # Compares the sorted lookup index against the merge-then-sort path for
+    # order-preserving lookups of num_lookups external vertex ids.  The map
+    # is built directly since graphs with ids in [0, V) are not renumbered.
+    _, renumber_map = NumberMap.renumber(edgelistCreated, "0", "1")
+    vertices = renumber_map.implementation.df["0"].sample(
+        n=num_lookups, replace=True, random_state=42)
+    renumber_map.implementation.use_lookup_index = use_lookup_index
+    gpubenchmark(renumber_map.add_internal_vertex_id, vertices,
+                 preserve_order=True)
+
+
+@pytest.fixture(scope="module", params=[100000, 10000000],
+                ids=["100K_edges", "10M_edges"])
+def nxGraphCreated(request):
+    """
+    Create a random weighted NetworkX graph with the given number of edges,
+    over a tenth as many vertices.
+    """
+    import networkx as nx
+    import numpy as np
+
+    num_edges = request.param
+    rng = np.random.default_rng(42)
+    edges = rng.integers(0, num_edges // 10, size=(num_edges, 2))
+    weights = rng.random(num_edges)
+    Gnx = nx.Graph()
+    Gnx.add_weighted_edges_from(
+        zip(edges[:, 0].tolist(), edges[:, 1].tolist(), weights.tolist()))
+    return Gnx
+
+
+@pytest.mark.ETL
+def bench_convert_from_nx(gpubenchmark, nxGraphCreated):
+    gpubenchmark(cugraph.utilities.convert_from_nx, nxGraphCreated,
+                 weight="weight")
+
+
+@pytest.mark.ETL
+def bench_cugraph_to_nx(gpubenchmark, nxGraphCreated):
+    G = cugraph.utilities.convert_from_nx(nxGraphCreated, weight="weight")
+    gpubenchmark(cugraph.utilities.cugraph_to_nx, G)
@@ -59,6 +59,10 @@ from cugraph.structure import (
 from cugraph.centrality import (
     betweenness_centrality,
     edge_betweenness_centrality,
+    adaptive_betweenness_centrality,
+    betweenness_centrality_partial,
+    finalize_betweenness_centrality,
+    BetweennessPartial,
     katz_centrality,
 )
 
@@ -82,6 +86,9 @@ from cugraph.link_prediction import (
     jaccard_w,
     overlap_w,
     sorensen_w,
+    vertex_similarity,
+    jaccard_topk,
+    MinHashIndex,
 )
 
 from cugraph.traversal import (
@@ -100,7 +107,7 @@ from cugraph.tree import minimum_spanning_tree, maximum_spanning_tree
 from cugraph.utilities import utils
 
 from cugraph.proto.components import strong_connected_component
-from cugraph.proto.structure import find_bicliques
+from cugraph.proto.structure import find_bicliques, iter_bicliques
 
 from cugraph.linear_assignment import hungarian, dense_hungarian
 from cugraph.layout import force_atlas2
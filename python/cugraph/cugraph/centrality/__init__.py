@@ -15,4 +15,8 @@ from cugraph.centrality.katz_centrality import katz_centrality
 from cugraph.centrality.betweenness_centrality import (
     betweenness_centrality,
     edge_betweenness_centrality,
+    adaptive_betweenness_centrality,
+    betweenness_centrality_partial,
+    finalize_betweenness_centrality,
+    BetweennessPartial,
 )
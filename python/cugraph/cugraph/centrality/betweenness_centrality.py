@@ -11,17 +11,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import os
 import random
+import time
+
 import numpy as np
 import cudf
 from cugraph.centrality import betweenness_centrality_wrapper
 from cugraph.centrality import edge_betweenness_centrality_wrapper
+from cugraph.structure.graph_snapshot import _read_array, _write_array
 from cugraph.utilities import (df_edge_score_to_dictionary,
                                df_score_to_dictionary,
                                ensure_cugraph_obj_for_nx,
+                               cupy_package as cp,
                                )
 
 
+PARTIAL_FORMAT = "cugraph-betweenness-partial"
+PARTIAL_VERSION = 1
+HEADER_FILE = "header.json"
+DEFAULT_CHECKPOINT_BATCH_SIZE = 100
+
+
 # NOTE: result_type=float could be an intuitive way to indicate the result type
 def betweenness_centrality(
     G,
@@ -31,6 +43,8 @@ def betweenness_centrality(
     endpoints=False,
     seed=None,
     result_dtype=np.float64,
+    batch_size=None,
+    checkpoint_path=None,
 ):
     """
     Compute the betweenness centrality for all vertices of the graph G.
@@ -92,6 +106,16 @@ def betweenness_centrality(
     result_dtype : np.float32 or np.float64, optional, default=np.float64
         Indicate the data type of the betweenness centrality scores
 
+    batch_size : int or None, optional, default=None
+        If set, the sources are traversed batch_size at a time.  Defaults to
+        100 when checkpoint_path is set.
+
+    checkpoint_path : str or None, optional, default=None
+        Directory where the dependencies accumulated so far are saved after
+        each batch.  If it already holds a checkpoint of the same sources,
+        the computation resumes after the last saved batch.  When k is an
+        int, seed must be set for the sources to be the same.
+
     Returns
     -------
     df : cudf.DataFrame or Dictionary if using NetworkX
@@ -132,12 +156,20 @@ def betweenness_centrality(
 
     vertices = _initialize_vertices(G, k, seed)
 
-    df = betweenness_centrality_wrapper.betweenness_centrality(
-        G, normalized, endpoints, weight, vertices, result_dtype
-    )
+    if batch_size is not None or checkpoint_path is not None:
+        partial = _accumulate_dependencies(G, vertices, False, endpoints,
+                                           batch_size, checkpoint_path,
+                                           result_dtype)
+        df = _scores_frame(G, partial.dependencies,
+                           partial.number_of_sources, normalized, endpoints,
+                           result_dtype)
+    else:
+        df = betweenness_centrality_wrapper.betweenness_centrality(
+            G, normalized, endpoints, weight, vertices, result_dtype
+        )
 
-    if G.renumbered:
-        df = G.unrenumber(df, "vertex")
+        if G.renumbered:
+            df = G.unrenumber(df, "vertex")
 
     if isNx is True:
         dict = df_score_to_dictionary(df, 'betweenness_centrality')
@@ -152,7 +184,9 @@ def edge_betweenness_centrality(
     normalized=True,
     weight=None,
     seed=None,
-    result_dtype=np.float64
+    result_dtype=np.float64,
+    batch_size=None,
+    checkpoint_path=None,
 ):
     """
     Compute the edge betweenness centrality for all edges of the graph G.
@@ -210,6 +244,16 @@ def edge_betweenness_centrality(
         Indicate the data type of the betweenness centrality scores
         Using double automatically switch implementation to "default"
 
+    batch_size : int or None, optional, default=None
+        If set, the sources are traversed batch_size at a time.  Defaults to
+        100 when checkpoint_path is set.
+
+    checkpoint_path : str or None, optional, default=None
+        Directory where the dependencies accumulated so far are saved after
+        each batch.  If it already holds a checkpoint of the same sources,
+        the computation resumes after the last saved batch.  When k is an
+        int, seed must be set for the sources to be the same.
+
     Returns
     -------
     df : cudf.DataFrame or Dictionary if using NetworkX
@@ -253,10 +297,249 @@ def edge_betweenness_centrality(
     G, isNx = ensure_cugraph_obj_for_nx(G)
     vertices = _initialize_vertices(G, k, seed)
 
-    df = edge_betweenness_centrality_wrapper.edge_betweenness_centrality(
-        G, normalized, weight, vertices, result_dtype
-    )
+    if batch_size is not None or checkpoint_path is not None:
+        partial = _accumulate_dependencies(G, vertices, True, False,
+                                           batch_size, checkpoint_path,
+                                           result_dtype)
+        df = _edge_scores_frame(G, partial.dependencies, normalized,
+                                result_dtype)
+    else:
+        df = edge_betweenness_centrality_wrapper.edge_betweenness_centrality(
+            G, normalized, weight, vertices, result_dtype
+        )
+        df = _edge_output(G, df)
+
+    if isNx is True:
+        return df_edge_score_to_dictionary(df, 'betweenness_centrality')
+    else:
+        return df
+
+
+def adaptive_betweenness_centrality(
+    G,
+    top_k=10,
+    batch_size=100,
+    patience=3,
+    tolerance=None,
+    max_sources=None,
+    time_budget=None,
+    callback=None,
+    normalized=True,
+    endpoints=False,
+    seed=None,
+    result_dtype=np.float64,
+):
+    """
+    Estimate the betweenness centrality for all vertices of the graph G from
+    a growing sample of sources, stopping as soon as the estimate of the
+    top_k vertices is stable.
+
+    The sources are drawn at random without replacement and traversed
+    batch_size at a time.  After each batch the dependencies of all the
+    sources traversed so far give the current estimate, scaled like
+    betweenness_centrality with k set to the number of sources used.  The
+    sampling stops when:
+
+    - the ranking of the top_k vertices has not changed for patience
+      consecutive batches and, if tolerance is set, the relative standard
+      error of their estimates is at most tolerance,
+    - or time_budget seconds have elapsed,
+    - or max_sources sources have been traversed (all the vertices by
+      default, which gives the exact betweenness centrality),
+    - or callback returned True.
+
+    Parameters
+    ----------
+    G : cuGraph.Graph or networkx.Graph
+        The graph can be either directed (DiGraph) or undirected (Graph).
+        Weights in the graph are ignored.
+
+    top_k : int, optional, default=10
+        Number of highest ranked vertices whose ranking must be stable.
+
+    batch_size : int, optional, default=100
+        Number of sources traversed between two checks.
+
+    patience : int, optional, default=3
+        Number of consecutive batches the top_k ranking must stay the same.
+
+    tolerance : float or None, optional, default=None
+        Upper bound on the relative standard error of the estimates of the
+        top_k vertices, computed from the spread of the per-batch estimates.
+        None only checks the ranking.
+
+    max_sources : int or None, optional, default=None
+        Maximum number of sources to traverse.
+
+    time_budget : float or None, optional, default=None
+        Maximum time in seconds.  The batch in progress when the budget
+        expires is completed.
+
+    callback : callable or None, optional, default=None
+        Called after each batch as callback(df, number_of_sources) with the
+        current estimate, in the format of the returned DataFrame, and the
+        number of sources it is based on.  The sampling stops if it returns
+        True.
+
+    normalized, endpoints, seed, result_dtype :
+        See betweenness_centrality.
+
+    Returns
+    -------
+    df : cudf.DataFrame or Dictionary if using NetworkX
+        The final estimate, in the format of betweenness_centrality.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> bc = cugraph.adaptive_betweenness_centrality(G, top_k=5,
+    >>>                                              time_budget=60)
+    """
+    if result_dtype not in [np.float32, np.float64]:
+        raise TypeError("result type can only be np.float32 or np.float64")
+    if top_k < 1 or batch_size < 1 or patience < 1:
+        raise ValueError("top_k, batch_size and patience must be positive")
+
+    G, isNx = ensure_cugraph_obj_for_nx(G)
+
+    num_vertices = G.number_of_vertices()
+    sources = np.random.default_rng(seed).permutation(num_vertices) \
+        .astype(np.int32)
+    if max_sources is not None:
+        sources = sources[:max_sources]
+    top_k = min(top_k, num_vertices)
+
+    start = time.perf_counter()
+    total = cp.zeros(num_vertices, dtype=np.float64)
+    # Sums of the per-batch estimates and of their squares
+    batch_sum = cp.zeros(num_vertices, dtype=np.float64)
+    batch_sum_sq = cp.zeros(num_vertices, dtype=np.float64)
+    num_batches = 0
+    used = 0
+    ranking = None
+    stable = 0
+
+    while used < len(sources):
+        batch = sources[used:used + batch_size]
+        dependencies = _batch_dependencies(G, batch, endpoints, result_dtype)
+        used += len(batch)
+        num_batches += 1
+        total += dependencies
+        estimate = dependencies / len(batch)
+        batch_sum += estimate
+        batch_sum_sq += estimate * estimate
+
+        mean = total / used
+        new_ranking = cp.asnumpy(cp.argsort(-mean)[:top_k])
+        if ranking is not None and (new_ranking == ranking).all():
+            stable += 1
+        else:
+            stable = 0
+        ranking = new_ranking
+
+        converged = stable >= patience
+        if converged and tolerance is not None:
+            converged = num_batches > 1 and _relative_error(
+                batch_sum, batch_sum_sq, num_batches, ranking) <= tolerance
+
+        if callback is not None and callback(
+                _scores_frame(G, total, used, normalized, endpoints,
+                              result_dtype), used):
+            break
+        if converged:
+            break
+        if time_budget is not None and \
+                time.perf_counter() - start >= time_budget:
+            break
+
+    df = _scores_frame(G, total, used, normalized, endpoints, result_dtype)
+
+    if isNx is True:
+        return df_score_to_dictionary(df, 'betweenness_centrality')
+    else:
+        return df
+
+
+def _relative_error(batch_sum, batch_sum_sq, num_batches, vertices):
+    """
+    Return the largest relative standard error of the mean of the per-batch
+    estimates over vertices.
+    """
+    mean = batch_sum[vertices] / num_batches
+    variance = (batch_sum_sq[vertices] / num_batches - mean * mean) * \
+        num_batches / (num_batches - 1)
+    error = cp.sqrt(cp.maximum(variance, 0) / num_batches)
+    error = cp.where(mean > 0, error / cp.where(mean > 0, mean, 1), 0)
+    return float(error.max())
+
+
+def _rescale_factor(G, number_of_sources, normalized, endpoints=False,
+                    edge=False):
+    """
+    Return the factor the betweenness centrality implementation applies to
+    the dependencies accumulated from number_of_sources sources.
+    """
+    n = G.number_of_vertices()
+    directed = G.is_directed()
+    factor = 1.0
+    if normalized:
+        if edge:
+            if n > 1:
+                factor /= n * (n - 1)
+        elif n > 2:
+            factor /= n * (n - 1) if endpoints else (n - 1) * (n - 2)
+    elif not directed:
+        factor /= 2
+    # Vertex scores are extrapolated from the sources to all the vertices
+    if not edge and (normalized or not directed) and n > 2 and \
+            number_of_sources > 0:
+        factor *= n / number_of_sources
+    return factor
+
+
+def _batch_dependencies(G, sources, endpoints, result_dtype, edge=False):
+    """
+    Return the dependencies accumulated from the internal vertex ids
+    sources, indexed by internal vertex id, or by edge in the order of the
+    CSR if edge is True, as a cupy array.
+    """
+    if edge:
+        df = edge_betweenness_centrality_wrapper.edge_betweenness_centrality(
+            G, False, None, sources, result_dtype)
+        scores = cp.asarray(df['betweenness_centrality'].values,
+                            dtype=np.float64)
+    else:
+        df = betweenness_centrality_wrapper.betweenness_centrality(
+            G, False, endpoints, None, sources, result_dtype)
+        scores = cp.zeros(G.number_of_vertices(), dtype=np.float64)
+        scores[df['vertex'].values] = df['betweenness_centrality'].values
+    return scores / _rescale_factor(G, len(sources), False, endpoints, edge)
+
 
+def _scores_frame(G, dependencies, number_of_sources, normalized, endpoints,
+                  result_dtype):
+    """
+    Return the betweenness centrality DataFrame of the vertex dependencies
+    accumulated from number_of_sources sources.
+    """
+    factor = _rescale_factor(G, number_of_sources, normalized, endpoints)
+    df = cudf.DataFrame()
+    df['vertex'] = cp.arange(G.number_of_vertices(), dtype=np.int32)
+    df['betweenness_centrality'] = \
+        (dependencies * factor).astype(result_dtype)
+    if G.renumbered:
+        df = G.unrenumber(df, "vertex")
+    return df
+
+
+def _edge_output(G, df):
+    """
+    Convert the edge betweenness centrality of the CSR edges of G to the
+    output of edge_betweenness_centrality.
+    """
     if G.renumbered:
         df = G.unrenumber(df, "src")
         df = G.unrenumber(df, "dst")
@@ -274,11 +557,332 @@ def edge_betweenness_centrality(
         # symmeterized graph.
         df = df.groupby(by=["src", "dst"]).sum().reset_index()
 
-    if isNx is True:
-        return df_edge_score_to_dictionary(df, 'betweenness_centrality')
-    else:
+    return df
+
+
+def _edge_scores_frame(G, dependencies, normalized, result_dtype):
+    """
+    Return the edge betweenness centrality DataFrame of the edge
+    dependencies, in the order of the CSR.
+    """
+    offsets, indices, _ = G.view_adj_list()
+    factor = _rescale_factor(G, 0, normalized, edge=True)
+    df = cudf.DataFrame()
+    df['src'] = cp.searchsorted(
+        offsets.values[1:], cp.arange(len(indices)), side='right'
+    ).astype(np.int32)
+    df['dst'] = indices
+    df['betweenness_centrality'] = \
+        (dependencies * factor).astype(result_dtype)
+    return _edge_output(G, df)
+
+
+class BetweennessPartial:
+    """
+    Dependencies accumulated from the first number_of_sources of the
+    sources (internal vertex ids) of a betweenness centrality computation.
+    The dependencies are indexed by vertex, or by edge in the order of the
+    CSR for edge betweenness centrality.
+
+    Partial results are saved and loaded as checkpoint directories, and the
+    complete partial results of disjoint sources are merged, and turned
+    into scores, with finalize_betweenness_centrality.  The number of edges
+    and the directedness of the graph are recorded to reject partial
+    results of another graph.
+    """
+
+    def __init__(self, sources, number_of_sources, dependencies, edge=False,
+                 endpoints=False, number_of_edges=None, directed=None):
+        self.sources = sources
+        self.number_of_sources = number_of_sources
+        self.dependencies = dependencies
+        self.edge = edge
+        self.endpoints = endpoints
+        self.number_of_edges = number_of_edges
+        self.directed = directed
+
+    def matches(self, G):
+        """
+        True if the partial result was computed on a graph of the size and
+        directedness of G.
+        """
+        return len(self.dependencies) == _dependencies_size(G, self.edge) \
+            and self.number_of_edges == G.number_of_edges() \
+            and self.directed == G.is_directed()
+
+    @property
+    def complete(self):
+        """
+        True if all the sources have been traversed.
+        """
+        return self.number_of_sources == len(self.sources)
+
+    def save(self, path):
+        """
+        Save the partial result to the directory path.  The previous partial
+        result saved there stays valid until the new one is complete.
+        """
+        os.makedirs(path, exist_ok=True)
+        suffix = f".{self.number_of_sources}"
+        arrays = {
+            "sources": _write_array(path, "sources" + suffix,
+                                    np.asarray(self.sources)),
+            "dependencies": _write_array(path, "dependencies" + suffix,
+                                         cp.asnumpy(self.dependencies)),
+        }
+        header = {
+            "format": PARTIAL_FORMAT,
+            "version": PARTIAL_VERSION,
+            "edge": self.edge,
+            "endpoints": self.endpoints,
+            "number_of_sources": self.number_of_sources,
+            "number_of_edges": self.number_of_edges,
+            "is_directed": self.directed,
+            "arrays": arrays,
+        }
+        # The header is written last, so an interrupted save leaves the
+        # previous partial result in place
+        header_file = os.path.join(path, HEADER_FILE)
+        with open(header_file + ".tmp", "w") as f:
+            json.dump(header, f, indent=2)
+        os.replace(header_file + ".tmp", header_file)
+
+        # Only remove the arrays of previous partial results, the directory
+        # may hold other files such as a graph snapshot
+        current = {entry["file"] for entry in arrays.values()}
+        for name in os.listdir(path):
+            if name in current or not name.endswith(".bin"):
+                continue
+            prefix, _, number = name[:-len(".bin")].rpartition(".")
+            if prefix in arrays and number.isdigit():
+                os.remove(os.path.join(path, name))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a partial result saved to the directory path.
+        """
+        header_file = os.path.join(path, HEADER_FILE)
+        if not os.path.isfile(header_file):
+            raise FileNotFoundError(f"{path} is not a betweenness "
+                                    "centrality checkpoint")
+        with open(header_file) as f:
+            header = json.load(f)
+        if header.get("format") != PARTIAL_FORMAT:
+            raise ValueError(f"{path} is not a betweenness centrality "
+                             "checkpoint")
+        if header.get("version") != PARTIAL_VERSION:
+            raise ValueError("unsupported betweenness centrality checkpoint "
+                             f"version {header.get('version')}")
+
+        arrays = header["arrays"]
+        return cls(_read_array(path, arrays["sources"], mmap=False),
+                   header["number_of_sources"],
+                   cp.asarray(_read_array(path, arrays["dependencies"],
+                                          mmap=False)),
+                   header["edge"], header["endpoints"],
+                   header["number_of_edges"], header["is_directed"])
+
+    @classmethod
+    def merge(cls, partials):
+        """
+        Merge the complete partial results of disjoint sources.
+        """
+        if len(partials) == 0:
+            raise ValueError("no partial result to merge")
+        first = partials[0]
+        for partial in partials:
+            if not partial.complete:
+                raise ValueError("cannot merge an incomplete partial "
+                                 "result, resume it first")
+            if (partial.edge, partial.endpoints,
+                    len(partial.dependencies), partial.number_of_edges,
+                    partial.directed) != \
+                    (first.edge, first.endpoints, len(first.dependencies),
+                     first.number_of_edges, first.directed):
+                raise ValueError("cannot merge partial results of "
+                                 "different computations")
+        sources = np.concatenate([partial.sources for partial in partials])
+        if len(np.unique(sources)) != len(sources):
+            raise ValueError("the partial results share sources")
+        dependencies = first.dependencies.copy()
+        for partial in partials[1:]:
+            dependencies += partial.dependencies
+        return cls(sources, len(sources), dependencies, first.edge,
+                   first.endpoints, first.number_of_edges, first.directed)
+
+
+def _dependencies_size(G, edge):
+    if edge:
+        return len(G.view_adj_list()[1])
+    return G.number_of_vertices()
+
+
+def _accumulate_dependencies(G, sources, edge, endpoints, batch_size,
+                             checkpoint_path, result_dtype):
+    """
+    Accumulate the dependencies of the internal vertex ids sources batch by
+    batch, resuming from and saving to checkpoint_path if set.  Returns
+    the complete BetweennessPartial.
+    """
+    sources = np.ascontiguousarray(sources, dtype=np.int32)
+    size = _dependencies_size(G, edge)
+    if batch_size is None:
+        batch_size = DEFAULT_CHECKPOINT_BATCH_SIZE \
+            if checkpoint_path is not None else max(len(sources), 1)
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    partial = None
+    if checkpoint_path is not None and \
+            os.path.isfile(os.path.join(checkpoint_path, HEADER_FILE)):
+        partial = BetweennessPartial.load(checkpoint_path)
+        if (partial.edge, partial.endpoints) != (edge, endpoints) or \
+                not partial.matches(G) or \
+                not np.array_equal(partial.sources, sources):
+            raise ValueError(f"the checkpoint in {checkpoint_path} was "
+                             "written for other sources, parameters or "
+                             "graph")
+    if partial is None:
+        partial = BetweennessPartial(sources, 0,
+                                     cp.zeros(size, dtype=np.float64),
+                                     edge, endpoints, G.number_of_edges(),
+                                     G.is_directed())
+
+    while not partial.complete:
+        start = partial.number_of_sources
+        batch = sources[start:start + batch_size]
+        partial.dependencies += _batch_dependencies(G, batch, endpoints,
+                                                    result_dtype, edge)
+        partial.number_of_sources += len(batch)
+        if checkpoint_path is not None:
+            partial.save(checkpoint_path)
+    return partial
+
+
+def betweenness_centrality_partial(
+    G,
+    sources,
+    edge=False,
+    endpoints=False,
+    batch_size=None,
+    checkpoint_path=None,
+    result_dtype=np.float64,
+):
+    """
+    Accumulate the betweenness centrality dependencies of a subset of the
+    sources, to split a computation across processes or dask workers.  The
+    partial results of disjoint sources are combined and normalized by
+    finalize_betweenness_centrality.
+
+    Parameters
+    ----------
+    G : cuGraph.Graph or networkx.Graph
+        The graph can be either directed (DiGraph) or undirected (Graph).
+
+    sources : list or cudf.Series
+        The vertex identifiers of the sources.
+
+    edge : bool, optional, default=False
+        Accumulate edge dependencies, for edge_betweenness_centrality,
+        instead of vertex dependencies.
+
+    endpoints : bool, optional, default=False
+        See betweenness_centrality.  Not supported with edge.
+
+    batch_size, checkpoint_path : optional
+        See betweenness_centrality.
+
+    result_dtype : np.float32 or np.float64, optional, default=np.float64
+        Data type used by the traversals.  The dependencies are accumulated
+        in double precision.
+
+    Returns
+    -------
+    partial : BetweennessPartial
+
+    Examples
+    --------
+    >>> partial = cugraph.betweenness_centrality_partial(
+    >>>     G, sources[rank::n_ranks], checkpoint_path=f"bc/{rank}")
+    >>> # once all the ranks are done
+    >>> bc = cugraph.finalize_betweenness_centrality(
+    >>>     G, [f"bc/{rank}" for rank in range(n_ranks)])
+    """
+    if result_dtype not in [np.float32, np.float64]:
+        raise TypeError("result type can only be np.float32 or np.float64")
+    if edge and endpoints:
+        raise ValueError("endpoints is not supported for edge betweenness "
+                         "centrality")
+
+    G, _ = ensure_cugraph_obj_for_nx(G)
+    if isinstance(sources, cudf.Series):
+        sources = sources.to_arrow().to_pylist()
+    vertices = _initialize_vertices_from_identifiers_list(G, list(sources))
+    return _accumulate_dependencies(G, vertices, edge, endpoints, batch_size,
+                                    checkpoint_path, result_dtype)
+
+
+def finalize_betweenness_centrality(
+    G,
+    partials,
+    normalized=True,
+    result_dtype=np.float64,
+):
+    """
+    Merge the partial results of betweenness_centrality_partial and return
+    the betweenness centrality, or edge betweenness centrality, scores
+    normalized for the total number of sources.
+
+    Parameters
+    ----------
+    G : cuGraph.Graph or networkx.Graph
+        The graph of the partial results.
+
+    partials : list of BetweennessPartial or checkpoint directories
+        Complete partial results of disjoint sources.
+
+    normalized : bool, optional, default=True
+        See betweenness_centrality and edge_betweenness_centrality.
+
+    result_dtype : np.float32 or np.float64, optional, default=np.float64
+        Indicate the data type of the betweenness centrality scores
+
+    Returns
+    -------
+    df : cudf.DataFrame or Dictionary if using NetworkX
+        The output of betweenness_centrality, or of
+        edge_betweenness_centrality for edge partial results, computed with
+        the sources of all the partial results.
+    """
+    if result_dtype not in [np.float32, np.float64]:
+        raise TypeError("result type can only be np.float32 or np.float64")
+
+    G, isNx = ensure_cugraph_obj_for_nx(G)
+    if isinstance(partials, (str, os.PathLike, BetweennessPartial)):
+        partials = [partials]
+    partials = [
+        partial if isinstance(partial, BetweennessPartial)
+        else BetweennessPartial.load(partial)
+        for partial in partials
+    ]
+    partial = BetweennessPartial.merge(partials)
+    if not partial.matches(G):
+        raise ValueError("the partial results do not match the graph")
+
+    if partial.edge:
+        df = _edge_scores_frame(G, partial.dependencies, normalized,
+                                result_dtype)
+        if isNx is True:
+            return df_edge_score_to_dictionary(df, 'betweenness_centrality')
         return df
 
+    df = _scores_frame(G, partial.dependencies, partial.number_of_sources,
+                       normalized, partial.endpoints, result_dtype)
+    if isNx is True:
+        return df_score_to_dictionary(df, 'betweenness_centrality')
+    return df
+
 
 # In order to compare with pre-set sources,
 # k can either be a list or an integer or None
@@ -14,7 +14,9 @@
 from .link_analysis.pagerank import pagerank
 from .traversal.bfs import bfs
 from .traversal.sssp import sssp
-from .common.read_utils import get_chunksize
+from .common.read_utils import (get_chunksize,
+                                get_byte_ranges,
+                                read_csv_byte_ranges)
 from .community.louvain import louvain
 from .centrality.katz_centrality import katz_centrality
 from .components.connectivity import weakly_connected_components
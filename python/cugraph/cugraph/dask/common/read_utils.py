@@ -23,6 +23,8 @@ def get_chunksize(input_path):
     """
     Calculate the appropriate chunksize for dask_cudf.read_csv
     to get a number of partitions equal to the number of GPUs.
+    With several files of uneven sizes the partitions are skewed, use
+    get_byte_ranges and read_csv_byte_ranges to balance them.
 
     Examples
     --------
@@ -42,3 +44,149 @@ def get_chunksize(input_path):
         size = [os.path.getsize(_file) for _file in input_files]
         chunksize = max(size)
     return chunksize
+
+
+def _next_line_start(f, position, size, block_size=1 << 16):
+    """
+    Return the position of the first line that starts at or after position
+    in the open binary file f of the given size.
+    """
+    if position <= 0:
+        return 0
+    if position >= size:
+        return size
+    # position starts a line if the previous byte ends one
+    f.seek(position - 1)
+    while True:
+        block = f.read(block_size)
+        if not block:
+            return size
+        newline = block.find(b"\n")
+        if newline >= 0:
+            return min(f.tell() - len(block) + newline + 1, size)
+
+
+def get_byte_ranges(input_path, n_partitions=None):
+    """
+    Plan the partitions of a set of text files (CSV) so that every partition
+    holds about the same number of bytes.  Large files are split and small
+    files are grouped, and every split falls on a line boundary.
+
+    Parameters
+    ----------
+    input_path : str
+        Path or glob pattern of the input files.
+
+    n_partitions : int, optional
+        Number of partitions.  Defaults to the number of dask workers.
+
+    Returns
+    -------
+    partitions : list of lists of (path, offset, length) tuples
+        For each partition, the byte ranges it reads.  Every byte range
+        starts at the beginning of a line and ends after a newline or at the
+        end of its file.  If the files are empty, a single partition with no
+        byte ranges is returned.
+
+    Examples
+    --------
+    >>> import cugraph.dask as dcg
+    >>> partitions = dcg.get_byte_ranges('edge_list_*.csv')
+    >>> ddf = dcg.read_csv_byte_ranges(partitions, delimiter=' ',
+    >>>                                names=['src', 'dst', 'value'],
+    >>>                                dtype=['int32', 'int32', 'float32'])
+    """
+
+    import os
+    from glob import glob
+    import math
+
+    input_files = sorted(glob(str(input_path)))
+    if not input_files:
+        raise FileNotFoundError(f"no files match {input_path}")
+    if n_partitions is None:
+        n_partitions = get_n_workers()
+    sizes = [os.path.getsize(_file) for _file in input_files]
+    target = max(math.ceil(sum(sizes) / n_partitions), 1)
+
+    partitions = []
+    current = []
+    current_size = 0
+    for _file, size in zip(input_files, sizes):
+        with open(_file, "rb") as f:
+            start = 0
+            while start < size:
+                if len(partitions) == n_partitions - 1:
+                    # The last partition takes whatever is left
+                    end = size
+                else:
+                    # Extend the range to the first line boundary at or
+                    # after the point where the current partition is full
+                    end = _next_line_start(
+                        f, start + target - current_size, size)
+                current.append((_file, start, end - start))
+                current_size += end - start
+                start = end
+                if current_size >= target and \
+                        len(partitions) < n_partitions - 1:
+                    partitions.append(current)
+                    current = []
+                    current_size = 0
+    if current or not partitions:
+        partitions.append(current)
+    return partitions
+
+
+def _empty_frame(names, dtype):
+    """
+    Return an empty cudf.DataFrame with the columns names, of the types
+    given by dtype as for cudf.read_csv.
+    """
+    import cudf
+
+    if names is None:
+        return cudf.DataFrame()
+    if isinstance(dtype, dict):
+        dtypes = [dtype.get(name, "str") for name in names]
+    elif isinstance(dtype, (list, tuple)):
+        dtypes = list(dtype)
+    else:
+        dtypes = [dtype or "str"] * len(names)
+    return cudf.DataFrame({name: cudf.Series([], dtype=column_dtype)
+                           for name, column_dtype in zip(names, dtypes)})
+
+
+def read_csv_byte_ranges(partitions, **kwargs):
+    """
+    Read the partitions planned by get_byte_ranges into a
+    dask_cudf.DataFrame with one partition per planned partition.
+
+    Parameters
+    ----------
+    partitions : list of lists of (path, offset, length) tuples
+        The partitions returned by get_byte_ranges.
+
+    **kwargs
+        Arguments passed to cudf.read_csv, such as delimiter, names and dtype.
+        The files must not have a header line.
+
+    Returns
+    -------
+    ddf : dask_cudf.DataFrame
+    """
+
+    import cudf
+    import dask_cudf
+    from dask import delayed
+
+    def read_partition(byte_ranges):
+        if not byte_ranges:
+            return _empty_frame(kwargs.get("names"), kwargs.get("dtype"))
+        return cudf.concat([
+            cudf.read_csv(path, byte_range=(offset, length), **kwargs)
+            for path, offset, length in byte_ranges
+        ], ignore_index=True)
+
+    return dask_cudf.from_delayed(
+        [delayed(read_partition)(byte_ranges)
+         for byte_ranges in partitions or [[]]])
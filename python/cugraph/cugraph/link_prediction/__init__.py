@@ -21,3 +21,6 @@ from cugraph.link_prediction.jaccard import jaccard_coefficient
 from cugraph.link_prediction.sorensen import sorensen_coefficient
 from cugraph.link_prediction.sorensen import sorensen
 from cugraph.link_prediction.overlap import overlap_coefficient
+from cugraph.link_prediction.similarity import vertex_similarity
+from cugraph.link_prediction.similarity import jaccard_topk
+from cugraph.link_prediction.minhash import MinHashIndex
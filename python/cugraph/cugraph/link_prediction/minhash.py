@@ -0,0 +1,445 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Approximate Jaccard similarity with b-bit MinHash signatures.
+#
+# The signature of a vertex holds, for each of num_hashes hash functions, the
+# lowest bits of the minimum hash of its neighbors.  Two signatures agree on a
+# hash function with probability J + (1 - J) / 2**bits, J being the Jaccard
+# similarity of the neighborhoods, so J is estimated from the fraction of
+# agreeing entries in time independent of the degrees.  Candidates are found
+# by locality sensitive hashing: the signature is cut into bands and the
+# vertices whose band agrees with the band of the query vertex share a
+# bucket.  Neighbors are hashed by external vertex id, so signatures computed
+# from different versions of a graph are comparable.
+
+import numpy as np
+
+import cudf
+from cugraph.structure.graph_classes import Graph
+from cugraph.traversal.host_graph import frontier_edges
+
+
+_EMPTY = np.iinfo(np.uint64).max
+
+
+def _mix(x):
+    """
+    splitmix64 finalizer of x, as uint64.
+    """
+    z = x.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _signature_dtype(bits):
+    if bits <= 8:
+        return np.uint8
+    if bits <= 16:
+        return np.uint16
+    return np.uint32
+
+
+def _graph_arrays(G):
+    """
+    Return the host CSR offsets and indices of G and the external vertex id
+    of each internal vertex id.
+    """
+    offsets, indices, _ = G.view_host_adj_list()
+    num_vertices = len(offsets) - 1
+    if G.renumbered:
+        df = cudf.DataFrame()
+        df["id"] = np.arange(num_vertices, dtype=np.int32)
+        df = G.unrenumber(df, "id")
+        if len(df.columns) != 1:
+            raise ValueError("MinHashIndex does not support vertex ids "
+                             "made of multiple columns")
+        external = df[df.columns[0]].values_host
+    else:
+        external = np.arange(num_vertices)
+    if not np.issubdtype(external.dtype, np.integer):
+        raise TypeError("MinHashIndex only supports integer vertex ids")
+    return offsets, indices, external.astype(np.int64)
+
+
+def _as_ids(vertices):
+    """
+    Return the vertex ids of a cudf.Series, list or array as a host int64
+    array.
+    """
+    if isinstance(vertices, cudf.Series):
+        vertices = vertices.values_host
+    return np.asarray(vertices).astype(np.int64).ravel()
+
+
+class MinHashIndex:
+    """
+    Approximate Jaccard similarity index of the neighborhoods of the
+    vertices of a graph, built from b-bit MinHash signatures.
+
+    The signatures are stored in a (V, num_hashes) numpy array of the
+    smallest unsigned integer type holding bits bits, so estimating the
+    similarity of a pair or looking up the candidates of a vertex does not
+    depend on the degrees.  Candidates are found with locality sensitive
+    hashing over bands of num_hashes / bands hash functions: vertices with
+    more similar neighborhoods are more likely to share the bucket of at
+    least one band.
+
+    Parameters
+    ----------
+    G : cugraph.Graph
+        cuGraph Graph instance with integer vertex ids.  The graph should be
+        undirected where an undirected edge is represented by a directed
+        edge in both direction.
+    num_hashes : int, optional (default=128)
+        Number of hash functions of a signature.  The standard deviation of
+        the estimates decreases as 1 / sqrt(num_hashes).
+    bits : int, optional (default=8)
+        Number of bits kept from each minimum hash, between 1 and 32.
+    bands : int, optional (default=32)
+        Number of LSH bands, which must divide num_hashes.  More bands find
+        candidates of lower similarity.
+    seed : int, optional (default=0)
+        Seed of the hash functions.  Indexes compared together must use the
+        same num_hashes, bits and seed.
+    batch_size : int, optional (default=2**24)
+        Maximum number of hashes computed at once when signing vertices.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> index = cugraph.MinHashIndex(G)
+    >>> candidates = index.query([0, 33], k=5)
+    """
+
+    def __init__(self, G, num_hashes=128, bits=8, bands=32, seed=0,
+                 batch_size=2**24):
+        if type(G) is not Graph:
+            raise TypeError("input graph must a Graph")
+        if num_hashes <= 0:
+            raise ValueError("num_hashes must be positive")
+        if not 1 <= bits <= 32:
+            raise ValueError("bits must be between 1 and 32")
+        if bands <= 0 or num_hashes % bands != 0:
+            raise ValueError("bands must be a positive divisor of "
+                             "num_hashes")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.num_hashes = num_hashes
+        self.bits = bits
+        self.bands = bands
+        self.seed = seed
+        self.batch_size = batch_size
+        self.salts = _mix(np.arange(num_hashes, dtype=np.uint64) +
+                          np.uint64(seed) * np.uint64(num_hashes))
+
+        offsets, indices, external = _graph_arrays(G)
+        order = np.argsort(external)
+        self.vertices = external[order]
+        self.signatures, self.empty = self._sign(offsets, indices, external,
+                                                 order)
+        self._build_buckets()
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def _sign(self, offsets, indices, external, rows):
+        """
+        Return the b-bit signatures of the internal vertices rows, of CSR
+        (offsets, indices), and the mask of the vertices without neighbors.
+        """
+        mask = np.uint64((1 << self.bits) - 1)
+        signatures = np.zeros((len(rows), self.num_hashes),
+                              dtype=_signature_dtype(self.bits))
+        degree = offsets[rows + 1] - offsets[rows]
+        chunk_edges = max(1, self.batch_size // self.num_hashes)
+
+        ends = np.cumsum(degree)
+        start = 0
+        while start < len(rows):
+            done = ends[start - 1] if start > 0 else 0
+            end = int(np.searchsorted(ends, done + chunk_edges,
+                                      side="right"))
+            end = max(end, start + 1)
+
+            chunk = np.arange(start, end)
+            chunk = chunk[degree[chunk] > 0]
+            if len(chunk) > 0:
+                _, positions = frontier_edges(offsets, rows[chunk])
+                neighbors = external[indices[positions]].view(np.uint64)
+                hashes = _mix(neighbors[:, None] ^ self.salts[None, :])
+                firsts = np.cumsum(degree[chunk]) - degree[chunk]
+                minima = np.minimum.reduceat(hashes, firsts, axis=0)
+                signatures[chunk] = minima & mask
+            start = end
+
+        return signatures, degree == 0
+
+    def _band_keys(self, signatures):
+        """
+        Return the (len(signatures), bands) hash of each band.
+        """
+        rows = self.num_hashes // self.bands
+        bands = signatures.reshape(len(signatures), self.bands, rows)
+        keys = np.broadcast_to(_mix(np.arange(self.bands)),
+                               (len(signatures), self.bands))
+        for i in range(rows):
+            keys = _mix(keys ^ bands[:, :, i].astype(np.uint64))
+        return keys
+
+    def _build_buckets(self):
+        """
+        Sort the vertices by band key, for each band.  bucket_order[band]
+        holds the positions of the vertices sorted by their key in band, and
+        bucket_keys[band] the sorted keys.
+        """
+        self.band_keys = self._band_keys(self.signatures)
+        self.band_keys[self.empty] = _EMPTY
+        self.bucket_order = np.argsort(self.band_keys.T, axis=1,
+                                       kind="stable")
+        self.bucket_keys = np.take_along_axis(self.band_keys.T,
+                                              self.bucket_order, axis=1)
+
+    def _update_buckets(self, positions):
+        """
+        Recompute the band keys of the vertices at positions, then move
+        them to their new buckets: they are deleted from the sorted keys of
+        each band and inserted back at their new keys, which costs
+        O(V * bands) instead of the O(V * bands * log V) of a rebuild.
+        Vertices missing from the buckets are inserted.
+        """
+        keys = self._band_keys(self.signatures[positions])
+        keys[self.empty[positions]] = _EMPTY
+        self.band_keys[positions] = keys
+
+        changed = np.zeros(len(self.vertices), dtype=bool)
+        changed[positions] = True
+        bucket_order = []
+        bucket_keys = []
+        for band in range(self.bands):
+            order = self.bucket_order[band]
+            keep = ~changed[order]
+            order = order[keep]
+            sorted_keys = self.bucket_keys[band][keep]
+            inserted = np.argsort(keys[:, band], kind="stable")
+            at = np.searchsorted(sorted_keys, keys[inserted, band],
+                                 side="right")
+            bucket_order.append(np.insert(order, at, positions[inserted]))
+            bucket_keys.append(np.insert(sorted_keys, at,
+                                         keys[inserted, band]))
+        self.bucket_order = np.stack(bucket_order)
+        self.bucket_keys = np.stack(bucket_keys)
+
+    def _positions(self, vertices):
+        """
+        Return the positions of the external vertex ids in the index.
+        """
+        vertices = _as_ids(vertices)
+        positions = np.searchsorted(self.vertices, vertices)
+        positions = np.minimum(positions, max(len(self.vertices) - 1, 0))
+        if len(self.vertices) == 0 or \
+                not (self.vertices[positions] == vertices).all():
+            raise ValueError("vertices contains ids that are not in the "
+                             "index")
+        return positions
+
+    def _estimate(self, first, second):
+        """
+        Estimate the Jaccard similarity of the vertices at positions first
+        and second.
+        """
+        agree = (self.signatures[first] == self.signatures[second]) \
+            .mean(axis=1)
+        # b-bit MinHash: P(agree) = J + (1 - J) * 2**-bits
+        collision = 2.0 ** -self.bits
+        estimate = np.clip((agree - collision) / (1 - collision), 0, 1)
+        estimate[self.empty[first] | self.empty[second]] = 0
+        return estimate.astype(np.float32)
+
+    def estimate(self, vertex_pair):
+        """
+        Estimate the Jaccard similarity of pairs of vertices.
+
+        Parameters
+        ----------
+        vertex_pair : cudf.DataFrame
+            A GPU dataframe consisting of two columns representing pairs of
+            vertices.
+
+        Returns
+        -------
+        df  : cudf.DataFrame
+            df['source'] : cudf.Series
+                The first vertex of each pair
+            df['destination'] : cudf.Series
+                The second vertex of each pair
+            df['jaccard_coeff'] : cudf.Series
+                The estimated Jaccard similarity of the pair
+        """
+        if type(vertex_pair) != cudf.DataFrame:
+            raise ValueError("vertex_pair must be a cudf dataframe")
+        cols = vertex_pair.columns.to_list()
+        first = vertex_pair[cols[0]].values_host
+        second = vertex_pair[cols[1]].values_host
+
+        df = cudf.DataFrame()
+        df["source"] = first
+        df["destination"] = second
+        df["jaccard_coeff"] = self._estimate(self._positions(first),
+                                             self._positions(second))
+        return df
+
+    def query(self, vertices, k=10, max_bucket_size=None):
+        """
+        Return, for each vertex of vertices, the k vertices sharing a bucket
+        with it that have the highest estimated Jaccard similarity.
+
+        Parameters
+        ----------
+        vertices : cudf.Series or list
+            The query vertices.
+        k : int, optional (default=10)
+            Number of candidates kept for each vertex.
+        max_bucket_size : int, optional
+            Maximum number of vertices read from each bucket, which bounds
+            the cost of a query when many vertices share a band.  Default is
+            None, the buckets are read entirely.
+
+        Returns
+        -------
+        df  : cudf.DataFrame
+            At most k rows per query vertex, grouped by source in the order
+            of vertices, by decreasing similarity.
+
+            df['source'] : cudf.Series
+                The query vertex
+            df['destination'] : cudf.Series
+                A candidate
+            df['jaccard_coeff'] : cudf.Series
+                The estimated Jaccard similarity of the pair
+        """
+        if int(k) != k or k <= 0:
+            raise ValueError("k must be a positive integer")
+        queries = self._positions(vertices)
+
+        owners = []
+        candidates = []
+        for band in range(self.bands):
+            keys = self.band_keys[queries, band]
+            lo = np.searchsorted(self.bucket_keys[band], keys,
+                                 side="left")
+            hi = np.searchsorted(self.bucket_keys[band], keys,
+                                 side="right")
+            hi[keys == _EMPTY] = lo[keys == _EMPTY]
+            if max_bucket_size is not None:
+                hi = np.minimum(hi, lo + max_bucket_size)
+            counts = hi - lo
+            band_owners = np.repeat(np.arange(len(queries)), counts)
+            firsts = np.cumsum(counts) - counts
+            positions = np.arange(counts.sum()) + \
+                np.repeat(lo - firsts, counts)
+            owners.append(band_owners)
+            candidates.append(self.bucket_order[band, positions])
+        owners = np.concatenate(owners)
+        candidates = np.concatenate(candidates)
+
+        # Drop the query vertices themselves and the candidates found in
+        # several bands
+        keep = candidates != queries[owners]
+        pairs = np.unique(owners[keep] * len(self.vertices) +
+                          candidates[keep])
+        owners = pairs // len(self.vertices)
+        candidates = pairs % len(self.vertices)
+
+        scores = self._estimate(queries[owners], candidates)
+        order = np.lexsort((self.vertices[candidates], -scores, owners))
+        owners = owners[order]
+        ranks = np.arange(len(owners)) - np.searchsorted(owners, owners)
+        order = order[ranks < int(k)]
+
+        df = cudf.DataFrame()
+        df["source"] = self.vertices[queries[owners[ranks < int(k)]]]
+        df["destination"] = self.vertices[candidates[order]]
+        df["jaccard_coeff"] = scores[order]
+        return df
+
+    def update(self, G, vertices=None):
+        """
+        Re-sign the vertices whose neighborhoods changed, from their
+        neighbors in G, and move them to their new LSH buckets.  Only the
+        signatures and band keys of these vertices are recomputed.
+        Vertices that are not in the index yet are added, vertices that are
+        no longer in G are given an empty neighborhood.
+
+        Adding or removing the undirected edge (u, v) changes the
+        neighborhoods of both u and v, so both must be passed.
+
+        Parameters
+        ----------
+        G : cugraph.Graph
+            The graph after the changes.
+        vertices : cudf.Series or list, optional
+            The vertices whose neighborhoods changed.  Default is None, all
+            the vertices of G are re-signed.
+        """
+        if type(G) is not Graph:
+            raise TypeError("input graph must a Graph")
+        offsets, indices, external = _graph_arrays(G)
+        if vertices is None:
+            vertices = external
+        vertices = np.unique(_as_ids(vertices))
+
+        new = ~np.isin(vertices, self.vertices)
+        if new.any():
+            self.vertices = np.concatenate([self.vertices, vertices[new]])
+            self.signatures = np.concatenate([
+                self.signatures,
+                np.zeros((new.sum(), self.num_hashes),
+                         dtype=self.signatures.dtype)])
+            self.empty = np.concatenate([self.empty,
+                                         np.ones(new.sum(), dtype=bool)])
+            self.band_keys = np.concatenate([
+                self.band_keys,
+                np.full((new.sum(), self.bands), _EMPTY, dtype=np.uint64)])
+            order = np.argsort(self.vertices, kind="stable")
+            self.vertices = self.vertices[order]
+            self.signatures = self.signatures[order]
+            self.empty = self.empty[order]
+            self.band_keys = self.band_keys[order]
+            # The buckets hold positions, which moved.  The new vertices are
+            # inserted in the buckets with the other re-signed vertices.
+            moved = np.empty_like(order)
+            moved[order] = np.arange(len(order))
+            self.bucket_order = moved[self.bucket_order]
+
+        # Internal ids of the vertices that are still in G
+        by_external = np.argsort(external)
+        sorted_external = external[by_external]
+        found = np.searchsorted(sorted_external, vertices)
+        in_graph = found < len(external)
+        in_graph[in_graph] = sorted_external[found[in_graph]] == \
+            vertices[in_graph]
+        rows = by_external[found[in_graph]]
+
+        positions = self._positions(vertices)
+        self.signatures[positions[~in_graph]] = 0
+        self.empty[positions[~in_graph]] = True
+        signatures, empty = self._sign(offsets, indices, external, rows)
+        self.signatures[positions[in_graph]] = signatures
+        self.empty[positions[in_graph]] = empty
+        self._update_buckets(positions)
@@ -0,0 +1,400 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Neighborhood similarity metrics computed from a single intersection walk.
+#
+# For each pair, the neighbors of the endpoint of smaller degree are looked
+# up in the sorted (row, column) keys of the CSR of the other endpoint.  The
+# common neighbors found give the intersection size, and their degrees the
+# Adamic-Adar and resource allocation indices, so every metric is derived
+# from the same walk.
+
+import numpy as np
+
+import cudf
+from cugraph.structure.graph_classes import Graph
+from cugraph.utilities import (renumber_vertex_pair,
+                               cupy_package as cp,
+                               )
+
+
+# Metric name -> output column
+METRICS = {
+    "jaccard": "jaccard_coeff",
+    "overlap": "overlap_coeff",
+    "sorensen": "sorensen_coeff",
+    "adamic_adar": "adamic_adar_index",
+    "resource_allocation": "resource_allocation_index",
+}
+
+
+def _expand(offsets, rows):
+    """
+    Return, for every neighbor of the vertices rows, the position of its
+    vertex in rows and its position in the CSR.
+    """
+    starts = offsets[rows]
+    counts = offsets[rows + 1] - starts
+    ends = cp.cumsum(counts)
+    total = int(ends[-1]) if len(ends) else 0
+    entries = cp.arange(total, dtype=np.int64)
+    owners = cp.searchsorted(ends, entries, side="right")
+    return owners, entries - (ends - counts)[owners] + starts[owners]
+
+
+def _csr_keys(offsets, indices):
+    """
+    Return the sorted row * V + column keys of the CSR edges.
+    """
+    num_vertices = len(offsets) - 1
+    rows = cp.searchsorted(offsets[1:], cp.arange(len(indices)),
+                           side="right")
+    keys = rows.astype(np.int64) * num_vertices + indices
+    if len(keys) > 1 and not bool((keys[1:] >= keys[:-1]).all()):
+        keys = cp.sort(keys)
+    return keys
+
+
+def _common_neighbors(offsets, indices, first, second, keys=None):
+    """
+    Return the common neighbors of the pairs (first, second) of internal
+    vertex ids as (pair position, neighbor) arrays, walking the neighbors
+    of the endpoint of smaller degree of each pair.
+    """
+    if keys is None:
+        keys = _csr_keys(offsets, indices)
+    num_vertices = len(offsets) - 1
+    degree = offsets[1:] - offsets[:-1]
+    swap = degree[first] > degree[second]
+    small = cp.where(swap, second, first)
+    large = cp.where(swap, first, second)
+
+    owners, positions = _expand(offsets, small)
+    neighbors = indices[positions]
+    if len(keys) == 0:
+        return owners[:0], neighbors[:0]
+    query = large[owners].astype(np.int64) * num_vertices + neighbors
+    found = cp.minimum(cp.searchsorted(keys, query), len(keys) - 1)
+    common = keys[found] == query
+    return owners[common], neighbors[common]
+
+
+def vertex_similarity(input_graph, vertex_pair=None,
+                      metrics=("jaccard", "overlap", "sorensen")):
+    """
+    Compute several neighborhood similarity metrics between each pair of
+    vertices connected by an edge, or between arbitrary pairs of vertices
+    specified by the user, from a single computation of the common
+    neighbors of each pair.
+
+    With N(u) the neighbors of u and d(w) the degree of w, the metrics are:
+
+    - 'jaccard': |N(u) & N(v)| / |N(u) | N(v)|
+    - 'overlap': |N(u) & N(v)| / min(|N(u)|, |N(v)|)
+    - 'sorensen': 2 |N(u) & N(v)| / (|N(u)| + |N(v)|)
+    - 'adamic_adar': sum of 1 / log(d(w)) over the common neighbors w
+    - 'resource_allocation': sum of 1 / d(w) over the common neighbors w
+
+    The coefficients are 0 when their denominator is 0, and common
+    neighbors of degree 1 do not contribute to the Adamic-Adar index.
+
+    Parameters
+    ----------
+    input_graph : cugraph.Graph
+        cuGraph Graph instance, should contain the connectivity information
+        as an edge list (edge weights are not used for this algorithm). The
+        graph should be undirected where an undirected edge is represented by a
+        directed edge in both direction. The adjacency list will be computed if
+        not already present.
+    vertex_pair : cudf.DataFrame
+        A GPU dataframe consisting of two columns representing pairs of
+        vertices. If provided, the metrics are computed for the given vertex
+        pairs, else for all adjacent vertices in the graph.
+    metrics : list of str, optional
+        The metrics to compute, among 'jaccard', 'overlap', 'sorensen',
+        'adamic_adar' and 'resource_allocation'.  Default is jaccard,
+        overlap and sorensen.
+
+    Returns
+    -------
+    df  : cudf.DataFrame
+        GPU data frame of size E (the default) or the size of the given pairs
+        (first, second) containing one column per metric.
+
+        df['source'] : cudf.Series
+            The source vertex ID (will be identical to first if specified)
+        df['destination'] : cudf.Series
+            The destination vertex ID (will be identical to second if
+            specified)
+        df['jaccard_coeff'], df['overlap_coeff'], df['sorensen_coeff'] :
+        cudf.Series
+            The requested coefficients, named like in jaccard, overlap and
+            sorensen
+        df['adamic_adar_index'], df['resource_allocation_index'] :
+        cudf.Series
+            The requested indices
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> df = cugraph.vertex_similarity(G, metrics=['jaccard', 'adamic_adar'])
+    """
+    if type(input_graph) is not Graph:
+        raise TypeError("input graph must a Graph")
+    if isinstance(metrics, str):
+        metrics = [metrics]
+    for metric in metrics:
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric {metric}, must be one of "
+                             f"{list(METRICS)}")
+
+    offsets, indices, _ = input_graph.view_adj_list()
+    offsets = offsets.values
+    indices = indices.values
+
+    if type(vertex_pair) == cudf.DataFrame:
+        vertex_pair = renumber_vertex_pair(input_graph, vertex_pair)
+        cols = vertex_pair.columns.to_list()
+        first = vertex_pair[cols[0]].values.astype(np.int32)
+        second = vertex_pair[cols[1]].values.astype(np.int32)
+    elif vertex_pair is not None:
+        raise ValueError("vertex_pair must be a cudf dataframe")
+    else:
+        first = cp.searchsorted(offsets[1:], cp.arange(len(indices)),
+                                side="right").astype(np.int32)
+        second = indices.astype(np.int32)
+
+    num_pairs = len(first)
+    degree = (offsets[1:] - offsets[:-1]).astype(np.float64)
+    owners, neighbors = _common_neighbors(offsets, indices, first, second)
+    intersection = cp.bincount(owners, minlength=num_pairs) \
+        .astype(np.float64)
+    first_degree = degree[first]
+    second_degree = degree[second]
+
+    def ratio(numerator, denominator):
+        positive = denominator > 0
+        return cp.where(positive,
+                        numerator / cp.where(positive, denominator, 1), 0)
+
+    df = cudf.DataFrame()
+    df["source"] = first
+    df["destination"] = second
+    for metric in metrics:
+        if metric == "jaccard":
+            values = ratio(intersection,
+                           first_degree + second_degree - intersection)
+        elif metric == "overlap":
+            values = ratio(intersection,
+                           cp.minimum(first_degree, second_degree))
+        elif metric == "sorensen":
+            values = ratio(2 * intersection, first_degree + second_degree)
+        elif metric == "adamic_adar":
+            log_degree = cp.log(degree[neighbors])
+            values = cp.bincount(owners, weights=ratio(1, log_degree),
+                                 minlength=num_pairs)
+        else:
+            values = cp.bincount(owners, weights=1 / degree[neighbors],
+                                 minlength=num_pairs)
+        df[METRICS[metric]] = values.astype(np.float32)
+
+    if input_graph.renumbered:
+        df = input_graph.unrenumber(df, "source")
+        df = input_graph.unrenumber(df, "destination")
+
+    return df
+
+
+def _source_batches(paths, batch_size):
+    """
+    Split the sources, given their number of two-hop paths, into
+    consecutive batches of at most batch_size paths, or of a single source
+    when it exceeds batch_size on its own.  Yield the (start, end) of each
+    batch.
+    """
+    ends = np.cumsum(paths)
+    start = 0
+    while start < len(paths):
+        done = ends[start - 1] if start > 0 else 0
+        end = int(np.searchsorted(ends, done + batch_size, side="right"))
+        end = max(end, start + 1)
+        yield start, end
+        start = end
+
+
+def jaccard_topk(input_graph, k, vertices=None, max_degree=None,
+                 batch_size=2**24):
+    """
+    Compute, for each vertex, the k vertices two hops away with the highest
+    Jaccard similarity.
+
+    Unlike calling jaccard with the pairs of get_two_hop_neighbors, the
+    two-hop pairs are never all held at once: the sources are processed in
+    batches of at most batch_size two-hop paths, and only the k best
+    candidates of each source are kept from each batch.  Candidates are
+    scored with the exact Jaccard coefficient, and ties are broken by
+    increasing vertex id.
+
+    Parameters
+    ----------
+    input_graph : cugraph.Graph
+        cuGraph Graph instance, should contain the connectivity information
+        as an edge list (edge weights are not used for this algorithm). The
+        graph should be undirected where an undirected edge is represented by a
+        directed edge in both direction. The adjacency list will be computed if
+        not already present.
+    k : int
+        Number of candidates kept for each vertex.
+    vertices : cudf.Series or list, optional
+        The vertices to find candidates for.  Default is all the vertices.
+    max_degree : int, optional
+        Intermediate vertices of degree larger than max_degree are not used
+        to reach candidates, which caps the contribution of hub vertices to
+        at most max_degree candidates per neighbor.  Pairs whose only common
+        neighbors are such hubs are then not candidates, but the score of
+        the candidates still counts every common neighbor.  Default is None,
+        every vertex is used.
+    batch_size : int, optional
+        Maximum number of two-hop paths expanded at once, which bounds the
+        device memory used by a batch.  A source with more paths than
+        batch_size is processed alone.  Default is 2**24.
+
+    Returns
+    -------
+    df  : cudf.DataFrame
+        GPU data frame of at most k rows per vertex, grouped by source in
+        the order of vertices, by decreasing coefficient.
+
+        df['source'] : cudf.Series
+            The source vertex ID
+        df['destination'] : cudf.Series
+            A candidate two hops away from source
+        df['jaccard_coeff'] : cudf.Series
+            The Jaccard coefficient of the pair
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> df = cugraph.jaccard_topk(G, 5)
+    """
+    if type(input_graph) is not Graph:
+        raise TypeError("input graph must a Graph")
+    if int(k) != k or k <= 0:
+        raise ValueError("k must be a positive integer")
+    if max_degree is not None and max_degree < 0:
+        raise ValueError("max_degree must be non-negative")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    k = int(k)
+
+    offsets, indices, _ = input_graph.view_adj_list()
+    offsets = offsets.values.astype(np.int64)
+    indices = indices.values
+    num_vertices = len(offsets) - 1
+    degree = offsets[1:] - offsets[:-1]
+
+    if vertices is None:
+        sources = cp.arange(num_vertices, dtype=np.int32)
+    else:
+        if not isinstance(vertices, cudf.Series):
+            vertices = cudf.Series(vertices)
+        if input_graph.renumbered:
+            vertices = input_graph.lookup_internal_vertex_id(vertices)
+        if vertices.null_count != 0:
+            raise ValueError("vertices contains ids that are not vertices "
+                             "of the graph")
+        sources = vertices.values.astype(np.int32)
+
+    # Intermediate vertices used to reach candidates and, for every source,
+    # the number of two-hop paths going through them
+    if max_degree is None:
+        hop = cp.ones(num_vertices, dtype=bool)
+    else:
+        hop = degree <= max_degree
+    hop_paths = cp.where(hop, degree, 0)[indices]
+    path_ends = cp.zeros(len(indices) + 1, dtype=np.int64)
+    cp.cumsum(hop_paths, out=path_ends[1:])
+    paths = cp.asnumpy(path_ends[offsets[sources + 1]] -
+                       path_ends[offsets[sources]])
+
+    keys = None if max_degree is None else _csr_keys(offsets, indices)
+    batches = []
+    for start, end in _source_batches(paths, batch_size):
+        batch = sources[start:end]
+
+        # Two-hop paths batch -> middle -> candidate
+        owners, positions = _expand(offsets, batch)
+        middle = indices[positions]
+        through_hop = hop[middle]
+        owners, middle = owners[through_hop], middle[through_hop]
+        middle_owners, positions = _expand(offsets, middle)
+        owners = owners[middle_owners]
+        candidates = indices[positions]
+        del middle, middle_owners, positions
+
+        not_self = candidates != batch[owners]
+        pair_keys = owners[not_self] * num_vertices + candidates[not_self]
+        del owners, candidates, not_self
+        pair_keys, counts = cp.unique(pair_keys, return_counts=True)
+        owners = pair_keys // num_vertices
+        candidates = (pair_keys % num_vertices).astype(np.int32)
+        del pair_keys
+
+        if max_degree is None:
+            # Every common neighbor is the middle of exactly one path
+            intersection = counts.astype(np.float64)
+        else:
+            common_owners, _ = _common_neighbors(offsets, indices,
+                                                 batch[owners], candidates,
+                                                 keys)
+            intersection = cp.bincount(common_owners,
+                                       minlength=len(owners)) \
+                .astype(np.float64)
+        union = (degree[batch[owners]] + degree[candidates] -
+                 intersection)
+        scores = (intersection / union).astype(np.float32)
+
+        # Keep the k best candidates of each source: sort by source,
+        # decreasing score, then candidate, and cut each group after k
+        order = cp.lexsort(cp.stack([candidates.astype(np.float64),
+                                     -scores.astype(np.float64),
+                                     owners.astype(np.float64)]))
+        owners = owners[order]
+        candidates = candidates[order]
+        scores = scores[order]
+        ranks = cp.arange(len(owners)) - cp.searchsorted(owners, owners)
+        keep = ranks < k
+        batches.append((batch[owners[keep]], candidates[keep],
+                        scores[keep]))
+
+    df = cudf.DataFrame()
+    if batches:
+        df["source"] = cp.concatenate([b[0] for b in batches])
+        df["destination"] = cp.concatenate([b[1] for b in batches])
+        df["jaccard_coeff"] = cp.concatenate([b[2] for b in batches])
+    else:
+        df["source"] = cp.empty(0, dtype=np.int32)
+        df["destination"] = cp.empty(0, dtype=np.int32)
+        df["jaccard_coeff"] = cp.empty(0, dtype=np.float32)
+
+    if input_graph.renumbered:
+        df = input_graph.unrenumber(df, "source")
+        df = input_graph.unrenumber(df, "destination")
+
+    return df
@@ -12,4 +12,4 @@
 # limitations under the License.
 
 from cugraph.proto.components import strong_connected_component
-from cugraph.proto.structure  import find_bicliques
+from cugraph.proto.structure  import find_bicliques, iter_bicliques
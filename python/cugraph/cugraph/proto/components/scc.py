@@ -13,25 +13,32 @@
 
 
 import cudf
-import cugraph
+import cupy as cp
+import cupyx
 import numpy as np
 
 
 #
-# TRIM Process:
-#   - removed single vertex componenets
-#   - select vertex with highest out degree
-#   - forwards BFS
-#   - backward BFS
-#   - compute intersection = components
-#   - remove component
-#   - repeat
+# FW-BW-TRIM Process:
+#   - trim: repeatedly remove the vertices with no in or no out edges left,
+#     each of them is a single vertex component
+#   - coloring: propagate the largest vertex id forward along the edges, so
+#     every vertex gets the color of the largest vertex reaching it, and
+#     each color class holds whole components
+#   - backward: the component of the root of each color (the vertex whose
+#     id is the color) is the set of vertices of the color reaching the
+#     root, found with a backward traversal from all the roots at once
+#   - remove the components found, and repeat
+#
+# Every round removes at least one component per color class, and all the
+# steps are vectorized over the edge list, with numpy ('cpu' engine) or
+# cupy ('gpu' engine).
 
 
-def strong_connected_component(source, destination):
+def strong_connected_component(source, destination, engine="gpu"):
     """
     Generate the strongly connected components
-    using the FW-BW-TRIM approach, but skipping the trimming)
+    using the FW-BW-TRIM approach with coloring
 
     Parameters
     ----------
@@ -41,6 +48,10 @@ def strong_connected_component(source, destination):
     destination : cudf.Seriers
         A cudf seriers that contains the destination side of an edge list
 
+    engine : str, optional (default='gpu')
+        'gpu' runs the traversals on the device with cupy, 'cpu' on the host
+        with numpy.
+
     Returns
     -------
     cdf : cudf.DataFrame - a dataframe for components
@@ -62,104 +73,109 @@ def strong_connected_component(source, destination):
    >>> components, single_components, count =
         scc.strong_connected_component(source, destination)
     """
-    max_value = np.iinfo(np.int32).max  # NOQA
-
-    # create the FW and BW graphs - this version dopes nopt modify the graphs
-    G_fw = cugraph.Graph()
-    G_bw = cugraph.Graph()
-
-    G_fw.add_edge_list(source, destination)
-    G_bw.add_edge_list(destination, source)
-
-    # get a list of vertices and sort the list on out_degree
-    d = G_fw.degrees()
-    d = d.sort_values(by='out_degree', ascending=False)
-
-    num_verts = len(d)
-
-    # create space for the answers
-    components = [None] * num_verts
-    single_components = [None] * num_verts
-
-    # Counts - aka array indexies
-    count = 0
-    single_count = 0
-
-    # remove vertices that cannot be in a component
-    bad = d.query('in_degree == 0 or out_degree == 0')
-
-    if len(bad):
-        bad = bad.drop(['in_degree', 'out_degree'])
-
-        single_components[single_count] = bad
-        single_count = single_count + 1
-        d = _filter_list(d, bad)
-
-    # ----- Start processing -----
-    while len(d) > 0:
-
-        v = d['vertex'][0]
-
-        # compute the forward BFS
-        bfs_fw = cugraph.bfs(G_fw, v)
-        bfs_fw = bfs_fw.query("distance != @max_value")
-
-        # Now backwards
-        bfs_bw = cugraph.bfs(G_bw, v)
-        bfs_bw = bfs_bw.query("distance != @max_value")
-
-        # intersection
-        common = bfs_fw.merge(bfs_bw, on='vertex', how='inner')
-
-        if len(common) > 1:
-            common['id'] = v
-            components[count] = common
-            d = _filter_list(d, common)
-            count = count + 1
-
-        else:
-            # v is an isolated vertex
-            vdf = cudf.DataFrame()
-            vdf['vertex'] = v
-
-            single_components[single_count] = vdf
-            single_count = single_count + 1
-            d = d.iloc[1:]
-
-    # end of loop until vertex queue is empty
-
-    comp = _compress_array(components, count)
-    sing = _compress_array(single_components, single_count)
+    if engine == "gpu":
+        xp = cp
+        vertices = cudf.concat([source, destination]).unique()
+        vertices = vertices.sort_values().reset_index(drop=True)
+        src = cp.asarray(vertices.searchsorted(source), dtype=np.int32)
+        dst = cp.asarray(vertices.searchsorted(destination), dtype=np.int32)
+        vertices = vertices.values
+    elif engine == "cpu":
+        xp = np
+        num_edges = len(source)
+        vertices, ids = np.unique(
+            np.concatenate([source.values_host, destination.values_host]),
+            return_inverse=True)
+        ids = ids.astype(np.int32)
+        src, dst = ids[:num_edges], ids[num_edges:]
+    else:
+        raise ValueError(f"engine must be 'gpu' or 'cpu', got: {engine}")
+
+    labels = _fw_bw_trim(xp, src, dst, len(vertices))
+
+    # Group the vertices by component
+    order = xp.argsort(labels, kind="stable")
+    labels = labels[order]
+    sizes = xp.bincount(labels, minlength=len(vertices))
+    multi = sizes[labels] > 1
+
+    comp = cudf.DataFrame()
+    comp["vertex"] = vertices[order[multi]]
+    comp["id"] = vertices[labels[multi]]
+    sing = cudf.DataFrame()
+    sing["vertex"] = vertices[order[~multi]]
+    count = int((sizes > 1).sum())
 
     return comp, sing, count
 
 #  ---------
 
 
-def _filter_list(vert_list, drop_list):
-    t = cudf.DataFrame()
-    t['vertex'] = drop_list['vertex']
-    t['d'] = 0
-
-    df = vert_list.merge(t, on='vertex', how="left")
-
-    df['d'] = df['d'].fillna(1)
-    df = df.query('d == 1')
-    df.drop('d', inplace=True)
-
-    return df
-
+def _scatter_max(xp, out, index, values):
+    if xp is np:
+        np.maximum.at(out, index, values)
+    else:
+        cupyx.scatter_max(out, index, values)
 
-def _compress_array(a, length):
 
-    tmp = cudf.DataFrame()
-
-    if length > 0:
-        tmp_a = [None] * length
-
-        for i in range(length):
-            tmp_a[i] = a[i]
-
-        tmp = cudf.concat(tmp_a)
-
-    return tmp
+def _trim(xp, src, dst, remaining, labels):
+    """
+    Remove the vertices with no in or no out edges left until there are
+    none, labelling each as its own component.  Returns the edges left.
+    """
+    num_vertices = len(remaining)
+    while True:
+        live = remaining[src] & remaining[dst]
+        src, dst = src[live], dst[live]
+        in_degree = xp.bincount(dst, minlength=num_vertices)
+        out_degree = xp.bincount(src, minlength=num_vertices)
+        trivial = remaining & ((in_degree == 0) | (out_degree == 0))
+        if not bool(trivial.any()):
+            return src, dst
+        labels[trivial] = xp.flatnonzero(trivial)
+        remaining &= ~trivial
+
+
+def _fw_bw_trim(xp, src, dst, num_vertices):
+    """
+    Return the component label of each vertex of the edge list (src, dst)
+    over the vertices [0, num_vertices): the largest vertex of its strongly
+    connected component.
+    """
+    vertex_ids = xp.arange(num_vertices, dtype=np.int32)
+    labels = xp.full(num_vertices, -1, dtype=np.int32)
+    remaining = xp.ones(num_vertices, dtype=bool)
+
+    # Self loops do not connect anything
+    loops = src == dst
+    src, dst = src[~loops], dst[~loops]
+
+    while True:
+        src, dst = _trim(xp, src, dst, remaining, labels)
+        if not bool(remaining.any()):
+            return labels
+
+        # Forward coloring: only the edges leaving the vertices whose color
+        # changed are relaxed again
+        color = xp.where(remaining, vertex_ids, -1)
+        changed = remaining.copy()
+        while bool(changed.any()):
+            edges = changed[src]
+            new_color = xp.full(num_vertices, -1, dtype=np.int32)
+            _scatter_max(xp, new_color, dst[edges], color[src[edges]])
+            changed = new_color > color
+            color = xp.maximum(color, new_color)
+
+        # Backward traversal from the roots, within each color class
+        inside = color[src] == color[dst]
+        inside_src, inside_dst = src[inside], dst[inside]
+        reached = remaining & (color == vertex_ids)
+        frontier = reached.copy()
+        while bool(frontier.any()):
+            edges = frontier[inside_dst] & ~reached[inside_src]
+            frontier = xp.zeros(num_vertices, dtype=bool)
+            frontier[inside_src[edges]] = True
+            reached |= frontier
+
+        labels[reached] = color[reached]
+        remaining &= ~reached
@@ -11,10 +11,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# Import needed libraries
+# Biclique enumeration over the bipartite graph of machines (src) and
+# features (dst).
+#
+# The edges are deduplicated and laid out as a CSC (the machines of each
+# feature) and a CSR (the features of each machine).  The features are the
+# candidate seeds, in decreasing degree order:
+#   - seeds with fewer than min_machines machines are pruned,
+#   - seeds with the same machine set yield the same biclique, so only the
+#     first one is kept.  Machine sets are compared through a hash of the
+#     sorted machine list, an order independent sum of mixed machine ids
+#     computed for all the features at once with a prefix sum, along with
+#     the degree,
+#   - the remaining seeds are expanded in batches: machines of the seed,
+#     then features of those machines, and the (seed, feature) pairs are
+#     counted with a single sort.  The features shared by enough machines
+#     form the biclique of the seed.
+# Each batch is yielded as soon as it is done, so the first bicliques are
+# available before the whole graph is processed.
+
 import cudf
+import cupy as cp
 import numpy as np
-from collections import OrderedDict
 
 
 def find_bicliques(
@@ -38,6 +56,20 @@ def find_bicliques(
         -1 mean all
 
     offset : int
+        Value subtracted from the 'dst' ids
+
+    max_iter : int
+        The max number of features (dst) to use as seeds, -1 means all
+
+    support : float
+        The fraction, between 0.1 and 1.0, of the machines of the seed a
+        feature must be connected to to be part of its biclique
+
+    min_features : int
+        A biclique needs more than min_features features
+
+    min_machines : int
+        A biclique needs at least min_machines machines
 
     Returns
     -------
@@ -61,9 +93,51 @@ def find_bicliques(
         S['features'] - number of feature vertices
         S['bad_ration'] - the ratio of bad machine / total machines
     """
-    # must be factor of 10
-    PART_SIZE = int(1000)
+    bicliques = []
+    stats = []
+    for B, S in iter_bicliques(df, k, offset=offset, max_iter=max_iter,
+                               support=support, min_features=min_features,
+                               min_machines=min_machines):
+        bicliques.append(B)
+        stats.append(S)
+
+    if len(bicliques) == 0:
+        return cudf.DataFrame(), cudf.DataFrame()
+    return (cudf.concat(bicliques, ignore_index=True),
+            cudf.concat(stats, ignore_index=True))
+
+
+def iter_bicliques(
+        df, k=-1,
+        offset=0,
+        max_iter=-1,
+        support=1.0,
+        min_features=1,
+        min_machines=10,
+        batch_pairs=2**24):
+    """
+    Generate the bicliques of find_bicliques batch by batch.
 
+    Parameters
+    ----------
+    df, k, offset, max_iter, support, min_features, min_machines :
+        See find_bicliques.
+
+    batch_pairs : int
+        The max number of (seed, feature) pairs expanded at once.  A seed
+        with more pairs is processed in a batch of its own.
+
+    Yields
+    ------
+    B, S : cudf.DataFrame
+        The bicliques found in the batch and their statistics, in the format
+        of find_bicliques.  Batches without bicliques are not yielded.
+
+    Examples
+    --------
+    >>> for B, S in cugraph.iter_bicliques(df, k=-1):
+    >>>     process(B, S)
+    """
     x = [col for col in df.columns]
     if 'src' not in x:
         raise NameError('src column not found')
@@ -74,224 +148,195 @@ def find_bicliques(
 
     if support > 1.0 or support < 0.1:
         raise NameError('support must be between 0.1 and 1.0')
+    if batch_pairs <= 0:
+        raise ValueError('batch_pairs must be positive')
 
-    # this removes a prep step that offset the values for CUDA process
-    if offset > 0:
-        df['dst'] = df['dst'] - offset
-
-    # break the data into chunks to improve join/search performance
-    src_by_dst, num_parts = _partition_data_by_feature(df, PART_SIZE)
-
-    # Get a list of all the dst (features) sorted by degree
-    f_list = _count_features(df, True)
-
-    # create a dataframe for the answers
-    bicliques = cudf.DataFrame()
-    stats = cudf.DataFrame()
-
-    # create a dataframe to help prevent duplication of work
-    machine_old = cudf.DataFrame()
-
-    # create a dataframe for stats
-    stats = cudf.DataFrame()
-
-    answer_id = 0
-    iter_max = len(f_list)
-
-    if max_iter != -1:
-        iter_max = max_iter
-
-    # Loop over all the features (dst) or until K is reached
-    for i in range(iter_max):
-
-        # pop the next feature to process
-        feature = f_list['dst'][i]
-        degree = f_list['count'][i]
+    if k == 0 or len(df) == 0:
+        return
 
-        # compute the index to this item (which dataframe chunk is in)
-        idx = int(feature/PART_SIZE)
-
-        # get all machines that have this feature
-        machines = get_src_from_dst(src_by_dst[idx], feature)
-
-        # if this set of machines is the same as the last, skip this feature
-        if not is_same_as_last(machine_old, machines):
-
-            # now from those machines, hop out to the list of all the features
-            feature_list = get_all_feature(src_by_dst, machines, num_parts)
-
-            # summarize occurances
-            ic = _count_features(feature_list, True)
-
-            goal = int(degree * support)  # NOQA
-
-            # only get dst nodes with the same degree
-            c = ic.query('count >= @goal')
-
-            # need more than X feature to make a biclique
-            if len(c) > min_features:
-                if len(machines) >= min_machines:
-                    bicliques, stats = update_results(
-                            machines, c, answer_id, bicliques, stats)
-
-                    answer_id = answer_id + 1
-
-        # end - if same
-
-        machine_old = machines
-
-        if k > -1:
-            if answer_id == k:
-                break
-
-    # end for loop
-
-    # All done, reset data
+    src = df['src'].values
+    dst = df['dst'].values
     if offset > 0:
-        df['dst'] = df['dst'] + offset
-
-    return bicliques, stats
-
-
-def _partition_data_by_feature(_df, PART_SIZE):
-
-    # compute the number of sets
-    m = int((_df['dst'].max() / PART_SIZE) + 1)
-
-    _ui = [None] * (m + 1)
-
-    # Partition the data into a number of smaller DataFrame
-    s = 0
-    e = s + PART_SIZE
-
-    for i in range(m):
-        _ui[i] = _df.query('dst >= @s and dst < @e')
-
-        s = e
-        e = e + PART_SIZE
-
-    return _ui, m
-
-
-def _count_features(_gdf, sort=True):
-
-    aggs = OrderedDict()
-    aggs['dst'] = 'count'
-
-    c = _gdf.groupby(['dst'], as_index=False).agg(aggs)
-
-    c = c.rename(columns={'count_dst': 'count'}, copy=False)
-
-    if (sort):
-        c = c.sort_values(by='count', ascending=False)
-
-    return c
-
-
-# get all src vertices for a given dst
-def get_src_from_dst(_gdf, id):
-
-    _src_list = (_gdf.query('dst == @id'))
-
-    _src_list.drop('dst', inplace=True)
-
-    return _src_list
-
-
-def is_same_as_last(_old, _new):
-    status = False
-
-    if (len(_old) == len(_new)):
-        m = _old.merge(_new, on='src', how="left")
-
-        if m['src'].null_count == 0:
-            status = True
-
-    return status
-
-
-# get all the items used by the specified users
-def get_all_feature(_gdf, src_list_df, N):
-
-    c = [None] * N
-
-    for i in range(N):
-        c[i] = src_list_df.merge(_gdf[i], on='src', how="inner")
-
-    return cudf.concat(c)
-
+        dst = dst - offset
+    flag = df['flag'].values
+
+    machines, src = cp.unique(src, return_inverse=True)
+    features, dst = cp.unique(dst, return_inverse=True)
+    num_machines = len(machines)
+    num_features = len(features)
+
+    # CSC: the edges sorted by (feature, machine), without duplicates
+    keys = dst.astype(np.int64) * num_machines + src
+    order = cp.argsort(keys)
+    keys = keys[order]
+    keep = cp.ones(len(keys), dtype=bool)
+    keep[1:] = keys[1:] != keys[:-1]
+    order = order[keep]
+    src, dst, flag = src[order], dst[order], flag[order]
+
+    degree = cp.bincount(dst, minlength=num_features)
+    csc_offsets = cp.zeros(num_features + 1, dtype=np.int64)
+    cp.cumsum(degree, out=csc_offsets[1:])
+
+    # CSR: the same edges grouped by machine
+    order = cp.argsort(src)
+    csr_indices = dst[order]
+    out_degree = cp.bincount(src, minlength=num_machines)
+    csr_offsets = cp.zeros(num_machines + 1, dtype=np.int64)
+    cp.cumsum(out_degree, out=csr_offsets[1:])
+
+    # Seeds, by decreasing degree then increasing id
+    seeds = cp.lexsort(cp.stack([cp.arange(num_features, dtype=np.int64),
+                                 -degree.astype(np.int64)]))
+    if max_iter != -1:
+        seeds = seeds[:max_iter]
+    seeds = seeds[degree[seeds] >= min_machines]
+    seeds = seeds[_first_of_machine_set(seeds, src, csc_offsets, degree)]
+    if len(seeds) == 0:
+        return
+
+    # Number of (seed, feature) pairs each seed expands to
+    pairs = cp.zeros(len(src) + 1, dtype=np.int64)
+    cp.cumsum(out_degree[src], out=pairs[1:])
+    work = cp.asnumpy(cp.cumsum(pairs[csc_offsets[seeds + 1]] -
+                                pairs[csc_offsets[seeds]]))
 
-def update_results(m, f, key, b, s):
+    answer_id = 0
+    start = 0
+    while start < len(seeds):
+        done = 0 if start == 0 else work[start - 1]
+        end = int(np.searchsorted(work, done + batch_pairs, side='right'))
+        end = max(end, start + 1)
+
+        result = _batch_bicliques(seeds[start:end], src, flag, csc_offsets,
+                                  csr_indices, csr_offsets, degree,
+                                  num_features, support, min_features,
+                                  answer_id, k)
+        start = end
+        if result is None:
+            continue
+
+        ids, m_owner, m_pos, f_owner, f_vert, n_features = result
+        answer_id += len(n_features)
+        yield _batch_frames(ids, m_owner, machines[src[m_pos]], flag[m_pos],
+                            f_owner, features[f_vert], n_features)
+
+        if k > -1 and answer_id >= k:
+            return
+
+
+def _mix(x):
     """
-    Input
-    * m = machines
-    * f = features
-    * key = cluster ID
-    * b = biclique answer
-    * s = stats answer
-
-    Returns
-    -------
-    B : cudf.DataFrame
-        A dataframe containing the list of machine and features.  This is not
-    the full edge list to save space. Since it is a biclique, it is ease
-    to recreate the edges
-
-        B['id']    - a cluster ID (this is a one up number - up to k)
-        B['vert']  - the vertex ID
-        B['type']  - 0 == machine, 1 == feature
-
+    splitmix64 finalizer of x, as uint64.
+    """
+    z = x.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
 
-    S : cudf.DataFrame
-        A Pandas dataframe of statistics on the returned info.
-        This dataframe is (relatively small) of size k.
 
-        S['id']       - the cluster ID
-        S['total']    - total vertex count
-        S['machines'] - number of machine nodes
-        S['features'] - number of feature vertices
-        S['bad_ratio'] - the ratio of bad machine / total machines
+def _first_of_machine_set(seeds, src, csc_offsets, degree):
     """
-    B = cudf.DataFrame()
-    S = cudf.DataFrame()
+    Return the mask of the seeds whose machine set is not the one of an
+    earlier seed.
+    """
+    hashes = cp.zeros(len(src) + 1, dtype=np.uint64)
+    cp.cumsum(_mix(src), out=hashes[1:])
+    # uint64 arithmetic wraps around, so the difference of the prefix sums
+    # is the sum of the segment
+    seed_hash = hashes[csc_offsets[seeds + 1]] - hashes[csc_offsets[seeds]]
+    seed_degree = degree[seeds].astype(np.uint64)
+
+    # Sort by (hash, degree, rank) and keep the first seed of each set
+    order = cp.lexsort(cp.stack([cp.arange(len(seeds), dtype=np.uint64),
+                                 seed_degree, seed_hash]))
+    seed_hash, seed_degree = seed_hash[order], seed_degree[order]
+    first = cp.ones(len(seeds), dtype=bool)
+    first[1:] = (seed_hash[1:] != seed_hash[:-1]) | \
+        (seed_degree[1:] != seed_degree[:-1])
+    keep = cp.zeros(len(seeds), dtype=bool)
+    keep[order[first]] = True
+    return keep
+
+
+def _expand(offsets, rows):
+    """
+    Return, for every entry of the segments rows of offsets, the position of
+    its row in rows and its position in the segments.
+    """
+    starts = offsets[rows]
+    ends = cp.cumsum(offsets[rows + 1] - starts)
+    total = int(ends[-1]) if len(ends) else 0
+    entries = cp.arange(total, dtype=np.int64)
+    owners = cp.searchsorted(ends, entries, side='right')
+    first = ends - (offsets[rows + 1] - starts)
+    return owners, entries - first[owners] + starts[owners]
+
+
+def _batch_bicliques(batch, src, flag, csc_offsets, csr_indices, csr_offsets,
+                     degree, num_features, support, min_features, answer_id,
+                     k):
+    """
+    Find the bicliques of the seeds batch.  Returns None if there are none,
+    or the biclique ids of the batch, the (biclique, edge position) of the
+    machines, the (biclique, feature) of the features and the number of
+    features of each biclique.
+    """
+    # seed -> machines -> features
+    m_owner, m_pos = _expand(csc_offsets, batch)
+    p_owner, p_pos = _expand(csr_offsets, src[m_pos])
+    pair_keys = m_owner[p_owner] * num_features + csr_indices[p_pos]
+
+    pair_keys, counts = cp.unique(pair_keys, return_counts=True)
+    owner = pair_keys // num_features
+    goal = cp.floor(degree[batch] * support).astype(np.int64)
+    kept = counts >= goal[owner]
+    f_owner = owner[kept]
+    f_vert = pair_keys[kept] % num_features
+
+    n_features = cp.bincount(f_owner, minlength=len(batch))
+    valid = n_features > min_features
+    ids = cp.cumsum(valid) - 1 + answer_id
+    if k > -1:
+        valid &= ids < k
+    if not bool(valid.any()):
+        return None
+
+    m_kept = valid[m_owner]
+    f_kept = valid[f_owner]
+    return (ids, m_owner[m_kept], m_pos[m_kept], f_owner[f_kept],
+            f_vert[f_kept], n_features[valid])
+
+
+def _batch_frames(ids, m_owner, m_vert, m_flag, f_owner, f_vert,
+                  n_features):
+    """
+    Build the B and S dataframes of find_bicliques for a batch.
+    """
+    vert = cp.concatenate([m_vert, f_vert.astype(np.int32)])
+    cluster = cp.concatenate([ids[m_owner], ids[f_owner]])
+    vtype = cp.concatenate([cp.zeros(len(m_owner), dtype=np.int64),
+                            cp.ones(len(f_owner), dtype=np.int64)])
+    # Machines then features of each biclique, keeping their order
+    order = cp.argsort(cluster * 2 + vtype)
 
-    m_df = cudf.DataFrame()
-    m_df['vert'] = m['src']
-    m_df['id'] = int(key)
-    m_df['type'] = int(0)
-
-    f_df = cudf.DataFrame()
-    f_df['vert'] = f['dst'].astype(np.int32)
-    f_df['id'] = int(key)
-    f_df['type'] = int(1)
-
-    if len(b) == 0:
-        B = cudf.concat([m_df, f_df])
-    else:
-        B = cudf.concat([b, m_df, f_df])
-
-    # now update the stats
-    num_m = len(m_df)
-    num_f = len(f_df)
-    total = num_m + num_f
-
-    num_bad = len(m.query('flag == 1'))
-    ratio = num_bad / total
-
-    # now stats
-    s_tmp = cudf.DataFrame()
-    s_tmp['id'] = key
-    s_tmp['total'] = total
-    s_tmp['machines'] = num_m
-    s_tmp['features'] = num_f
-    s_tmp['bad_ratio'] = ratio
-
-    if len(s) == 0:
-        S = s_tmp
-    else:
-        S = cudf.concat([s, s_tmp])
-
-    del m_df
-    del f_df
+    B = cudf.DataFrame()
+    B['vert'] = vert[order]
+    B['id'] = cluster[order]
+    B['type'] = vtype[order]
+
+    first_id = int(ids[m_owner[0]])
+    num_m = cp.bincount(ids[m_owner] - first_id,
+                        minlength=len(n_features))
+    num_bad = cp.bincount(ids[m_owner] - first_id,
+                          weights=(m_flag == 1).astype(np.float64),
+                          minlength=len(n_features))
+    total = num_m + n_features
 
+    S = cudf.DataFrame()
+    S['id'] = cp.arange(first_id, first_id + len(n_features))
+    S['total'] = total
+    S['machines'] = num_m
+    S['features'] = n_features
+    S['bad_ratio'] = num_bad / total
     return B, S
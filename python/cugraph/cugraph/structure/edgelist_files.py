@@ -0,0 +1,291 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Chunked edge list ingestion.
+#
+# The edge list files are streamed chunk by chunk with pandas and every step
+# runs on the host with numpy, so the whole edge list never has to fit in
+# host or device memory at once:
+#   1. a first pass builds the sorted vertex vocabulary (the renumber map),
+#   2. a second pass counts the edges of each CSR row,
+#   3. a third pass scatters each chunk into the preallocated CSR,
+#   4. duplicate edges left across chunks are dropped by a final merge,
+#      which compacts the CSR in place one block of rows at a time.
+# Chunks are renumbered, symmetrized and deduplicated before they are added
+# to the CSR.  Peak host memory is the CSR itself plus one chunk, or plus
+# the largest CSR row when it holds more than chunk_rows edges.
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+
+def _file_format(path, file_format):
+    if file_format is not None:
+        return file_format
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    return "csv"
+
+
+def _read_chunks(paths, columns, chunk_rows, file_format, read_kwargs):
+    """
+    Yield the columns of the edge list files as pandas.DataFrames of at most
+    chunk_rows rows.
+    """
+    for path in paths:
+        path_format = _file_format(path, file_format)
+        if path_format == "csv":
+            for chunk in pd.read_csv(path, chunksize=chunk_rows,
+                                     **read_kwargs):
+                yield chunk[columns]
+        elif path_format == "parquet":
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_rows,
+                                                   columns=columns):
+                yield batch.to_pandas()
+        else:
+            raise ValueError("file_format must be 'csv' or 'parquet', "
+                             f"got: {path_format}")
+
+
+def _drop_duplicates(src, dst, weights, num_vertices):
+    """
+    Drop the duplicate (src, dst) pairs, keeping the smallest weight like
+    symmetrize does.  The returned edges are sorted by (src, dst).
+    """
+    keys = src.astype(np.int64) * num_vertices + dst
+    if weights is None:
+        order = np.argsort(keys, kind="stable")
+    else:
+        order = np.lexsort((weights, keys))
+    keys = keys[order]
+    keep = np.ones(len(keys), dtype=bool)
+    keep[1:] = keys[1:] != keys[:-1]
+    order = order[keep]
+    return (src[order], dst[order],
+            None if weights is None else weights[order])
+
+
+class _ChunkConverter:
+    """
+    Convert a chunk of the edge list files to renumbered, symmetrized and
+    deduplicated numpy arrays.
+    """
+
+    def __init__(self, source, destination, edge_attr, vertices,
+                 num_vertices, directed, multi):
+        self.source = source
+        self.destination = destination
+        self.edge_attr = edge_attr
+        self.vertices = vertices
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.multi = multi
+
+    def __call__(self, chunk):
+        src = chunk[self.source].to_numpy()
+        dst = chunk[self.destination].to_numpy()
+        if self.vertices is not None:
+            src = np.searchsorted(self.vertices, src).astype(np.int32)
+            dst = np.searchsorted(self.vertices, dst).astype(np.int32)
+        else:
+            src = src.astype(np.int32)
+            dst = dst.astype(np.int32)
+        weights = None
+        if self.edge_attr is not None:
+            weights = chunk[self.edge_attr].to_numpy()
+
+        if not self.directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+        if not self.multi:
+            src, dst, weights = _drop_duplicates(src, dst, weights,
+                                                 self.num_vertices)
+        return src, dst, weights
+
+
+def read_edgelist_files(paths, source, destination, edge_attr=None,
+                        renumber=True, directed=False, multi=False,
+                        chunk_rows=1000000, file_format=None, **read_kwargs):
+    """
+    Build the CSR of the graph stored in the edge list files paths, reading
+    the files chunk_rows rows at a time.
+
+    Parameters
+    ----------
+    paths : str or list of str
+        CSV or Parquet edge list files.
+    source : str
+        Source column name.
+    destination : str
+        Destination column name.
+    edge_attr : str or None
+        Weights column name. Default is None
+    renumber : bool
+        If True, renumber the vertices to [0, V).  If False the vertex ids
+        must be non-negative integers and are used as CSR row indices.
+    directed : bool
+        If False, the edges are symmetrized.
+    multi : bool
+        If False, duplicate edges are dropped, keeping the smallest weight.
+    chunk_rows : int
+        Maximum number of rows read at once, and of edges merged at once
+        when dropping duplicate edges.
+    file_format : str or None
+        'csv' or 'parquet'.  By default the format is inferred from the file
+        extension of each file, '.parquet' and '.pq' files being read as
+        Parquet and any other file as CSV.
+    **read_kwargs
+        Extra arguments passed to pandas.read_csv, such as delimiter, header,
+        names and dtype.
+
+    Returns
+    -------
+    offsets : numpy.ndarray
+        CSR offsets, of size V + 1.
+    indices : numpy.ndarray
+        CSR indices, of size E.
+    weights : numpy.ndarray or None
+        Edge weights, of size E.
+    vertices : numpy.ndarray or None
+        External vertex ids ordered by internal vertex id, or None if the
+        vertices were not renumbered.
+    self_loop : bool
+        True if the graph has self loops.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    columns = [source, destination]
+    if edge_attr is not None:
+        columns.append(edge_attr)
+
+    def chunks():
+        for chunk in _read_chunks(paths, columns, chunk_rows, file_format,
+                                  read_kwargs):
+            if chunk[[source, destination]].isnull().values.any():
+                raise ValueError("edge list contains NULL vertex ids")
+            yield chunk
+
+    # Pass 1: vertex vocabulary
+    vertices = None
+    max_id = -1
+    for chunk in chunks():
+        if renumber:
+            chunk_vertices = np.unique(np.concatenate(
+                [chunk[source].to_numpy(), chunk[destination].to_numpy()]))
+            vertices = chunk_vertices if vertices is None else \
+                np.union1d(vertices, chunk_vertices)
+        else:
+            if not (np.issubdtype(chunk[source].dtype, np.integer) and
+                    np.issubdtype(chunk[destination].dtype, np.integer)):
+                raise ValueError("set renumber to True for non integer ids")
+            if min(chunk[source].min(), chunk[destination].min()) < 0:
+                raise ValueError("set renumber to True for negative ids")
+            max_id = max(max_id, chunk[source].max(),
+                         chunk[destination].max())
+    if renumber:
+        num_vertices = 0 if vertices is None else len(vertices)
+        if num_vertices > 0 and np.issubdtype(vertices.dtype, np.integer) \
+                and vertices[0] == 0 and vertices[-1] == num_vertices - 1:
+            # The ids are already in [0, V), there is nothing to renumber
+            vertices = None
+    else:
+        num_vertices = int(max_id) + 1
+    if num_vertices >= np.iinfo(np.int32).max:
+        raise ValueError("too many vertices to fit in a single GPU graph")
+
+    convert = _ChunkConverter(source, destination, edge_attr, vertices,
+                              num_vertices, directed, multi)
+
+    # Pass 2: number of edges of each CSR row
+    counts = np.zeros(num_vertices, dtype=np.int64)
+    weights_dtype = None
+    for chunk in chunks():
+        src, _, weights = convert(chunk)
+        rows, row_counts = np.unique(src, return_counts=True)
+        counts[rows] += row_counts
+        if weights is not None:
+            weights_dtype = weights.dtype if weights_dtype is None else \
+                np.result_type(weights_dtype, weights.dtype)
+
+    offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    del counts
+    num_edges = int(offsets[-1])
+
+    # Pass 3: scatter each chunk at the end of its CSR rows
+    indices = np.empty(num_edges, dtype=np.int32)
+    weights = None
+    if edge_attr is not None:
+        weights = np.empty(num_edges, dtype=weights_dtype or np.float32)
+    cursor = offsets[:-1].copy()
+    self_loop = False
+    for chunk in chunks():
+        src, dst, chunk_weights = convert(chunk)
+        self_loop = self_loop or bool((src == dst).any())
+        order = np.argsort(src, kind="stable")
+        src = src[order]
+        rows, first, row_counts = np.unique(src, return_index=True,
+                                            return_counts=True)
+        positions = cursor[src] + (np.arange(len(src)) -
+                                   np.repeat(first, row_counts))
+        indices[positions] = dst[order]
+        if weights is not None:
+            weights[positions] = chunk_weights[order]
+        cursor[rows] += row_counts
+    del cursor
+
+    # Final merge: drop the duplicate edges coming from different chunks,
+    # one block of at most chunk_rows edges (or a single CSR row) at a time.
+    # Deduplication only shrinks the rows, so each block is compacted in
+    # place, before the blocks that are not merged yet.
+    if not multi:
+        merged_offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+        num_edges = 0
+        start = 0
+        while start < num_vertices:
+            end = int(np.searchsorted(offsets, offsets[start] + chunk_rows,
+                                      side="right")) - 1
+            end = min(max(end, start + 1), num_vertices)
+            first, last = offsets[start], offsets[end]
+            rows = np.repeat(np.arange(start, end, dtype=np.int32),
+                             np.diff(offsets[start:end + 1]))
+            rows, block_indices, block_weights = _drop_duplicates(
+                rows, indices[first:last],
+                None if weights is None else weights[first:last],
+                num_vertices)
+            count = len(rows)
+            indices[num_edges:num_edges + count] = block_indices
+            if weights is not None:
+                weights[num_edges:num_edges + count] = block_weights
+            np.cumsum(np.bincount(rows - start, minlength=end - start),
+                      out=merged_offsets[start + 1:end + 1])
+            merged_offsets[start + 1:end + 1] += num_edges
+            num_edges += count
+            start = end
+        offsets = merged_offsets
+        indices = indices[:num_edges]
+        if weights is not None:
+            weights = weights[:num_edges]
+
+    if num_edges >= np.iinfo(np.int32).max:
+        raise ValueError("too many edges to fit in a single GPU graph")
+
+    return offsets.astype(np.int32), indices, weights, vertices, self_loop
@@ -15,6 +15,7 @@ import numpy as np
 from .graph_implementation import (simpleGraphImpl,
                                    simpleDistributedGraphImpl,
                                    npartiteGraphImpl)
+from .graph_snapshot import GraphSnapshot
 import cudf
 import warnings
 
@@ -148,6 +149,76 @@ class Graph:
                                                    edge_attr=edge_attr,
                                                    renumber=renumber)
 
+    def from_edgelist_files(
+        self,
+        paths,
+        source="source",
+        destination="destination",
+        edge_attr=None,
+        renumber=True,
+        chunk_rows=1000000,
+        file_format=None,
+        **read_kwargs
+    ):
+        """
+        Initialize a graph from edge list files too large to be read as a
+        single DataFrame. It is an error to call this method on an
+        initialized Graph object. The files are read chunk_rows rows at a
+        time on the host with pandas: the chunks are renumbered, symmetrized
+        for undirected graphs and deduplicated one at a time, then assembled
+        into the CSR of the graph, so peak host memory is bounded by the size
+        of the CSR plus one chunk.
+
+        Parameters
+        ----------
+        paths : str or list of str
+            CSV or Parquet edge list files.
+
+        source : str
+            source column name
+
+        destination : str
+            destination column name
+
+        edge_attr : str or None
+            the weights column name. Default is None
+
+        renumber : bool
+            Indicate whether or not to renumber the source and destination
+            vertex IDs. Default is True.
+
+        chunk_rows : int
+            Maximum number of rows read at once. Default is 1000000.
+
+        file_format : str or None
+            'csv' or 'parquet'. By default the format of each file is inferred
+            from its extension, '.parquet' and '.pq' files being read as
+            Parquet and any other file as CSV.
+
+        **read_kwargs
+            Extra arguments passed to pandas.read_csv, such as delimiter,
+            header, names and dtype.
+
+        Examples
+        --------
+        >>> G = cugraph.Graph()
+        >>> G.from_edgelist_files(['part-0.csv', 'part-1.csv'], source='0',
+        >>>                       destination='1', edge_attr='2',
+        >>>                       delimiter=' ', header=None,
+        >>>                       names=['0', '1', '2'])
+        """
+        if self._Impl is None:
+            self._Impl = simpleGraphImpl(self.graph_properties)
+        elif type(self._Impl) is not simpleGraphImpl:
+            raise Exception("Graph is already initialized")
+        elif (self._Impl.edgelist is not None or
+              self._Impl.adjlist is not None):
+            raise Exception("Graph already has values")
+        self._Impl._simpleGraphImpl__from_edgelist_files(
+            paths, source, destination, edge_attr=edge_attr,
+            renumber=renumber, chunk_rows=chunk_rows, file_format=file_format,
+            **read_kwargs)
+
     def from_cudf_adjlist(self, offset_col, index_col, value_col=None):
         """
         Initialize a graph from the adjacency list. It is an error to call this
@@ -365,6 +436,46 @@ class Graph:
         np_array = np.asarray(np_matrix)
         self.from_numpy_array(np_array)
 
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Load a graph saved with Graph.save(path).  The arrays of the snapshot
+        are read on the host, memory-mapped by default, and only copied to
+        the device when an algorithm first needs them.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the snapshot.
+
+        mmap : bool, optional
+            If True (the default), memory-map the arrays of the snapshot
+            rather than reading them into host memory.
+
+        Returns
+        -------
+        G : cugraph.Graph or cugraph.MultiGraph
+            The loaded graph, directed if the saved graph was directed.
+
+        Examples
+        --------
+        >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+        >>> G = cugraph.Graph()
+        >>> G.from_cudf_edgelist(M, '0', '1')
+        >>> G.save('karate_snapshot')
+        >>> G2 = cugraph.Graph.load('karate_snapshot')
+        """
+        snapshot = GraphSnapshot(path, mmap=mmap)
+        directed = snapshot.properties["directed"]
+        if snapshot.header["is_multigraph"]:
+            G = MultiGraph(directed=directed)
+        else:
+            G = Graph(directed=directed)
+        G._Impl = simpleGraphImpl(G.graph_properties)
+        G._Impl._simpleGraphImpl__from_snapshot(snapshot)
+        return G
+
     def unrenumber(self, df, column_name, preserve_order=False,
                    get_column_names=False):
         """
@@ -16,6 +16,7 @@ from cugraph.structure.graph_primtypes_wrapper import Direction
 from cugraph.structure.number_map import NumberMap
 import cudf
 import dask_cudf
+import numpy as np
 
 
 class simpleDistributedGraphImpl:
@@ -51,6 +52,7 @@ class simpleDistributedGraphImpl:
         self.properties = simpleDistributedGraphImpl.Properties(properties)
         self.source_columns = None
         self.destination_columns = None
+        self.input_df = None
 
     # Functions
     def __from_edgelist(
@@ -380,29 +382,80 @@ class simpleDistributedGraphImpl:
         """
         Returns True if the graph contains the node n.
         """
-        if self.edgelist is None:
-            raise Exception("Graph has no Edgelist.")
-        # FIXME: Check renumber map
-        ddf = self.edgelist.edgelist_df[["src", "dst"]]
-        return (ddf == n).any().any().compute()
+        return bool(self.has_nodes([n])[0])
 
     def has_edge(self, u, v):
         """
         Returns True if the graph contains the edge (u,v).
         """
-        # TODO: Verify Correctness
-        if self.properties.renumbered:
-            tmp = cudf.DataFrame({"src": [u, v]})
-            tmp = tmp.astype({"src": "int"})
-            tmp = self.add_internal_vertex_id(
-                tmp, "id", "src", preserve_order=True
-            )
+        return bool(self.has_edges([u], [v])[0])
+
+    def has_nodes(self, vertices):
+        """
+        Returns, for each vertex of vertices, True if the graph contains it.
+        The whole batch is resolved with a single distributed computation.
+
+        Parameters
+        ----------
+        vertices : cudf.Series or iterable container
+            The vertices to look up.
+
+        Returns
+        -------
+        result : cudf.Series
+            Series of booleans of the size of vertices, in the same order.
+        """
+        if self.input_df is None:
+            raise Exception("Graph has no Edgelist.")
+        if not isinstance(vertices, cudf.Series):
+            vertices = cudf.Series(vertices)
+        vertices = vertices.reset_index(drop=True)
+
+        # FIXME: Multi-column vertices
+        ddf = self.input_df
+        nodes = dask_cudf.concat([ddf[self.source_columns],
+                                  ddf[self.destination_columns]])
+        found = nodes[nodes.map_partitions(lambda s: s.isin(vertices))]
+        found = found.unique().compute()
+        return vertices.isin(found)
+
+    def has_edges(self, src, dst):
+        """
+        Returns, for each pair (src[i], dst[i]), True if the graph contains
+        the edge. The whole batch is resolved with a single distributed
+        computation.
+
+        Parameters
+        ----------
+        src : cudf.Series or iterable container
+            The source vertices of the edges to look up.
+        dst : cudf.Series or iterable container
+            The destination vertices of the edges to look up, of the same size
+            as src.
 
-            u = tmp["id"][0]
-            v = tmp["id"][1]
+        Returns
+        -------
+        result : cudf.Series
+            Series of booleans of the size of src, in the same order.
+        """
+        if self.input_df is None:
+            raise Exception("Graph has no Edgelist.")
 
-        df = self.edgelist.edgelist_df
-        return ((df["src"] == u) & (df["dst"] == v)).any().compute()
+        # FIXME: Multi-column vertices
+        query = cudf.DataFrame()
+        query["src"] = cudf.Series(src).reset_index(drop=True)
+        query["dst"] = cudf.Series(dst).reset_index(drop=True)
+        query["order"] = cudf.Series(np.arange(len(query), dtype=np.int64))
+
+        ddf = self.input_df[[self.source_columns, self.destination_columns]]
+        ddf = ddf.rename(columns={self.source_columns: "src",
+                                  self.destination_columns: "dst"})
+        query = query.astype({"src": ddf["src"].dtype,
+                              "dst": ddf["dst"].dtype})
+        found = ddf.merge(dask_cudf.from_cudf(query, npartitions=1),
+                          on=["src", "dst"], how="inner")["order"]
+        found = found.unique().compute()
+        return query["order"].isin(found)
 
     def edges(self):
         """
@@ -15,6 +15,8 @@ from cugraph.structure import graph_primtypes_wrapper
 from cugraph.structure.graph_primtypes_wrapper import Direction
 from cugraph.structure.symmetrize import symmetrize
 from cugraph.structure.number_map import NumberMap
+from cugraph.structure.graph_snapshot import save_snapshot
+from cugraph.structure.edgelist_files import read_edgelist_files
 import cugraph.dask.common.mg_utils as mg_utils
 import cudf
 import dask_cudf
@@ -24,6 +26,59 @@ import numpy as np
 from cugraph.dask.structure import replication
 
 
+def _memory_usage(obj):
+    """
+    Returns the number of bytes held by the columns of a cached structure.
+    """
+    if obj is None:
+        return 0
+    if isinstance(obj, (cudf.Series, cudf.DataFrame)):
+        usage = obj.memory_usage(index=False)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(obj, dict):
+        return sum(_memory_usage(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_memory_usage(value) for value in obj)
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if hasattr(obj, "__dict__"):
+        return sum(_memory_usage(value) for value in vars(obj).values())
+    return 0
+
+
+def _degree_direction(direction):
+    """
+    Convert the direction argument of the degree APIs to a Direction.
+    """
+    directions = {"in": Direction.IN, "out": Direction.OUT,
+                  "all": Direction.ALL}
+    if direction not in directions:
+        raise ValueError("direction must be one of 'in', 'out' or 'all', "
+                         f"got: {direction}")
+    return directions[direction]
+
+
+def _vertices_are_contiguous(src, dst):
+    """
+    Returns True if the integer vertex ids in src and dst already cover the
+    range [0, V) exactly, in which case renumbering can be skipped.  Ids
+    wider than 32 bits are still mapped back to their dtype in the results.
+    """
+    if not (np.issubdtype(src.dtype, np.integer) and
+            np.issubdtype(dst.dtype, np.integer)):
+        return False
+    if len(src) == 0 or src.null_count != 0 or dst.null_count != 0:
+        return False
+    if min(src.min(), dst.min()) != 0:
+        return False
+    # V distinct vertices need at least V/2 edges, and the algorithms use
+    # 32-bit vertex ids
+    max_id = max(src.max(), dst.max())
+    if max_id >= 2 * len(src) or max_id >= np.iinfo(np.int32).max:
+        return False
+    return cudf.concat([src, dst]).nunique() == max_id + 1
+
+
 # FIXME: Change to consistent camel case naming
 class simpleGraphImpl:
 
@@ -64,6 +119,11 @@ class simpleGraphImpl:
 
     def __init__(self, properties):
         # Structure
+        self.version = 0
+        self._cache = {}
+        self._snapshot = None
+        self._pending_edgelist = None
+        self._edgelist_from_adjlist = False
         self.edgelist = None
         self.adjlist = None
         self.transposedadjlist = None
@@ -78,6 +138,122 @@ class simpleGraphImpl:
         self.batch_adjlists = None
         self.batch_transposed_adjlists = None
 
+    # The renumbered edge list and the renumber map are only built when they
+    # are first accessed, see compute_renumber_edge_list().  Graphs loaded
+    # from a snapshot or built from edge list files only hold a CSR, and
+    # rebuild their edge list from it instead.
+    @property
+    def edgelist(self):
+        if self._pending_edgelist is not None:
+            self.compute_renumber_edge_list()
+        if self._edgelist is None and self._edgelist_from_adjlist:
+            src, dst, weights = graph_primtypes_wrapper.view_edge_list(self)
+            self._edgelist = self.EdgeList(src, dst, weights)
+        return self._edgelist
+
+    @edgelist.setter
+    def edgelist(self, value):
+        self._edgelist = value
+
+    @property
+    def renumber_map(self):
+        if self._pending_edgelist is not None:
+            self.compute_renumber_edge_list()
+        if self._renumber_map is None and self._snapshot is not None:
+            self._renumber_map = self._snapshot.number_map()
+        return self._renumber_map
+
+    @renumber_map.setter
+    def renumber_map(self, value):
+        self._renumber_map = value
+
+    # The CSR and CSC structures are entries of the structure cache, so they
+    # are accounted for in cache_info() and dropped when the graph changes.
+    # Graphs loaded from a snapshot copy them to the device on first access.
+    @property
+    def adjlist(self):
+        adjlist = self._cache_get("adjlist")
+        if adjlist is None and self._snapshot is not None:
+            adjlist = self._snapshot.adjlist(simpleGraphImpl.AdjList)
+            self._cache_set("adjlist", adjlist)
+        return adjlist
+
+    @adjlist.setter
+    def adjlist(self, value):
+        self._cache_set("adjlist", value)
+
+    @property
+    def transposedadjlist(self):
+        transposedadjlist = self._cache_get("transposedadjlist")
+        if transposedadjlist is None and self._snapshot is not None:
+            transposedadjlist = self._snapshot.adjlist(
+                simpleGraphImpl.transposedAdjList, transposed=True)
+            self._cache_set("transposedadjlist", transposedadjlist)
+        return transposedadjlist
+
+    @transposedadjlist.setter
+    def transposedadjlist(self, value):
+        self._cache_set("transposedadjlist", value)
+
+    def _cache_get(self, name):
+        """
+        Return the cached structure name if it was built for the current
+        version of the graph, None otherwise.
+        """
+        entry = self._cache.get(name)
+        if entry is None or entry[0] != self.version:
+            return None
+        return entry[1]
+
+    def _cache_set(self, name, value):
+        """
+        Cache the structure name for the current version of the graph.
+        Setting a structure to None removes it from the cache.
+        """
+        if value is None:
+            self._cache.pop(name, None)
+        else:
+            self._cache[name] = (self.version, value)
+
+    def _invalidate_cache(self):
+        """
+        Record a mutation of the graph: bump the version and drop every
+        structure derived from the previous version.
+        """
+        self.version += 1
+        self._cache.clear()
+
+    def cache_info(self):
+        """
+        Report the structures currently cached on the graph.
+
+        Returns
+        -------
+        info : dict
+            Maps the name of each cached structure ('adjlist' for the CSR,
+            'transposedadjlist' for the CSC, 'host_adjlist' and
+            'host_transposedadjlist' for their host copies, 'degree_arrays',
+            'sorted_indices', 'unrenumbered_edgelist', 'symmetrized_edgelist')
+            to the number of bytes it holds.  Entries are only valid for the
+            graph version they were built for and are invalidated when the
+            graph is mutated.
+        """
+        return {
+            name: _memory_usage(value)
+            for name, (version, value) in self._cache.items()
+            if version == self.version
+        }
+
+    def _view_raw_edge_list(self):
+        """
+        Return the EdgeList without forcing a pending renumbering.  The
+        returned edge list holds external vertex ids while renumbering is
+        pending, which is enough to count edges or look for self loops.
+        """
+        if self._pending_edgelist is not None:
+            return self._pending_edgelist
+        return self._edgelist
+
     # Functions
     # FIXME: Change to public function
     # FIXME: Make function more modular
@@ -90,6 +266,8 @@ class simpleGraphImpl:
         renumber=True,
     ):
 
+        self._invalidate_cache()
+
         # Verify column names present in input DataFrame
         s_col = source
         d_col = destination
@@ -133,9 +311,11 @@ class simpleGraphImpl:
             )
 
         # Renumbering
+        self._pending_edgelist = None
         self.renumber_map = None
-        if renumber:
-            # FIXME: Should SG do lazy evaluation like MG?
+        lazy_renumber = False
+        if renumber and type(source) is list and type(destination) is list:
+            # Multi column ids are renumbered before symmetrizing
             elist, renumber_map = NumberMap.renumber(
                 elist, source, destination, store_transposed=False
             )
@@ -143,6 +323,35 @@ class simpleGraphImpl:
             destination = "dst"
             self.properties.renumbered = True
             self.renumber_map = renumber_map
+        elif renumber:
+            if _vertices_are_contiguous(elist[source], elist[destination]):
+                # The ids are already in [0, V), there is nothing to renumber
+                num_vertices = max(
+                    elist[source].max(), elist[destination].max()) + 1
+                self.properties.node_count = num_vertices
+                vertex_dtype = np.result_type(elist[source].dtype,
+                                              elist[destination].dtype)
+                if vertex_dtype != np.int32:
+                    # The algorithms use 32-bit ids: cast the edge list and
+                    # keep an identity map so that results are returned in
+                    # the input id dtype
+                    elist = elist.assign(**{
+                        source: elist[source].astype(np.int32),
+                        destination: elist[destination].astype(np.int32)})
+                    df = cudf.DataFrame()
+                    df["0"] = cudf.Series(
+                        np.arange(num_vertices, dtype=vertex_dtype))
+                    df["id"] = cudf.Series(
+                        np.arange(num_vertices, dtype=np.int32))
+                    self.renumber_map = NumberMap.from_vertex_table(
+                        df, source, destination)
+                    self.properties.renumbered = True
+            else:
+                # Like MG, SG renumbering is evaluated lazily: the edge list
+                # is symmetrized in external ids and only renumbered when it
+                # is first needed (see compute_renumber_edge_list)
+                lazy_renumber = True
+                self.properties.renumbered = True
         else:
             if type(source) is list and type(destination) is list:
                 raise Exception("set renumber to True for multi column ids")
@@ -173,12 +382,42 @@ class simpleGraphImpl:
                 source_col, dest_col, multi=self.properties.multi_edge,
                 symmetrize=not self.properties.directed)
 
+        if lazy_renumber:
+            self._pending_edgelist = simpleGraphImpl.EdgeList(
+                source_col, dest_col, value_col)
+            self.edgelist = None
+            return
+
         self.edgelist = simpleGraphImpl.EdgeList(source_col, dest_col,
                                                  value_col)
 
         if self.batch_enabled:
             self._replicate_edgelist()
 
+    def compute_renumber_edge_list(self):
+        """
+        Compute the renumbered edge list and the renumber map.
+        Renumbering of single-GPU graphs is evaluated lazily: this function
+        is called the first time the edge list, the renumber map or any
+        structure derived from them is accessed.  It can be called ahead of
+        an algorithm to measure the cost of renumbering separately.
+        """
+        if self._pending_edgelist is None:
+            return
+
+        pending = self._pending_edgelist
+        self._pending_edgelist = None
+
+        renumbered_df, renumber_map = NumberMap.renumber(
+            pending.edgelist_df, "src", "dst", store_transposed=False
+        )
+        pending.edgelist_df = renumbered_df
+        self.renumber_map = renumber_map
+        self.edgelist = pending
+
+        if self.batch_enabled:
+            self._replicate_edgelist()
+
     def to_pandas_edgelist(self, source='source', destination='destination'):
         """
         Returns the graph edge list as a Pandas DataFrame.
@@ -260,12 +499,20 @@ class simpleGraphImpl:
                 Column is only present for weighted Graph,
                 then containing the weight value for each edge
         """
+        edgelist_df = self._cache_get("unrenumbered_edgelist")
+        if edgelist_df is not None:
+            return edgelist_df.copy(deep=False)
+
         if self.edgelist is None:
             src, dst, weights = graph_primtypes_wrapper.view_edge_list(self)
             self.edgelist = self.EdgeList(src, dst, weights)
 
         edgelist_df = self.edgelist.edgelist_df
 
+        if self.properties.directed and not self.properties.renumbered:
+            # The stored edge list is returned as is, nothing to cache
+            return edgelist_df
+
         if self.properties.renumbered:
             edgelist_df = self.renumber_map.unrenumber(edgelist_df, "src")
             edgelist_df = self.renumber_map.unrenumber(edgelist_df, "dst")
@@ -275,7 +522,8 @@ class simpleGraphImpl:
             edgelist_df = edgelist_df.reset_index(drop=True)
             self.properties.edge_count = len(edgelist_df)
 
-        return edgelist_df
+        self._cache_set("unrenumbered_edgelist", edgelist_df)
+        return edgelist_df.copy(deep=False)
 
     def delete_edge_list(self):
         """
@@ -286,12 +534,77 @@ class simpleGraphImpl:
         self.edgelist = None
 
     def __from_adjlist(self, offset_col, index_col, value_col=None):
+        self._invalidate_cache()
         self.adjlist = simpleGraphImpl.AdjList(offset_col, index_col,
                                                value_col)
 
         if self.batch_enabled:
             self._replicate_adjlist()
 
+    def __from_edgelist_files(self, paths, source, destination,
+                              edge_attr=None, renumber=True,
+                              chunk_rows=1000000, file_format=None,
+                              **read_kwargs):
+        self._invalidate_cache()
+        offsets, indices, weights, vertices, self_loop = read_edgelist_files(
+            paths, source, destination, edge_attr=edge_attr,
+            renumber=renumber, directed=self.properties.directed,
+            multi=self.properties.multi_edge, chunk_rows=chunk_rows,
+            file_format=file_format, **read_kwargs)
+
+        self._edgelist_from_adjlist = True
+        self.adjlist = simpleGraphImpl.AdjList(
+            cudf.Series(offsets), cudf.Series(indices),
+            None if weights is None else cudf.Series(weights))
+        self.properties.weighted = weights is not None
+        self.properties.self_loop = self_loop
+        if vertices is not None:
+            df = cudf.DataFrame()
+            df["0"] = cudf.Series(vertices)
+            df["id"] = cudf.Series(np.arange(len(vertices), dtype=np.int32))
+            self.renumber_map = NumberMap.from_vertex_table(df, source,
+                                                            destination)
+            self.properties.renumbered = True
+
+        if self.batch_enabled:
+            self._replicate_adjlist()
+
+    def __from_snapshot(self, snapshot):
+        self._invalidate_cache()
+        self._snapshot = snapshot
+        self._edgelist_from_adjlist = True
+        properties = snapshot.properties
+        self.properties.renumbered = properties["renumbered"]
+        self.properties.weighted = properties["weighted"]
+        self.properties.self_loop = properties["self_loop"]
+        self.properties.edge_count = properties["edge_count"]
+        self.properties.node_count = snapshot.header["num_vertices"]
+
+    def save(self, path):
+        """
+        Save the graph to the snapshot directory path: a JSON header and one
+        raw little-endian file per array (CSR, CSC if computed, edge weights
+        and renumber map).  The snapshot can be loaded back with
+        Graph.load(path), which memory-maps the arrays instead of rebuilding
+        the graph from its edge list.
+
+        Parameters
+        ----------
+        path : str
+            Directory of the snapshot, created if it does not exist.  Files of
+            a previous snapshot in the directory are overwritten.
+
+        Examples
+        --------
+        >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+        >>> G = cugraph.Graph()
+        >>> G.from_cudf_edgelist(M, '0', '1')
+        >>> G.save('karate_snapshot')
+        >>> G2 = cugraph.Graph.load('karate_snapshot')
+        """
+        save_snapshot(self, path)
+
     def view_adj_list(self):
         """
         Display the adjacency list. Compute it if needed.
@@ -381,6 +694,36 @@ class simpleGraphImpl:
             self.transposedadjlist.weights,
         )
 
+    def view_host_adj_list(self, transposed=False):
+        """
+        Return host copies of the adjacency list, or of the transposed
+        adjacency list if transposed is True, for the CPU traversal engines.
+        The copies are cached against the graph version.
+
+        Returns
+        -------
+        offsets : numpy.ndarray
+            The offsets of the vertices, of size V + 1.
+        indices : numpy.ndarray
+            The destination (or source if transposed) index of each edge.
+        weights : numpy.ndarray or ``None``
+            The weight of each edge, ``None`` for unweighted graphs.
+        """
+        if transposed and self.properties.directed is False:
+            # The adjacency list of an undirected graph is symmetric
+            transposed = False
+        name = "host_transposedadjlist" if transposed else "host_adjlist"
+        arrays = self._cache_get(name)
+        if arrays is None:
+            if transposed:
+                offsets, indices, weights = self.view_transposed_adj_list()
+            else:
+                offsets, indices, weights = self.view_adj_list()
+            arrays = (offsets.values_host, indices.values_host,
+                      None if weights is None else weights.values_host)
+            self._cache_set(name, arrays)
+        return arrays
+
     def delete_adj_list(self):
         """
         Delete the adjacency list.
@@ -494,6 +837,10 @@ class simpleGraphImpl:
             elif self.transposedadjlist is not None:
                 self.properties.node_count = len(
                     self.transposedadjlist.offsets) - 1
+            elif self._pending_edgelist is not None:
+                df = self._pending_edgelist.edgelist_df
+                self.properties.node_count = cudf.concat(
+                    [df["src"], df["dst"]]).nunique()
             elif self.edgelist is not None:
                 df = self.edgelist.edgelist_df[["src", "dst"]]
                 self.properties.node_count = df.max().max() + 1
@@ -513,19 +860,26 @@ class simpleGraphImpl:
         Get the number of edges in the graph.
         """
         # TODO: Move to Outer graphs?
-        if directed_edges and self.edgelist is not None:
-            return len(self.edgelist.edgelist_df)
+        edgelist = self._view_raw_edge_list()
+        if directed_edges and edgelist is not None:
+            return len(edgelist.edgelist_df)
+        if directed_edges and self._snapshot is not None:
+            return self._snapshot.header["num_edges"]
+        if directed_edges and edgelist is None and self.adjlist is not None:
+            return len(self.adjlist.indices)
         if self.properties.edge_count is None:
-            if self.edgelist is not None:
+            if edgelist is None and self._edgelist_from_adjlist:
+                edgelist = self.edgelist
+            if edgelist is not None:
                 if self.properties.directed is False:
                     self.properties.edge_count = len(
-                        self.edgelist.edgelist_df[
-                            self.edgelist.edgelist_df["src"]
-                            >= self.edgelist.edgelist_df["dst"]
+                        edgelist.edgelist_df[
+                            edgelist.edgelist_df["src"]
+                            >= edgelist.edgelist_df["dst"]
                         ]
                     )
                 else:
-                    self.properties.edge_count = len(self.edgelist.edgelist_df)
+                    self.properties.edge_count = len(edgelist.edgelist_df)
             elif self.adjlist is not None:
                 self.properties.edge_count = len(self.adjlist.indices)
             elif self.transposedadjlist is not None:
@@ -672,39 +1026,165 @@ class simpleGraphImpl:
         >>> G.from_cudf_edgelist(M, '0', '1')
         >>> df = G.degrees([0,9,12])
         """
-        (
-            vertex_col,
-            in_degree_col,
-            out_degree_col,
-        ) = graph_primtypes_wrapper._degrees(self)
-
-        df = cudf.DataFrame()
-        df["vertex"] = vertex_col
-        df["in_degree"] = in_degree_col
-        df["out_degree"] = out_degree_col
-
-        if self.properties.renumbered is True:
-            df = self.renumber_map.unrenumber(df, "vertex")
+        df = self._degree_arrays()[["vertex", "in_degree", "out_degree"]]
 
         if vertex_subset is not None:
-            df = df[df['vertex'].isin(vertex_subset)]
+            return df.take(self._vertex_positions(vertex_subset)).\
+                reset_index(drop=True)
 
         return df
 
     def _degree(self, vertex_subset, direction=Direction.ALL):
-        vertex_col, degree_col = graph_primtypes_wrapper._degree(self,
-                                                                 direction)
+        arrays = self._degree_arrays()
+        if vertex_subset is not None:
+            arrays = arrays.take(self._vertex_positions(vertex_subset)).\
+                reset_index(drop=True)
+
         df = cudf.DataFrame()
-        df["vertex"] = vertex_col
-        df["degree"] = degree_col
+        df["vertex"] = arrays["vertex"]
+        if direction == Direction.IN:
+            df["degree"] = arrays["in_degree"]
+        elif direction == Direction.OUT:
+            df["degree"] = arrays["out_degree"]
+        else:
+            df["degree"] = arrays["in_degree"] + arrays["out_degree"]
+
+        return df
+
+    def _degree_arrays(self):
+        """
+        Return the cached degree arrays of the graph, computed once from the
+        offsets of the CSR (or of the CSC if only that one is available).
+        The returned cudf.DataFrame is ordered by internal vertex id, so row
+        i holds the external id ('vertex'), the in-degree and the out-degree
+        of internal vertex i.
+        """
+        arrays = self._cache_get("degree_arrays")
+        if arrays is not None:
+            return arrays
+
+        if self.adjlist is None and self.transposedadjlist is not None:
+            adjlist = self.transposedadjlist
+            offsets_direction, indices_direction = "in", "out"
+        else:
+            self.view_adj_list()
+            adjlist = self.adjlist
+            offsets_direction, indices_direction = "out", "in"
+
+        offsets = adjlist.offsets
+        num_verts = len(offsets) - 1
+        from_offsets = (
+            offsets[1:].reset_index(drop=True) -
+            offsets[:-1].reset_index(drop=True)
+        ).astype(np.int32)
+        if self.properties.directed:
+            # The degree in the other direction counts the occurrences of each
+            # vertex in the indices
+            _, from_indices = graph_primtypes_wrapper._degree_csr(
+                offsets, adjlist.indices, Direction.IN)
+        else:
+            # The edge list of an undirected graph is symmetrized
+            from_indices = from_offsets
 
+        arrays = cudf.DataFrame()
+        arrays["vertex"] = cudf.Series(np.arange(num_verts, dtype=np.int32))
+        arrays[offsets_direction + "_degree"] = from_offsets
+        arrays[indices_direction + "_degree"] = from_indices
         if self.properties.renumbered is True:
-            df = self.renumber_map.unrenumber(df, "vertex")
+            arrays = self.renumber_map.unrenumber(arrays, "vertex",
+                                                  preserve_order=True)
 
-        if vertex_subset is not None:
-            df = df[df['vertex'].isin(vertex_subset)]
+        self._cache_set("degree_arrays", arrays)
+        return arrays
 
-        return df
+    def _internal_ids(self, vertices):
+        """
+        Return the internal ids of vertices, in the order of vertices, with
+        -1 for the vertices that are not in the graph.
+        """
+        if not isinstance(vertices, cudf.Series):
+            vertices = cudf.Series(vertices)
+        if self.properties.renumbered is True:
+            ids = self.renumber_map.to_internal_vertex_id(vertices)
+        else:
+            ids = vertices.reset_index(drop=True)
+        valid = ids.notna() & (ids >= 0) & (ids < self.number_of_vertices())
+        return ids.where(valid.fillna(False), -1).fillna(-1).astype(np.int32)
+
+    def _vertex_positions(self, vertex_subset):
+        """
+        Return the internal ids of the vertices of vertex_subset that are in
+        the graph, in the order of vertex_subset, which are the positions of
+        these vertices in the degree arrays.
+        """
+        ids = self._internal_ids(vertex_subset)
+        return ids[ids >= 0].reset_index(drop=True)
+
+    def top_k_degree(self, k, direction="all"):
+        """
+        Return the k vertices with the largest degree, served from the cached
+        degree arrays.
+
+        Parameters
+        ----------
+        k : int
+            The number of vertices to return.
+        direction : str, optional
+            'in', 'out' or 'all' (the default) for the in-degree, the
+            out-degree or their sum.
+
+        Returns
+        -------
+        df : cudf.DataFrame
+            GPU DataFrame of size min(k, N) sorted by decreasing degree.
+            df['vertex'] : cudf.Series
+                The vertex IDs.
+            df['degree'] : cudf.Series
+                The degree of the corresponding vertex.
+
+        Examples
+        --------
+        >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+        >>> G = cugraph.Graph()
+        >>> G.from_cudf_edgelist(M, '0', '1')
+        >>> df = G.top_k_degree(5)
+        """
+        df = self._degree(None, _degree_direction(direction))
+        return df.nlargest(k, "degree").reset_index(drop=True)
+
+    def degree_histogram(self, direction="all"):
+        """
+        Return the number of vertices of each degree, served from the cached
+        degree arrays.
+
+        Parameters
+        ----------
+        direction : str, optional
+            'in', 'out' or 'all' (the default) for the in-degree, the
+            out-degree or their sum.
+
+        Returns
+        -------
+        histogram : cudf.Series
+            Series of size max_degree + 1 where entry d holds the number of
+            vertices with degree d.
+
+        Examples
+        --------
+        >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+        >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+        >>> G = cugraph.Graph()
+        >>> G.from_cudf_edgelist(M, '0', '1')
+        >>> histogram = G.degree_histogram()
+        """
+        df = self._degree(None, _degree_direction(direction))
+        counts = df.groupby("degree").size()
+        max_degree = int(df["degree"].max()) if len(df) > 0 else -1
+        histogram = counts.reindex(cudf.RangeIndex(max_degree + 1)).\
+            fillna(0).astype(np.int64)
+        histogram.name = "count"
+        return histogram
 
     def to_directed(self, DiG):
         """
@@ -713,8 +1193,11 @@ class simpleGraphImpl:
         directed view.
         """
         DiG.properties.renumbered = self.properties.renumbered
-        DiG.renumber_map = self.renumber_map
-        DiG.edgelist = self.edgelist
+        DiG._snapshot = self._snapshot
+        DiG._edgelist_from_adjlist = self._edgelist_from_adjlist
+        DiG._pending_edgelist = self._pending_edgelist
+        DiG.renumber_map = self._renumber_map
+        DiG.edgelist = self._edgelist
         DiG.adjlist = self.adjlist
         DiG.transposedadjlist = self.transposedadjlist
 
@@ -729,6 +1212,18 @@ class simpleGraphImpl:
             G.adjlist = self.adjlist
             G.transposedadjlist = self.transposedadjlist
         else:
+            G.edgelist = self._symmetrized_edge_list()
+
+    def _symmetrized_edge_list(self):
+        """
+        Return the symmetrized EdgeList of the graph, in internal vertex
+        ids.  For directed graphs it is computed once and cached.
+        """
+        if self.properties.directed is False:
+            return self.edgelist
+
+        edgelist = self._cache_get("symmetrized_edgelist")
+        if edgelist is None:
             df = self.edgelist.edgelist_df
             if self.edgelist.weights:
                 source_col, dest_col, value_col = symmetrize(
@@ -737,36 +1232,167 @@ class simpleGraphImpl:
             else:
                 source_col, dest_col = symmetrize(df["src"], df["dst"])
                 value_col = None
-            G.edgelist = simpleGraphImpl.EdgeList(source_col, dest_col,
-                                                  value_col)
+            edgelist = simpleGraphImpl.EdgeList(source_col, dest_col,
+                                                value_col)
+            self._cache_set("symmetrized_edgelist", edgelist)
+        return edgelist
 
     def has_node(self, n):
         """
         Returns True if the graph contains the node n.
         """
-        if self.properties.renumbered:
-            tmp = self.renumber_map.to_internal_vertex_id(cudf.Series([n]))
-            return tmp[0] is not cudf.NA and tmp[0] >= 0
-        else:
-            df = self.edgelist.edgelist_df[["src", "dst"]]
-            return (df == n).any().any()
+        return bool(self.has_nodes([n])[0])
 
     def has_edge(self, u, v):
         """
         Returns True if the graph contains the edge (u,v).
         """
-        if self.properties.renumbered:
-            tmp = cudf.DataFrame({"src": [u, v]})
-            tmp = tmp.astype({"src": "int"})
-            tmp = self.renumber_map.add_internal_vertex_id(
-                tmp, "id", "src", preserve_order=True
-            )
+        return bool(self.has_edges([u], [v])[0])
+
+    def has_nodes(self, vertices):
+        """
+        Returns, for each vertex of vertices, True if the graph contains it.
 
-            u = tmp["id"][0]
-            v = tmp["id"][1]
+        Parameters
+        ----------
+        vertices : cudf.Series or iterable container
+            The vertices to look up.
 
-        df = self.edgelist.edgelist_df
-        return ((df["src"] == u) & (df["dst"] == v)).any()
+        Returns
+        -------
+        result : cudf.Series
+            Series of booleans of the size of vertices, in the same order.
+        """
+        ids = self._internal_ids(vertices)
+        found = ids >= 0
+        if self.properties.renumbered is False and self.edgelist is not None:
+            # Without renumbering, ids in [0, V) that are not the end point
+            # of any edge are not vertices of the graph
+            arrays = self._degree_arrays()
+            degree = arrays["in_degree"] + arrays["out_degree"]
+            found = found & (degree.take(ids.clip(lower=0)).
+                             reset_index(drop=True) > 0)
+        return found
+
+    def has_edges(self, src, dst):
+        """
+        Returns, for each pair (src[i], dst[i]), True if the graph contains
+        the edge. Each pair is resolved with a binary search in the sorted
+        CSR row of its source, so a lookup costs O(log d) where d is the
+        degree of the source.
+
+        Parameters
+        ----------
+        src : cudf.Series or iterable container
+            The source vertices of the edges to look up.
+        dst : cudf.Series or iterable container
+            The destination vertices of the edges to look up, of the same size
+            as src.
+
+        Returns
+        -------
+        result : cudf.Series
+            Series of booleans of the size of src, in the same order.
+        """
+        src_ids = self._internal_ids(src)
+        dst_ids = self._internal_ids(dst)
+        if len(src_ids) != len(dst_ids):
+            raise ValueError("src and dst must have the same size")
+
+        offsets, indices = self._sorted_adj_list()
+        num_edges = len(indices)
+        valid = (src_ids >= 0) & (dst_ids >= 0)
+        if num_edges == 0:
+            return valid & False
+
+        # Search [lo, hi) for the first position whose destination is not
+        # less than dst, one halving step over all the queries at a time
+        rows = src_ids.clip(lower=0)
+        lo = offsets.take(rows).reset_index(drop=True)
+        end = offsets.take(rows + 1).reset_index(drop=True)
+        hi = end.where(valid, lo)
+        while True:
+            active = lo < hi
+            if not active.any():
+                break
+            mid = (lo + hi) // 2
+            probe = indices.take(mid.clip(upper=num_edges - 1)).\
+                reset_index(drop=True)
+            right = active & (probe < dst_ids)
+            left = active & ~right
+            lo = lo.where(~right, mid + 1)
+            hi = hi.where(~left, mid)
+
+        probe = indices.take(lo.clip(upper=num_edges - 1)).\
+            reset_index(drop=True)
+        return valid & (lo < end) & (probe == dst_ids)
+
+    def _sorted_adj_list(self):
+        """
+        Return the CSR offsets and the CSR indices sorted within each row,
+        cached against the graph version.
+        """
+        indices = self._cache_get("sorted_indices")
+        offsets, unsorted_indices, _ = self.view_adj_list()
+        if indices is None:
+            num_edges = len(unsorted_indices)
+            df = cudf.DataFrame()
+            df["row"] = offsets[1:].reset_index(drop=True).searchsorted(
+                cudf.Series(np.arange(num_edges, dtype=np.int32)),
+                side="right")
+            df["index"] = unsorted_indices.reset_index(drop=True)
+            indices = df.sort_values(["row", "index"])["index"].\
+                reset_index(drop=True)
+            self._cache_set("sorted_indices", indices)
+        return offsets, indices
+
+    def neighbors_batch(self, vertices):
+        """
+        Returns the neighbors of each vertex of vertices, read from the
+        rows of the CSR.
+
+        Parameters
+        ----------
+        vertices : cudf.Series or iterable container
+            The vertices whose neighbors are returned. Vertices that are not in
+            the graph have no neighbors.
+
+        Returns
+        -------
+        df : cudf.DataFrame
+            GPU DataFrame with one row per (vertex, neighbor) pair, grouped by
+            vertex in the order of vertices.
+            df['vertex'] : cudf.Series
+                The queried vertex.
+            df['neighbor'] : cudf.Series
+                A neighbor of the vertex.
+        """
+        if self._view_raw_edge_list() is None and self.adjlist is None:
+            raise Exception("Graph has no Edgelist.")
+        ids = self._vertex_positions(vertices)
+        offsets, indices, _ = self.view_adj_list()
+
+        starts = offsets.take(ids).reset_index(drop=True)
+        counts = offsets.take(ids + 1).reset_index(drop=True) - starts
+        total = int(counts.sum()) if len(counts) > 0 else 0
+        out_offsets = counts.cumsum() - counts
+
+        df = cudf.DataFrame()
+        df["vertex"] = ids.repeat(counts).reset_index(drop=True)
+        positions = (
+            cudf.Series(np.arange(total, dtype=np.int64)) -
+            out_offsets.repeat(counts).reset_index(drop=True) +
+            starts.repeat(counts).reset_index(drop=True)
+        )
+        df["neighbor"] = indices.take(positions).reset_index(drop=True)
+
+        if self.properties.renumbered:
+            # FIXME:  Multi-column vertices
+            df = self.renumber_map.unrenumber(df, "vertex",
+                                              preserve_order=True)
+            df = self.renumber_map.unrenumber(df, "neighbor",
+                                              preserve_order=True)
+        return df
 
     def has_self_loop(self):
         """
@@ -774,7 +1400,10 @@ class simpleGraphImpl:
         """
         # Detect self loop
         if self.properties.self_loop is None:
-            elist = self.edgelist.edgelist_df
+            elist = self._view_raw_edge_list()
+            if elist is None and self._edgelist_from_adjlist:
+                elist = self.edgelist
+            elist = elist.edgelist_df
             if (elist["src"] == elist["dst"]).any():
                 self.properties.self_loop = True
             else:
@@ -793,6 +1422,9 @@ class simpleGraphImpl:
         """
         Returns all the nodes in the graph as a cudf.Series
         """
+        if self._pending_edgelist is not None:
+            df = self._pending_edgelist.edgelist_df
+            return cudf.concat([df["src"], df["dst"]]).unique()
         if self.edgelist is not None:
             df = self.edgelist.edgelist_df
             if self.properties.renumbered:
@@ -808,21 +1440,7 @@ class simpleGraphImpl:
             return cudf.Series(np.arange(0, self.number_of_nodes()))
 
     def neighbors(self, n):
-        if self.edgelist is None:
-            raise Exception("Graph has no Edgelist.")
-        if self.properties.renumbered:
-            node = self.renumber_map.to_internal_vertex_id(cudf.Series([n]))
-            if len(node) == 0:
-                return cudf.Series(dtype="int")
-            n = node[0]
-
-        df = self.edgelist.edgelist_df
-        neighbors = df[df["src"] == n]["dst"].reset_index(drop=True)
-        if self.properties.renumbered:
-            # FIXME:  Multi-column vertices
-            return self.renumber_map.from_internal_vertex_id(neighbors)["0"]
-        else:
-            return neighbors
+        return self.neighbors_batch([n])["neighbor"]
 
     def vertex_column_size(self):
         if self.properties.renumbered:
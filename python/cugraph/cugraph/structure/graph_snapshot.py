@@ -0,0 +1,236 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# On-disk graph snapshots.
+#
+# A snapshot is a directory holding a JSON header and one raw little-endian
+# file per array.  The header follows the graph meta data of the C++
+# serializer (cpp/include/cugraph/serialization/serializer.hpp): number of
+# vertices and edges, is_symmetric, is_multigraph and is_weighted, and the
+# arrays are the CSR offsets (V + 1 values), indices and optional weights
+# (E values each) in the order the C++ serializer writes them.  The CSC and
+# the renumber map are stored alongside when available.
+
+import json
+import os
+
+import numpy as np
+import pyarrow as pa
+import cudf
+
+from cugraph.structure.number_map import NumberMap
+
+
+SNAPSHOT_FORMAT = "cugraph-snapshot"
+SNAPSHOT_VERSION = 1
+HEADER_FILE = "header.json"
+
+
+def _write_array(path, name, array):
+    """
+    Write a host array as a raw little-endian file and return its header
+    entry.
+    """
+    array = np.ascontiguousarray(array,
+                                 dtype=array.dtype.newbyteorder("<"))
+    file_name = name + ".bin"
+    array.tofile(os.path.join(path, file_name))
+    return {"file": file_name, "dtype": array.dtype.str,
+            "length": len(array)}
+
+
+def _read_array(path, entry, mmap):
+    """
+    Read an array written by _write_array, memory-mapped if mmap is True.
+    """
+    dtype = np.dtype(entry["dtype"])
+    file_name = os.path.join(path, entry["file"])
+    if entry["length"] == 0:
+        # Empty files can not be memory-mapped
+        return np.empty(0, dtype=dtype)
+    if mmap:
+        return np.memmap(file_name, dtype=dtype, mode="r",
+                         shape=(entry["length"],))
+    return np.fromfile(file_name, dtype=dtype, count=entry["length"])
+
+
+def _write_column(path, name, column):
+    """
+    Write a cudf.Series and return its header entry.  Numeric columns are
+    written as a single array, string columns as Arrow offsets and data.
+    """
+    if column.null_count != 0:
+        raise ValueError(f"column {name} contains NULL values")
+    if column.dtype != object:
+        return {"type": "numeric",
+                "values": _write_array(path, name, column.values_host)}
+
+    strings = column.to_arrow()
+    if pa.types.is_large_string(strings.type):
+        offset_dtype = np.int64
+    else:
+        offset_dtype = np.int32
+    buffers = strings.buffers()
+    offsets = np.frombuffer(buffers[1], dtype=offset_dtype)[
+        strings.offset:strings.offset + len(strings) + 1]
+    if buffers[2] is None:
+        data = np.empty(0, dtype=np.uint8)
+    else:
+        data = np.frombuffer(buffers[2], dtype=np.uint8)[
+            offsets[0]:offsets[-1]]
+    return {"type": "string",
+            "offsets": _write_array(path, name + ".offsets",
+                                    offsets - offsets[0]),
+            "data": _write_array(path, name + ".data", data)}
+
+
+def _read_column(path, entry, mmap):
+    """
+    Read a column written by _write_column into a cudf.Series.
+    """
+    if entry["type"] == "numeric":
+        return cudf.Series(_read_array(path, entry["values"], mmap))
+
+    offsets = _read_array(path, entry["offsets"], mmap)
+    data = _read_array(path, entry["data"], mmap)
+    if offsets.dtype == np.int64:
+        array_type = pa.LargeStringArray
+    else:
+        array_type = pa.StringArray
+    strings = array_type.from_buffers(
+        len(offsets) - 1,
+        pa.py_buffer(np.ascontiguousarray(offsets)),
+        pa.py_buffer(np.ascontiguousarray(data)))
+    return cudf.Series.from_arrow(strings)
+
+
+def save_snapshot(graph, path):
+    """
+    Save a single-GPU graph implementation (simpleGraphImpl) to the snapshot
+    directory path.  The CSR is computed if needed, the CSC is saved if it
+    was already computed.
+    """
+    os.makedirs(path, exist_ok=True)
+
+    offsets, indices, weights = graph.view_adj_list()
+    arrays = {}
+    structures = [("", graph.adjlist)]
+    if graph.transposedadjlist is not None:
+        structures.append(("transposed_", graph.transposedadjlist))
+    for prefix, adjlist in structures:
+        arrays[prefix + "offsets"] = _write_array(
+            path, prefix + "offsets", adjlist.offsets.values_host)
+        arrays[prefix + "indices"] = _write_array(
+            path, prefix + "indices", adjlist.indices.values_host)
+        if adjlist.weights is not None:
+            arrays[prefix + "weights"] = _write_array(
+                path, prefix + "weights", adjlist.weights.values_host)
+
+    renumber_map = None
+    if graph.properties.renumbered:
+        implementation = graph.renumber_map.implementation
+        df = implementation.df.sort_values("id").reset_index(drop=True)
+        renumber_map = {
+            "col_names": implementation.col_names,
+            "src_col_names": implementation.src_col_names,
+            "dst_col_names": implementation.dst_col_names,
+            "columns": {
+                name: _write_column(path, "renumber_map." + name, df[name])
+                for name in implementation.col_names + ["id"]
+            },
+        }
+
+    properties = graph.properties
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "num_vertices": len(offsets) - 1,
+        "num_edges": len(indices),
+        "is_symmetric": not properties.directed,
+        "is_multigraph": bool(properties.multi_edge),
+        "is_weighted": weights is not None,
+        "properties": {
+            "directed": properties.directed,
+            "renumbered": properties.renumbered,
+            "weighted": properties.weighted,
+            "self_loop": properties.self_loop,
+            "edge_count": int(graph.number_of_edges()),
+        },
+        "arrays": arrays,
+        "renumber_map": renumber_map,
+    }
+
+    # The header is written last, so an interrupted save does not leave a
+    # snapshot that looks valid
+    header_file = os.path.join(path, HEADER_FILE)
+    with open(header_file + ".tmp", "w") as f:
+        json.dump(header, f, indent=2)
+    os.replace(header_file + ".tmp", header_file)
+
+
+class GraphSnapshot:
+    """
+    A graph snapshot opened from disk.  The arrays are read, or memory-mapped
+    if mmap is True, on the host only.  They are copied to the device when
+    the graph first needs the corresponding structure.
+    """
+
+    def __init__(self, path, mmap=True):
+        header_file = os.path.join(path, HEADER_FILE)
+        if not os.path.isfile(header_file):
+            raise FileNotFoundError(f"{path} is not a graph snapshot")
+        with open(header_file) as f:
+            header = json.load(f)
+        if header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a graph snapshot")
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError("unsupported graph snapshot version "
+                             f"{header.get('version')}")
+
+        self.path = path
+        self.mmap = mmap
+        self.header = header
+        self.properties = header["properties"]
+        self.arrays = {
+            name: _read_array(path, entry, mmap)
+            for name, entry in header["arrays"].items()
+        }
+
+    def adjlist(self, cls, transposed=False):
+        """
+        Copy the CSR (or the CSC if transposed) to the device as an instance
+        of cls, or return None if the snapshot does not hold it.
+        """
+        prefix = "transposed_" if transposed else ""
+        if prefix + "offsets" not in self.arrays:
+            return None
+        weights = self.arrays.get(prefix + "weights")
+        return cls(cudf.Series(self.arrays[prefix + "offsets"]),
+                   cudf.Series(self.arrays[prefix + "indices"]),
+                   None if weights is None else cudf.Series(weights))
+
+    def number_map(self):
+        """
+        Copy the renumber map to the device, or return None if the graph was
+        not renumbered.
+        """
+        entry = self.header["renumber_map"]
+        if entry is None:
+            return None
+
+        df = cudf.DataFrame()
+        for name, column in entry["columns"].items():
+            df[name] = _read_column(self.path, column, self.mmap)
+
+        return NumberMap.from_vertex_table(df, entry["src_col_names"],
+                                           entry["dst_col_names"])
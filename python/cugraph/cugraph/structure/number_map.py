@@ -49,8 +49,75 @@ class NumberMap:
             self.id_type = id_type
             self.store_transposed = store_transposed
             self.numbered = False
+            self.use_lookup_index = True
+
+        @property
+        def df(self):
+            return self._df
+
+        @df.setter
+        def df(self, value):
+            # Any change to the renumber table invalidates the lookup index
+            self._df = value
+            self._index_keys = None
+            self._index_ids = None
+            self._dense_map = None
+            self._dense_map_checked = False
+
+        def _can_use_lookup_index(self, values):
+            """
+            Returns True if the external ids in values can be resolved with
+            the sorted lookup index rather than a merge against the table.
+            """
+            if not self.use_lookup_index or len(self.col_names) != 1:
+                return False
+            if self.df is None or "id" not in self.df.columns:
+                return False
+            if values.null_count != 0:
+                return False
+            key_dtype = self.df[self.col_names[0]].dtype
+            if values.dtype == key_dtype:
+                return True
+            return (np.issubdtype(values.dtype, np.integer) and
+                    np.issubdtype(key_dtype, np.integer) and
+                    np.can_cast(values.dtype, key_dtype))
+
+        def _build_lookup_index(self):
+            """
+            Build the persistent lookup index: the external ids sorted once,
+            with the internal ids gathered in the same order.
+            """
+            if self._index_keys is None:
+                sorted_df = self.df[[self.col_names[0], "id"]].sort_values(
+                    self.col_names[0]).reset_index(drop=True)
+                self._index_keys = sorted_df[self.col_names[0]]
+                self._index_ids = sorted_df["id"]
+            return self._index_keys, self._index_ids
+
+        def _lookup(self, values):
+            """
+            Binary search the external ids in values against the lookup
+            index and return the internal ids in the input order.  External
+            ids that are not in the map resolve to null, as with a right merge.
+            """
+            keys, ids = self._build_lookup_index()
+            values = values.reset_index(drop=True)
+            if values.dtype != keys.dtype:
+                values = values.astype(keys.dtype)
+            if len(keys) == 0:
+                return cudf.Series([None] * len(values), dtype=ids.dtype)
+
+            pos = cudf.Series(keys.searchsorted(values)).clip(
+                upper=len(keys) - 1)
+            found = keys.take(pos).reset_index(drop=True) == values
+            return ids.take(pos).reset_index(drop=True).where(found)
 
         def to_internal_vertex_id(self, df, col_names):
+            if self._can_use_lookup_index(df[col_names[0]]):
+                ret = self._lookup(df[col_names[0]])
+                ret.name = "id"
+                return ret
+
             tmp_df = df[col_names].rename(
                 columns=dict(zip(col_names, self.col_names)), copy=False
             )
@@ -63,9 +130,68 @@ class NumberMap:
                 .reset_index()["id"]
             )
 
+        def _build_dense_map(self):
+            """
+            Build the dense map: the external ids ordered by internal id.
+            Internal ids produced by renumbering are contiguous in [0, V),
+            so converting them back to external ids is a positional gather.
+            Returns None if the internal ids of the map are not contiguous.
+            """
+            if not self._dense_map_checked:
+                self._dense_map_checked = True
+                ids = self.df["id"]
+                if len(ids) > 0 and ids.min() == 0 and \
+                        ids.max() == len(ids) - 1:
+                    self._dense_map = self.df.sort_values("id")[
+                        self.col_names].reset_index(drop=True)
+            return self._dense_map
+
+        def _can_use_dense_map(self, df, internal_column_name):
+            """
+            Returns True if the internal ids in df[internal_column_name] can
+            be converted with a positional gather rather than a merge.
+            """
+            if not self.use_lookup_index:
+                return False
+            if self.df is None or "id" not in self.df.columns:
+                return False
+            if any(name in df.columns for name in self.col_names):
+                return False
+            if not np.issubdtype(df[internal_column_name].dtype, np.integer):
+                return False
+            return self._build_dense_map() is not None
+
+        def _gather(self, df, internal_column_name):
+            """
+            Add the external id columns for df[internal_column_name] to a
+            shallow copy of df, in the order of df.  Internal ids that are not
+            in [0, V), such as the -1 predecessor of a traversal root, resolve
+            to null, as with a right merge.
+            """
+            dense = self._build_dense_map()
+            ids = df[internal_column_name]
+            valid = ((ids >= 0) & (ids < len(dense))).fillna(False)
+            pos = ids.where(valid, 0).fillna(0)
+
+            tmp_df = df.copy(deep=False)
+            for name in self.col_names:
+                col = dense[name].take(pos)
+                col.index = tmp_df.index
+                tmp_df[name] = col.where(valid)
+            return tmp_df
+
         def from_internal_vertex_id(
             self, df, internal_column_name, external_column_names
         ):
+            if self._can_use_dense_map(df, internal_column_name):
+                tmp_df = self._gather(df, internal_column_name)
+                if external_column_names is None:
+                    return tmp_df
+                return tmp_df.rename(
+                    columns=dict(zip(self.col_names, external_column_names)),
+                    copy=False,
+                )
+
             tmp_df = self.df.merge(
                 df,
                 right_on=internal_column_name,
@@ -86,6 +212,19 @@ class NumberMap:
                                    drop, preserve_order):
             ret = None
 
+            lookup_col_names = self.col_names if col_names is None \
+                else col_names
+            if len(lookup_col_names) == 1 and \
+                    self._can_use_lookup_index(df[lookup_col_names[0]]):
+                # The index lookup is positional, so the input order is
+                # always preserved and no sort is needed
+                ids = self._lookup(df[lookup_col_names[0]])
+                ret = df.reset_index(drop=True)
+                if drop:
+                    ret = ret.drop(columns=lookup_col_names)
+                ret[id_column_name] = ids
+                return ret
+
             if preserve_order:
                 index_name = NumberMap.generate_unused_column_name(df.columns)
                 tmp_df = df
@@ -170,6 +309,74 @@ class NumberMap:
             self.ddf = ddf
             self.store_transposed = store_transposed
             self.numbered = False
+            self.use_lookup_index = True
+
+        @property
+        def ddf(self):
+            return self._ddf
+
+        @ddf.setter
+        def ddf(self, value):
+            # Any change to the renumber table invalidates the dense map
+            self._ddf = value
+            self._dense_ddf = None
+            self._dense_ranges = None
+
+        def _build_dense_map(self):
+            """
+            Build the per-partition dense map.  Each partition of the
+            renumber map holds the contiguous range of global ids owned by
+            one worker, so sorting every partition by global id lets the ids
+            of that range be converted back with a local positional gather.
+            Returns the sorted map and a cudf.DataFrame with the first and
+            last global id and the size of each partition.
+            """
+            if self._dense_ranges is None:
+                self._dense_ddf = self.ddf.map_partitions(
+                    lambda df: df.sort_values(
+                        "global_id").reset_index(drop=True)
+                ).persist()
+                self._dense_ranges = self._dense_ddf[
+                    "global_id"].map_partitions(
+                        NumberMap._partition_range,
+                        meta=NumberMap._partition_range(
+                            self._dense_ddf["global_id"]._meta)
+                ).compute().reset_index(drop=True)
+            return self._dense_ddf, self._dense_ranges
+
+        def _can_use_dense_map(self, ddf, internal_column_name):
+            """
+            Returns True if every partition of ddf only holds internal ids
+            of the matching partition of the renumber map, which is the case
+            for vertex-partitioned results of the MG algorithms.  Checking
+            this costs one min/max reduction per partition, against a
+            distributed merge for the fallback path.
+            """
+            if not self.use_lookup_index:
+                return False
+            if any(name in ddf.columns for name in self.col_names):
+                return False
+            if not np.issubdtype(ddf[internal_column_name].dtype, np.integer):
+                return False
+            dense_ddf, map_ranges = self._build_dense_map()
+            if ddf.npartitions != dense_ddf.npartitions:
+                return False
+            if ((map_ranges["last"] - map_ranges["first"] + 1) !=
+                    map_ranges["count"])[map_ranges["count"] > 0].any():
+                return False
+
+            query_ranges = ddf[internal_column_name].map_partitions(
+                NumberMap._partition_range,
+                meta=NumberMap._partition_range(
+                    ddf[internal_column_name]._meta)
+            ).compute().reset_index(drop=True)
+            non_empty = query_ranges["count"] > 0
+            in_range = (
+                (query_ranges["first"] >= map_ranges["first"]) &
+                (query_ranges["last"] <= map_ranges["last"]) &
+                (map_ranges["count"] > 0)
+            )
+            return not (non_empty & ~in_range).any()
 
         def to_internal_vertex_id(self, ddf, col_names):
             tmp_ddf = ddf[col_names].rename(
@@ -186,6 +393,37 @@ class NumberMap:
         def from_internal_vertex_id(
             self, df, internal_column_name, external_column_names
         ):
+            if self._can_use_dense_map(df, internal_column_name):
+                dense_ddf, _ = self._build_dense_map()
+                col_names = self.col_names
+
+                def _gather(part, map_part):
+                    first = map_part["global_id"].iloc[0] \
+                        if len(map_part) > 0 else 0
+                    ids = part[internal_column_name]
+                    valid = ((ids >= first) &
+                             (ids < first + len(map_part))).fillna(False)
+                    pos = (ids - first).where(valid, 0).fillna(0)
+                    tmp = part.copy(deep=False)
+                    for name in col_names:
+                        col = map_part[name].take(pos)
+                        col.index = tmp.index
+                        tmp[name] = col.where(valid)
+                    return tmp
+
+                tmp_df = df.map_partitions(_gather, dense_ddf)
+                if external_column_names is None:
+                    return tmp_df
+                return tmp_df.map_partitions(
+                    lambda df:
+                    df.rename(
+                        columns=dict(
+                            zip(self.col_names, external_column_names)
+                        ),
+                        copy=False
+                    )
+                )
+
             tmp_df = self.ddf.merge(
                 df,
                 right_on=internal_column_name,
@@ -301,6 +539,20 @@ class NumberMap:
 
         return name
 
+    def _partition_range(s):
+        """
+        Helper function returning the minimum, maximum and non-null count of
+        a partition of internal vertex ids as a one-row cudf.DataFrame
+        """
+        count = s.count()
+        return cudf.DataFrame({
+            "first": cudf.Series([s.min() if count > 0 else 0],
+                                 dtype=s.dtype),
+            "last": cudf.Series([s.max() if count > 0 else -1],
+                                dtype=s.dtype),
+            "count": cudf.Series([count], dtype=np.int64),
+        })
+
     def compute_vals(column_names):
         """
         Helper function to compute internal column names based on external
@@ -611,6 +863,23 @@ class NumberMap:
             df, src_col_names, dst_col_names,
             preserve_order, store_transposed)[0:2]
 
+    def from_vertex_table(df, src_col_names, dst_col_names):
+        """
+        Build a single GPU NumberMap from an existing renumbering table:
+        a cudf.DataFrame with the external vertex id columns '0', '1', ...
+        and the internal vertex id column 'id'.
+        """
+        if not isinstance(src_col_names, list):
+            src_col_names = [src_col_names]
+            dst_col_names = [dst_col_names]
+
+        renumber_map = NumberMap()
+        renumber_map.implementation = NumberMap.SingleGPU(
+            df, src_col_names, dst_col_names, renumber_map.id_type, False
+        )
+        renumber_map.implementation.numbered = True
+        return renumber_map
+
     def unrenumber(self, df, column_name, preserve_order=False,
                    get_column_names=False):
         """
@@ -670,16 +939,26 @@ class NumberMap:
                 mapping[nm] = nm + "_" + column_name
             col_names = list(mapping.values())
 
-        if preserve_order:
+        # The dense map gathers the external ids in place, so the order of
+        # the rows is preserved without the extra sort
+        positional = (
+            isinstance(self.implementation, NumberMap.SingleGPU) and
+            self.implementation._can_use_dense_map(df, column_name)
+        )
+
+        if preserve_order and not positional:
             index_name = NumberMap.generate_unused_column_name(df)
             df[index_name] = df.index
 
         df = self.from_internal_vertex_id(df, column_name, drop=True)
 
         if preserve_order:
-            df = df.sort_values(
-                index_name
-            ).drop(columns=index_name).reset_index(drop=True)
+            if positional:
+                df = df.reset_index(drop=True)
+            else:
+                df = df.sort_values(
+                    index_name
+                ).drop(columns=index_name).reset_index(drop=True)
 
         if type(df) is dask_cudf.DataFrame:
             df = df.map_partitions(
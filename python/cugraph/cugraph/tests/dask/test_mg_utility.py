@@ -120,3 +120,62 @@ def test_parquet_concat_within_workers(dask_client):
     print(ddf)
 
     assert t3 < t1
+
+
+def test_get_byte_ranges(tmpdir):
+    # Uneven files: one large file to split and several small ones to group
+    sizes = [2000, 3, 10, 150, 0]
+    rng = np.random.default_rng(0)
+    for i, n in enumerate(sizes):
+        ids = rng.integers(0, 10**6, size=(n, 2))
+        with open(str(tmpdir.join(f"part-{i}.csv")), "w") as f:
+            f.writelines(f"{u} {v} 1.0\n" for u, v in ids)
+
+    input_path = str(tmpdir.join("part-*.csv"))
+    total = sum(os.path.getsize(str(tmpdir.join(f"part-{i}.csv")))
+                for i in range(len(sizes)))
+    for n_partitions in [1, 2, 3, 8]:
+        partitions = dcg.get_byte_ranges(input_path, n_partitions)
+        assert len(partitions) == n_partitions
+
+        covered = {}
+        for byte_ranges in partitions:
+            for path, offset, length in byte_ranges:
+                with open(path, "rb") as f:
+                    data = f.read()
+                # Every byte range starts on a line
+                assert offset == 0 or data[offset - 1:offset] == b"\n"
+                covered.setdefault(path, []).append((offset, length))
+        # The byte ranges cover every file exactly once
+        for path, byte_ranges in covered.items():
+            position = 0
+            for offset, length in sorted(byte_ranges):
+                assert offset == position
+                position += length
+            assert position == os.path.getsize(path)
+
+        # Partitions are balanced to within a line
+        partition_sizes = [sum(length for _, _, length in byte_ranges)
+                           for byte_ranges in partitions]
+        assert max(partition_sizes) - min(partition_sizes) <= \
+            total / n_partitions * 0.1 + 64
+
+
+def test_read_csv_byte_ranges_empty(tmpdir):
+    open(str(tmpdir.join("empty.csv")), "w").close()
+    input_path = str(tmpdir.join("*.csv"))
+
+    # Empty files give a single partition with no byte ranges
+    partitions = dcg.get_byte_ranges(input_path, 4)
+    assert partitions == [[]]
+
+    df = dcg.read_csv_byte_ranges(partitions, delimiter=" ",
+                                  names=["src", "dst", "value"],
+                                  dtype=["int32", "int32", "float32"])
+    df = df.compute()
+    assert len(df) == 0
+    assert df.columns.to_list() == ["src", "dst", "value"]
+    assert df["src"].dtype == "int32"
+
+    with pytest.raises(FileNotFoundError):
+        dcg.get_byte_ranges(str(tmpdir.join("missing-*.csv")), 4)
@@ -505,3 +505,97 @@ def test_betweenness_centrality_nx(
             print(f"{cugraph_bc[i][1]} and {cugraph_bc[i][1]}")
     print("Mismatches:", err)
     assert err < (0.01 * len(cugraph_bc))
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("normalized", NORMALIZED_OPTIONS)
+def test_adaptive_betweenness_centrality(graph_file, directed, normalized):
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed)
+    num_vertices = G.number_of_vertices()
+
+    # Never stable: every vertex is used as a source, which gives the exact
+    # betweenness centrality
+    calls = []
+    adaptive = cugraph.adaptive_betweenness_centrality(
+        G, batch_size=8, patience=num_vertices, normalized=normalized,
+        callback=lambda df, used: calls.append(used), seed=42)
+    exact = cugraph.betweenness_centrality(G, normalized=normalized)
+
+    assert calls == list(range(8, num_vertices, 8)) + [num_vertices]
+    sorted_df = adaptive.merge(exact, on="vertex", suffixes=["_a", "_e"])
+    compare_scores(sorted_df, first_key="betweenness_centrality_a",
+                   second_key="betweenness_centrality_e")
+
+    # Early stopping
+    calls = []
+    cugraph.adaptive_betweenness_centrality(
+        G, batch_size=4, max_sources=12, callback=lambda df, used:
+        calls.append(used) or used >= 8)
+    assert calls == [4, 8]
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("normalized", NORMALIZED_OPTIONS)
+def test_betweenness_centrality_checkpoint(graph_file, directed, normalized,
+                                           tmpdir):
+    G = utils.generate_cugraph_graph_from_file(graph_file, directed)
+    exact = cugraph.betweenness_centrality(G, normalized=normalized)
+
+    path = str(tmpdir.join("bc"))
+    checkpointed = cugraph.betweenness_centrality(
+        G, normalized=normalized, batch_size=5, checkpoint_path=path)
+    sorted_df = checkpointed.merge(exact, on="vertex", suffixes=["_c", "_e"])
+    compare_scores(sorted_df, first_key="betweenness_centrality_c",
+                   second_key="betweenness_centrality_e")
+    assert cugraph.BetweennessPartial.load(path).complete
+
+    # Resuming a complete checkpoint does not traverse anything, and a
+    # checkpoint of other sources is rejected
+    resumed = cugraph.betweenness_centrality(
+        G, normalized=normalized, checkpoint_path=path)
+    assert len(resumed) == len(checkpointed)
+    with pytest.raises(ValueError):
+        cugraph.betweenness_centrality(G, k=[0, 1], checkpoint_path=path)
+    # and so is a checkpoint of another graph
+    other = utils.generate_cugraph_graph_from_file(graph_file, not directed)
+    with pytest.raises(ValueError):
+        cugraph.betweenness_centrality(other, normalized=normalized,
+                                       checkpoint_path=path)
+
+    # Saving only removes the arrays of previous partial results
+    foreign = tmpdir.join("bc", "offsets.bin")
+    foreign.write("")
+    partial = cugraph.BetweennessPartial.load(path)
+    partial.number_of_sources = 0
+    partial.save(path)
+    assert foreign.check()
+    assert sorted(f.basename for f in tmpdir.join("bc").listdir()) == \
+        ["dependencies.0.bin", "header.json", "offsets.bin", "sources.0.bin"]
+
+    # Split the sources in two, and merge
+    vertices = G.nodes().to_arrow().to_pylist()
+    half = len(vertices) // 2
+    for edge in [False, True]:
+        partials = [
+            cugraph.betweenness_centrality_partial(G, vertices[:half],
+                                                   edge=edge),
+            str(tmpdir.join(f"edge_{edge}")),
+        ]
+        cugraph.betweenness_centrality_partial(
+            G, vertices[half:], edge=edge, batch_size=3,
+            checkpoint_path=partials[1])
+        merged = cugraph.finalize_betweenness_centrality(
+            G, partials, normalized=normalized)
+        if edge:
+            expected = cugraph.edge_betweenness_centrality(
+                G, normalized=normalized)
+            on = ["src", "dst"]
+        else:
+            expected = exact
+            on = ["vertex"]
+        sorted_df = merged.merge(expected, on=on, suffixes=["_m", "_e"])
+        assert len(sorted_df) == len(expected)
+        compare_scores(sorted_df, first_key="betweenness_centrality_m",
+                       second_key="betweenness_centrality_e")
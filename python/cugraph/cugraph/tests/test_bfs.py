@@ -155,7 +155,7 @@ def compare_bfs(benchmark_callable, G, nx_values, start_vertex, depth_limit):
     Genereate both cugraph and reference bfs traversal.
     """
     if isinstance(start_vertex, int):
-        result = benchmark_callable(cugraph.bfs_edges, G, start_vertex)
+        result = benchmark_callable(cugraph.bfs, G, start_vertex)
         cugraph_df = convert_output_to_cudf(G, result)
         compare_func = _compare_bfs
 
@@ -172,7 +172,7 @@ def compare_bfs(benchmark_callable, G, nx_values, start_vertex, depth_limit):
 
         def func_to_benchmark():
             for sv in start_vertex:
-                cugraph_df = cugraph.bfs_edges(
+                cugraph_df = cugraph.bfs(
                     G, sv, depth_limit=depth_limit)
                 all_cugraph_distances.append(cugraph_df)
 
@@ -435,3 +435,170 @@ def test_scipy_api_compat():
     result = cugraph.bfs(input_coo_matrix, i_start=0)
     assert type(result) is tuple
     assert len(result) == 2
+    result = cugraph.bfs(input_coo_matrix, i_start=0,
+                         return_predecessors=False)
+    assert type(result) is not tuple
+    with pytest.raises(ValueError):
+        cugraph.bfs(input_coo_matrix, i_start=0, output="sparse")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("depth_limit", [None, 2])
+@pytest.mark.parametrize("engine", ["cpu", "gpu"])
+def test_multi_source_bfs(graph_file, directed, depth_limit, engine):
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    # More sources than the width of the bitset engine
+    vertices = G.nodes().to_arrow().to_pylist()
+    random.seed(42)
+    sources = random.sample(vertices, min(len(vertices), 70))
+
+    result = cugraph.multi_source_bfs(G, cudf.Series(sources),
+                                      depth_limit=depth_limit, engine=engine)
+    result = result.to_pandas().set_index("vertex")
+    components = cudf.DataFrame({"vertex": G.nodes(),
+                                 "color": cudf.Series([0] * len(vertices))})
+    edge_lists, offsets = cugraph.multi_source_bfs(
+        G, cudf.Series(sources), components=components,
+        depth_limit=depth_limit, engine=engine)
+    edge_lists = edge_lists.to_pandas()
+    offsets = offsets.to_arrow().to_pylist()
+    assert offsets[-1] == len(edge_lists)
+
+    unreachable = np.iinfo(np.int32).max
+    for i, source in enumerate(sources):
+        expected = cugraph.bfs(G, source, depth_limit=depth_limit)
+        expected = expected.to_pandas().set_index("vertex")["distance"]
+        distances = result[f"distance_{source}"]
+        assert (distances.loc[expected.index] == expected).all()
+
+        # Every predecessor is one level closer to the source
+        predecessors = result[f"predecessor_{source}"]
+        reached = distances[(distances != unreachable) & (distances > 0)]
+        assert (distances.loc[predecessors.loc[reached.index]].values ==
+                reached.values - 1).all()
+
+        block = edge_lists[offsets[i]:offsets[i + 1]]
+        reached = expected[expected != unreachable]
+        assert sorted(block["vertex"]) == sorted(reached.index)
+        assert (block.set_index("vertex")["distance"].loc[reached.index] ==
+                reached).all()
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("offload_format", ["binary", "parquet"])
+def test_multi_source_bfs_offload(graph_file, offload_format, tmpdir):
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    vertices = G.nodes().to_arrow().to_pylist()
+    random.seed(42)
+    sources = random.sample(vertices, min(len(vertices), 70))
+    components = cudf.DataFrame({"vertex": G.nodes(),
+                                 "color": cudf.Series([0] * len(vertices))})
+    expected, expected_offsets = cugraph.multi_source_bfs(
+        G, cudf.Series(sources), components=components)
+
+    path = str(tmpdir.join("bfs_output"))
+    output = cugraph.multi_source_bfs(G, cudf.Series(sources), offload=True,
+                                      offload_path=path,
+                                      offload_format=offload_format)
+    assert len(output) == len(sources)
+    assert output.offsets.tolist() == \
+        expected_offsets.to_arrow().to_pylist()
+
+    # The output can be reopened from its directory
+    output = cugraph.traversal.OffloadedBFS(path)
+    expected = expected.to_pandas()
+    for i, source in enumerate(sources):
+        start, end = output.offsets[i], output.offsets[i + 1]
+        df = output.read_source(source).to_pandas()
+        assert (df.values == expected[start:end][df.columns].values).all()
+
+    df, offsets = output.read_all()
+    assert len(df) == len(expected)
+
+
+@pytest.mark.parametrize("offload", [False, True])
+def test_concurrent_bfs(offload, tmpdir):
+    Graphs = []
+    sources = []
+    for graph_file in utils.DATASETS_SMALL:
+        cu_M = utils.read_csv_file(graph_file)
+        G = cugraph.Graph()
+        G.from_cudf_edgelist(cu_M, source="0", destination="1")
+        Graphs.append(G)
+        vertices = G.nodes().to_arrow().to_pylist()
+        random.seed(42)
+        sources.append(cudf.Series(random.sample(vertices, 20)))
+
+    results = cugraph.concurrent_bfs(Graphs, sources, offload=offload,
+                                     offload_path=str(tmpdir))
+    assert len(results) == len(Graphs)
+
+    for G, graph_sources, result in zip(Graphs, sources, results):
+        components = cudf.DataFrame({"vertex": G.nodes(), "color": 0})
+        expected, expected_offsets = cugraph.multi_source_bfs(
+            G, graph_sources, components=components)
+        if offload:
+            edge_list, offsets = result.read_all()
+        else:
+            edge_list, offsets = result
+        assert offsets.to_arrow().to_pylist() == \
+            expected_offsets.to_arrow().to_pylist()
+        assert (edge_list.to_pandas().values ==
+                expected.to_pandas()[edge_list.columns].values).all()
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", DIRECTED_GRAPH_OPTIONS)
+@pytest.mark.parametrize("depth_limit", [None, 1, 2])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("engine", ["gpu", "cpu"])
+def test_bfs_edges(graph_file, directed, depth_limit, reverse, engine):
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+    Gnx = utils.generate_nx_graph_from_file(graph_file, directed=directed)
+    source = cu_M["0"][0]
+
+    edges = cugraph.bfs_edges(G, source, reverse=reverse,
+                              depth_limit=depth_limit, engine=engine)
+    expected = list(nx.bfs_edges(Gnx, source, reverse=reverse,
+                                 depth_limit=depth_limit))
+    assert len(edges) == len(expected)
+    assert {v for _, v in edges} == {v for _, v in expected}
+
+    # Every tree edge is an edge of the graph one level further
+    if reverse and directed:
+        Gnx = Gnx.reverse()
+    distances = nx.single_source_shortest_path_length(Gnx, source)
+    df = edges.to_frame().to_pandas()
+    for u, v, distance in zip(df["src"], df["dst"], df["distance"]):
+        assert Gnx.has_edge(u, v)
+        assert distances[v] == distance == distances[u] + 1
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("depth_limit", [None, 2])
+@pytest.mark.parametrize("return_predecessors", [True, False])
+def test_bfs_sparse_output(graph_file, depth_limit, return_predecessors):
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.DiGraph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    dense = cugraph.filter_unreachable(
+        cugraph.bfs(G, 1, depth_limit=depth_limit))
+    sparse = cugraph.bfs(G, 1, depth_limit=depth_limit, output="sparse",
+                         return_predecessors=return_predecessors)
+
+    assert ("predecessor" in sparse.columns) == return_predecessors
+    columns = list(sparse.columns)
+    dense = dense[columns].sort_values("vertex").reset_index(drop=True)
+    sparse = sparse.sort_values("vertex").reset_index(drop=True)
+    assert dense.to_pandas().equals(sparse.to_pandas())
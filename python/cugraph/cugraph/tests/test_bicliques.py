@@ -0,0 +1,78 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+
+import pytest
+
+import cudf
+import cugraph
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+
+
+def bipartite_edgelist():
+    """
+    Two bicliques, machines 30-44 x features 200-202 and machines 0-11 x
+    features 100-104, and a few machines sharing small features.
+    """
+    src, dst, flag = [], [], []
+    for machines, features in [(range(30, 45), range(200, 203)),
+                               (range(0, 12), range(100, 105)),
+                               (range(20, 23), range(105, 107))]:
+        for m in machines:
+            for f in features:
+                src.append(m)
+                dst.append(f)
+                flag.append(1 if m < 3 else 0)
+    df = cudf.DataFrame()
+    df["src"] = src
+    df["dst"] = dst
+    df["flag"] = flag
+    return df
+
+
+def test_find_bicliques():
+    B, S = cugraph.find_bicliques(bipartite_edgelist(), k=-1)
+
+    assert S["id"].to_arrow().to_pylist() == [0, 1]
+    assert S["machines"].to_arrow().to_pylist() == [15, 12]
+    assert S["features"].to_arrow().to_pylist() == [3, 5]
+    assert S["bad_ratio"].to_arrow().to_pylist() == [0.0, 3 / 17]
+
+    B = B.to_pandas()
+    machines = B[(B["id"] == 1) & (B["type"] == 0)]["vert"]
+    features = B[(B["id"] == 1) & (B["type"] == 1)]["vert"]
+    assert sorted(machines) == list(range(12))
+    assert sorted(features) == list(range(100, 105))
+
+
+@pytest.mark.parametrize("batch_pairs", [1, 2**24])
+def test_iter_bicliques(batch_pairs):
+    df = bipartite_edgelist()
+    B, S = cugraph.find_bicliques(df, k=-1)
+
+    batches = list(cugraph.iter_bicliques(df, batch_pairs=batch_pairs))
+    assert cudf.concat([b for b, _ in batches], ignore_index=True) \
+        .to_pandas().equals(B.to_pandas())
+    assert cudf.concat([s for _, s in batches], ignore_index=True) \
+        .to_pandas().equals(S.to_pandas())
+
+    B, S = cugraph.find_bicliques(df, k=1)
+    assert len(S) == 1
+    assert set(B["id"].to_arrow().to_pylist()) == {0}
@@ -382,6 +382,24 @@ def test_strong_cc(gpubenchmark, dataset_nxresults_strong,
     assert nx_vertices == cg_vertices
 
 
+@pytest.mark.parametrize("engine", ["gpu", "cpu"])
+def test_proto_strong_cc(dataset_nxresults_strong, engine):
+    (graph_file, _, nx_n_components,
+     lst_nx_components, _) = dataset_nxresults_strong
+
+    cu_M = utils.read_csv_file(graph_file)
+    comp, sing, count = cugraph.strong_connected_component(
+        cu_M["0"], cu_M["1"], engine=engine)
+
+    multi_components = [c for c in lst_nx_components if len(c) > 1]
+    assert count == len(multi_components)
+    assert len(sing) == nx_n_components - count
+
+    cg_components = comp.to_pandas().groupby("id")["vertex"].apply(set)
+    assert sorted(map(sorted, cg_components)) == \
+        sorted(map(sorted, multi_components))
+
+
 @pytest.mark.parametrize("cugraph_input_type",
                          utils.NX_DIR_INPUT_TYPES + utils.MATRIX_INPUT_TYPES)
 def test_strong_cc_nonnative_inputs(gpubenchmark,
@@ -684,3 +684,305 @@ def test_graph_init_with_multigraph():
     cDiMG = cugraph.MultiDiGraph()  # deprecated, but should still work
     cDiMG.from_cudf_edgelist(gdf, source="src", destination="dst")
     cugraph.Graph(m_graph=cDiMG)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+def test_lazy_renumbering(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+    M = utils.read_csv_for_nx(graph_file)
+    Gnx = nx.from_pandas_edgelist(M, source="0", target="1",
+                                  create_using=nx.Graph())
+
+    # Translated ids need renumbering, which is deferred until the first
+    # structure that needs internal ids is built
+    translated = cudf.DataFrame()
+    translated["0"] = cu_M["0"] + 1000
+    translated["1"] = cu_M["1"] + 1000
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(translated, source="0", destination="1")
+
+    assert G.renumbered
+    assert G._Impl._pending_edgelist is not None
+    assert G.number_of_edges() == Gnx.number_of_edges()
+    assert G.number_of_vertices() == Gnx.number_of_nodes()
+    assert G._Impl._pending_edgelist is not None
+
+    G.view_adj_list()
+    assert G._Impl._pending_edgelist is None
+    assert G.renumber_map is not None
+
+    # Ids that are already in [0, V) are not renumbered at all
+    src = cudf.Series(range(Gnx.number_of_nodes()), dtype="int32")
+    dense = cudf.DataFrame({"0": src, "1": (src + 1) % len(src)})
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(dense, source="0", destination="1")
+
+    assert not G.renumbered
+    assert G.renumber_map is None
+    assert G.number_of_vertices() == len(src)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_contiguous_int64_ids(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1", edge_attr="2")
+
+    # Contiguous int64 ids are not renumbered, but the results keep the
+    # input id dtype
+    wide = cu_M.astype({"0": "int64", "1": "int64"})
+    G64 = cugraph.Graph()
+    G64.from_cudf_edgelist(wide, source="0", destination="1", edge_attr="2")
+    assert G64.number_of_vertices() == G.number_of_vertices()
+
+    for algo in [cugraph.bfs, cugraph.sssp]:
+        expected = algo(G, 0).sort_values("vertex").reset_index(drop=True)
+        result = algo(G64, 0).sort_values("vertex").reset_index(drop=True)
+        assert result["vertex"].dtype == "int64"
+        assert result["predecessor"].dtype == "int64"
+        assert (result["vertex"] == expected["vertex"]).all()
+        assert (result["distance"] == expected["distance"]).all()
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_structure_cache(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+    assert G.cache_info() == {}
+    version = G.version
+
+    G.view_adj_list()
+    G.view_transposed_adj_list()
+    edges = G.view_edge_list()
+    degrees = G.degrees()
+
+    info = G.cache_info()
+    assert set(info.keys()) >= {"adjlist", "transposedadjlist",
+                                "degree_arrays"}
+    assert all(nbytes > 0 for nbytes in info.values())
+
+    # Cached structures are served again without being rebuilt
+    offsets, _, _ = G.view_adj_list()
+    assert offsets is G.adjlist.offsets
+    assert_frame_equal(edges, G.view_edge_list())
+    assert_frame_equal(degrees, G.degrees())
+
+    # Deleting a structure only drops that entry, the graph is unchanged
+    G.delete_adj_list()
+    assert "adjlist" not in G.cache_info()
+    assert "transposedadjlist" in G.cache_info()
+    assert G.version == version
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_degree_queries(graph_file):
+    M = utils.read_csv_for_nx(graph_file)
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+    Gnx = nx.from_pandas_edgelist(
+        M, source="0", target="1", create_using=nx.DiGraph()
+    )
+    nx_degree = dict(Gnx.degree())
+
+    # A vertex subset is gathered in the order it is given, vertices that
+    # are not in the graph are dropped
+    subset = [max(nx_degree) + 1] + sorted(nx_degree)[::-1][:10]
+    df = G.degrees(subset).to_pandas()
+    assert df["vertex"].tolist() == subset[1:]
+    for v, in_deg, out_deg in zip(df["vertex"], df["in_degree"],
+                                  df["out_degree"]):
+        assert in_deg == Gnx.in_degree(v)
+        assert out_deg == Gnx.out_degree(v)
+
+    top = G.top_k_degree(5).to_pandas()
+    expected = sorted(nx_degree.values(), reverse=True)[:5]
+    assert top["degree"].tolist() == expected
+    for v, deg in zip(top["vertex"], top["degree"]):
+        assert nx_degree[v] == deg
+
+    histogram = G.degree_histogram().to_pandas()
+    assert histogram.tolist() == nx.degree_histogram(Gnx)
+
+    with pytest.raises(ValueError):
+        G.degree_histogram(direction="both")
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_batch_queries(graph_file):
+    M = utils.read_csv_for_nx(graph_file)
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph(directed=True)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+    Gnx = nx.from_pandas_edgelist(
+        M, source="0", target="1", create_using=nx.DiGraph()
+    )
+
+    nodes = sorted(Gnx.nodes())
+    missing = max(nodes) + 1
+    assert G.has_nodes(nodes + [missing, -1]).to_arrow().to_pylist() == \
+        [True] * len(nodes) + [False, False]
+
+    # Every edge, its reverse and a few pairs with unknown end points
+    src = list(M["0"]) + list(M["1"]) + [missing, nodes[0]]
+    dst = list(M["1"]) + list(M["0"]) + [nodes[0], missing]
+    expected = [Gnx.has_edge(u, v) for u, v in zip(src, dst)]
+    assert G.has_edges(src, dst).to_arrow().to_pylist() == expected
+    assert G.has_edge(src[0], dst[0])
+    assert not G.has_edge(missing, nodes[0])
+
+    df = G.neighbors_batch([nodes[-1], missing, nodes[0]]).to_pandas()
+    assert df["vertex"].unique().tolist() == [nodes[-1], nodes[0]]
+    for n in [nodes[-1], nodes[0]]:
+        assert sorted(df[df["vertex"] == n]["neighbor"]) == \
+            sorted(Gnx.successors(n))
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(graph_file, directed, mmap, tmpdir):
+    cu_M = utils.read_csv_file(graph_file)
+    # Shift the vertex ids so the graph is renumbered
+    cu_M["0"] = cu_M["0"] + 1000
+    cu_M["1"] = cu_M["1"] + 1000
+
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1", edge_attr="2")
+    path = str(tmpdir.join("snapshot"))
+    G.save(path)
+
+    loaded = cugraph.Graph.load(path, mmap=mmap)
+    # Nothing is copied to the device until a structure is needed
+    assert loaded.cache_info() == {}
+    assert loaded.is_directed() == directed
+    assert loaded.is_renumbered()
+    assert loaded.is_weighted()
+    assert loaded.number_of_vertices() == G.number_of_vertices()
+    assert loaded.number_of_edges() == G.number_of_edges()
+
+    offsets, indices, weights = G.view_adj_list()
+    loaded_offsets, loaded_indices, loaded_weights = loaded.view_adj_list()
+    assert offsets.to_arrow().to_pylist() == \
+        loaded_offsets.to_arrow().to_pylist()
+    assert indices.to_arrow().to_pylist() == \
+        loaded_indices.to_arrow().to_pylist()
+    assert weights.to_arrow().to_pylist() == \
+        loaded_weights.to_arrow().to_pylist()
+
+    expected = G.degrees().sort_values("vertex").reset_index(drop=True)
+    result = loaded.degrees().sort_values("vertex").reset_index(drop=True)
+    assert_frame_equal(expected, result)
+
+    with pytest.raises(FileNotFoundError):
+        cugraph.Graph.load(str(tmpdir.join("missing")))
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", [True, False])
+def test_save_load_algorithms(graph_file, directed, tmpdir):
+    cu_M = utils.read_csv_file(graph_file)
+    cu_M["0"] = cu_M["0"] + 1000
+    cu_M["1"] = cu_M["1"] + 1000
+
+    G = cugraph.Graph(directed=directed)
+    G.from_cudf_edgelist(cu_M, source="0", destination="1", edge_attr="2")
+    path = str(tmpdir.join("snapshot"))
+    G.save(path)
+    loaded = cugraph.Graph.load(path)
+
+    # The algorithms read the edge list, rebuilt from the snapshot CSR
+    start = cu_M["0"].iloc[0]
+    for algorithm in [cugraph.bfs, cugraph.sssp]:
+        expected = algorithm(G, start).sort_values("vertex").\
+            reset_index(drop=True)
+        result = algorithm(loaded, start).sort_values("vertex").\
+            reset_index(drop=True)
+        assert_frame_equal(expected[["vertex", "distance"]],
+                           result[["vertex", "distance"]])
+
+
+@pytest.mark.parametrize("self_loop", [True, False])
+def test_save_load_self_loop(self_loop, tmpdir):
+    df = cudf.DataFrame({"0": [1000, 1001, 1002], "1": [1001, 1002, 1000]})
+    if self_loop:
+        df = cudf.concat([df, cudf.DataFrame({"0": [1001], "1": [1001]})])
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(df, source="0", destination="1")
+    path = str(tmpdir.join("snapshot"))
+    # The snapshot does not know yet whether the graph has self loops
+    G.save(path)
+
+    loaded = cugraph.Graph.load(path)
+    assert loaded.has_self_loop() == self_loop
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("directed", [True, False])
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_from_edgelist_files(graph_file, directed, file_format, tmpdir):
+    M = utils.read_csv_for_nx(graph_file)
+    # Shift the vertex ids so the graph is renumbered, and duplicate the
+    # edges across files so duplicates have to be merged
+    M["0"] = M["0"] + 1000
+    M["1"] = M["1"] + 1000
+    half = len(M) // 2
+    parts = [M, M[:half], M[half:]]
+    paths = []
+    for i, part in enumerate(parts):
+        path = str(tmpdir.join(f"part-{i}.{file_format}"))
+        if file_format == "csv":
+            part.to_csv(path, index=False)
+        else:
+            part.to_parquet(path, index=False)
+        paths.append(path)
+
+    G = cugraph.Graph(directed=directed)
+    G.from_edgelist_files(paths, source="0", destination="1",
+                          edge_attr="weight", chunk_rows=10)
+
+    expected = cugraph.Graph(directed=directed)
+    expected.from_cudf_edgelist(cudf.DataFrame.from_pandas(M), source="0",
+                                destination="1", edge_attr="weight")
+
+    assert G.is_renumbered()
+    assert G.number_of_vertices() == expected.number_of_vertices()
+    assert_frame_equal(
+        G.degrees().sort_values("vertex").reset_index(drop=True),
+        expected.degrees().sort_values("vertex").reset_index(drop=True))
+
+    edges = G.view_edge_list().sort_values(["src", "dst"]).\
+        reset_index(drop=True)
+    expected_edges = expected.view_edge_list().sort_values(["src", "dst"]).\
+        reset_index(drop=True)
+    assert_frame_equal(edges, expected_edges, check_dtype=False,
+                       check_names=False)
+    assert G.number_of_edges() == expected.number_of_edges()
+    assert G.has_self_loop() == expected.has_self_loop()
+
+    # Self loops are detected while the files are read
+    path = str(tmpdir.join(f"loop.{file_format}"))
+    loop = M[:1].assign(**{"1": M["0"][:1]})
+    if file_format == "csv":
+        loop.to_csv(path, index=False)
+    else:
+        loop.to_parquet(path, index=False)
+    G_loop = cugraph.Graph(directed=directed)
+    G_loop.from_edgelist_files(paths + [path], source="0", destination="1",
+                               edge_attr="weight", chunk_rows=10)
+    assert G_loop.has_self_loop()
+
+    # The algorithms read the edge list, rebuilt from the CSR
+    start = int(M["0"].iloc[0])
+    for algorithm in [cugraph.bfs, cugraph.sssp]:
+        result = algorithm(G, start).sort_values("vertex").\
+            reset_index(drop=True)
+        expected_result = algorithm(expected, start).sort_values("vertex").\
+            reset_index(drop=True)
+        assert_frame_equal(result[["vertex", "distance"]],
+                           expected_result[["vertex", "distance"]],
+                           check_dtype=False)
@@ -159,3 +159,59 @@ def test_nx_convert_multicol(graph_file):
 
     assert nxG.number_of_nodes() == cuG.number_of_nodes()
     assert nxG.number_of_edges() == cuG.number_of_edges()
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+@pytest.mark.parametrize("directed", [True, False])
+def test_nx_convert_roundtrip(graph_file, directed):
+    nx_df = utils.read_csv_for_nx(graph_file, read_weights_in_sp=True)
+    # String labels go through the node label array of the bulk conversion
+    nx_df["0"] = "v" + nx_df["0"].astype(str)
+    nx_df["1"] = "v" + nx_df["1"].astype(str)
+    create_using = nx.DiGraph if directed else nx.Graph
+    nxG = nx.from_pandas_edgelist(nx_df, "0", "1", "weight",
+                                  create_using=create_using)
+
+    cuG = cugraph.utilities.convert_from_nx(nxG, weight="weight")
+    assert cuG.is_directed() is directed
+    assert nxG.number_of_nodes() == cuG.number_of_nodes()
+    assert nxG.number_of_edges() == cuG.number_of_edges()
+
+    nxG2 = cugraph.utilities.cugraph_to_nx(cuG)
+    assert nxG2.is_directed() is directed
+    assert set(nxG2.nodes()) == set(nxG.nodes())
+    assert set(nxG2.edges()) == set(nxG.edges())
+    for u, v, w in nxG.edges(data="weight"):
+        assert nxG2[u][v]["weights"] == pytest.approx(w)
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_nx_convert_multigraph_parallel_edges(directed):
+    from cugraph.utilities.nx_factory import (convert_unweighted_to_gdf,
+                                              convert_weighted_named_to_gdf)
+    nxG = nx.MultiDiGraph() if directed else nx.MultiGraph()
+    nxG.add_edge(0, 1, weight=1.0)
+    nxG.add_edge(0, 1, weight=2.0)
+    nxG.add_edge(1, 2, weight=3.0)
+
+    # Parallel edges stay separate rows instead of being summed
+    df = convert_weighted_named_to_gdf(nxG, "weight").to_pandas()
+    assert sorted(zip(df["src"], df["dst"], df["weight"])) == \
+        [(0, 1, 1.0), (0, 1, 2.0), (1, 2, 3.0)]
+    assert len(convert_unweighted_to_gdf(nxG)) == 3
+
+
+def test_nx_convert_self_loop_weight():
+    from cugraph.utilities.nx_factory import convert_weighted_named_to_gdf
+    nxG = nx.Graph()
+    nxG.add_edge(0, 1, weight=2.0)
+    nxG.add_edge(1, 1, weight=3.0)
+
+    df = convert_weighted_named_to_gdf(nxG, "weight").to_pandas()
+    assert sorted(zip(df["src"], df["dst"], df["weight"])) == \
+        [(0, 1, 2.0), (1, 1, 3.0)]
+
+    G = cugraph.utilities.convert_from_nx(nxG)
+    edges = G.view_edge_list().to_pandas()
+    loop = edges[(edges["src"] == 1) & (edges["dst"] == 1)]
+    assert loop["weights"].tolist() == [3.0]
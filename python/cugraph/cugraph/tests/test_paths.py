@@ -191,3 +191,26 @@ def test_shortest_path_length_no_target(graphs):
             assert distance == sys.float_info.max
         else:
             assert distance == nx_path_1_to_all[vertex]
+
+
+@pytest.mark.parametrize("graphs", [DISCONNECTED_GRAPH], indirect=True)
+def test_shortest_path_length_cpu_engine(graphs):
+    cugraph_G, nx_G, cupy_df = graphs
+    scipy_df = cupy_df.get()
+
+    for (source, target) in [(1, 1), (1, 5), (1, 3), (1, 6), (3, 7), (1, 8)]:
+        expected = cugraph.shortest_path_length(cugraph_G, source, target)
+        assert expected == cugraph.shortest_path_length(
+            cugraph_G, source, target, engine="cpu")
+        assert expected == cugraph.shortest_path_length(
+            nx_G, str(source), str(target), engine="cpu")
+        assert expected == cugraph.shortest_path_length(
+            cupy_df, source, target, engine="cpu")
+        assert expected == cugraph.shortest_path_length(
+            scipy_df, source, target)
+
+    with pytest.raises(ValueError):
+        cugraph.shortest_path_length(cugraph_G, -1, 1, engine="cpu")
+
+    with pytest.raises(ValueError):
+        cugraph.shortest_path_length(cugraph_G, 1, 1, engine="numpy")
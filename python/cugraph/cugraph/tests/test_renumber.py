@@ -304,3 +304,68 @@ def test_renumber_files_multi_col(graph_file):
                         check_names=False)
     assert_series_equal(gdf["dst_old"], unrenumbered_df["1_dst"],
                         check_names=False)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+def test_renumber_lookup_index(graph_file):
+    gc.collect()
+
+    M = utils.read_csv_for_nx(graph_file)
+    translate = 1000
+
+    gdf = cudf.DataFrame()
+    gdf["src"] = cudf.Series(M["0"]) + translate
+    gdf["dst"] = cudf.Series(M["1"]) + translate
+
+    renumbered_df, renumber_map = NumberMap.renumber(gdf, "src", "dst")
+
+    # Query in reverse order, with one id that is not in the map
+    query = cudf.Series(
+        [translate - 1] + gdf["src"].values_host[::-1].tolist())
+
+    renumber_map.implementation.use_lookup_index = False
+    expected = renumber_map.add_internal_vertex_id(query, preserve_order=True)
+    renumber_map.implementation.use_lookup_index = True
+    result = renumber_map.add_internal_vertex_id(query, preserve_order=True)
+
+    assert result["id"].isna().iloc[0]
+    assert_series_equal(expected["0"], result["0"], check_names=False)
+    assert_series_equal(expected["id"], result["id"], check_names=False,
+                        check_dtype=False)
+
+    internal = renumber_map.to_internal_vertex_id(query)
+    assert_series_equal(expected["id"], internal, check_names=False,
+                        check_dtype=False)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS)
+def test_renumber_dense_unrenumber(graph_file):
+    gc.collect()
+
+    M = utils.read_csv_for_nx(graph_file)
+    translate = 1000
+
+    gdf = cudf.DataFrame()
+    gdf["src"] = cudf.Series(M["0"]) + translate
+    gdf["dst"] = cudf.Series(M["1"]) + translate
+
+    renumbered_df, renumber_map = NumberMap.renumber(gdf, "src", "dst")
+    num_vertices = len(renumber_map.implementation.df)
+
+    # Internal ids in reverse order, plus ids that are not in [0, V)
+    df = cudf.DataFrame()
+    df["vertex"] = cudf.Series(
+        [-1] + list(range(num_vertices - 1, -1, -1)) + [num_vertices],
+        dtype="int32")
+
+    renumber_map.implementation.use_lookup_index = False
+    expected = renumber_map.unrenumber(df.copy(), "vertex",
+                                       preserve_order=True)
+    renumber_map.implementation.use_lookup_index = True
+    result = renumber_map.unrenumber(df.copy(), "vertex",
+                                     preserve_order=True)
+
+    assert result["vertex"].isna().iloc[0]
+    assert result["vertex"].isna().iloc[-1]
+    assert_series_equal(expected["vertex"], result["vertex"],
+                        check_names=False)
@@ -0,0 +1,189 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import pytest
+
+import cudf
+from cudf.testing import assert_series_equal
+
+import cugraph
+from cugraph.tests import utils
+
+# Temporarily suppress warnings till networkX fixes deprecation warnings
+# (Using or importing the ABCs from 'collections' instead of from
+# 'collections.abc' is deprecated, and in 3.8 it will stop working) for
+# python 3.7.  Also, this import networkx needs to be relocated in the
+# third-party group once this gets fixed.
+import warnings
+
+with warnings.catch_warnings():
+    warnings.filterwarnings("ignore", category=DeprecationWarning)
+    import networkx as nx
+
+
+# =============================================================================
+# Pytest Setup / Teardown - called for each test function
+# =============================================================================
+def setup_function():
+    gc.collect()
+
+
+ALL_METRICS = ["jaccard", "overlap", "sorensen", "adamic_adar",
+               "resource_allocation"]
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_UNDIRECTED)
+def test_vertex_similarity(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    df = cugraph.vertex_similarity(G, metrics=ALL_METRICS)
+    df = df.sort_values(["source", "destination"]).reset_index(drop=True)
+
+    for function, column in [(cugraph.jaccard, "jaccard_coeff"),
+                             (cugraph.overlap, "overlap_coeff"),
+                             (cugraph.sorensen, "sorensen_coeff")]:
+        expected = function(G).sort_values(["source", "destination"]) \
+            .reset_index(drop=True)
+        assert_series_equal(df[column], expected[column],
+                            check_exact=False, atol=1e-6, check_dtype=False)
+
+    # Adamic-Adar and resource allocation against networkx
+    M = utils.read_csv_for_nx(graph_file)
+    Gnx = nx.from_pandas_edgelist(M, source="0", target="1",
+                                  create_using=nx.Graph())
+    pairs = list(zip(df["source"].values_host.tolist(),
+                     df["destination"].values_host.tolist()))
+    for function, column in [(nx.adamic_adar_index, "adamic_adar_index"),
+                             (nx.resource_allocation_index,
+                              "resource_allocation_index")]:
+        expected = cudf.Series([p for _, _, p in function(Gnx, pairs)],
+                               name=column)
+        assert_series_equal(df[column], expected, check_exact=False,
+                            rtol=1e-5, check_dtype=False)
+
+
+def test_vertex_similarity_pairs():
+    cu_M = utils.read_csv_file(utils.RAPIDS_DATASET_ROOT_DIR_PATH /
+                               "karate.csv")
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    pairs = G.get_two_hop_neighbors() \
+        .sort_values(["first", "second"]).reset_index(drop=True)
+    df = cugraph.vertex_similarity(G, pairs, metrics="jaccard")
+    expected = cugraph.jaccard(G, pairs)
+    assert df.columns.to_list() == ["source", "destination", "jaccard_coeff"]
+    assert_series_equal(df["jaccard_coeff"], expected["jaccard_coeff"],
+                        check_exact=False, atol=1e-6, check_dtype=False)
+
+    with pytest.raises(ValueError):
+        cugraph.vertex_similarity(G, metrics=["cosine"])
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_UNDIRECTED)
+@pytest.mark.parametrize("batch_size", [1, 2**24])
+def test_jaccard_topk(graph_file, batch_size):
+    cu_M = utils.read_csv_file(graph_file)
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+    k = 3
+
+    df = cugraph.jaccard_topk(G, k, batch_size=batch_size)
+    df = df.sort_values(["source", "jaccard_coeff", "destination"],
+                        ascending=[True, False, True]).reset_index(drop=True)
+
+    pairs = G.get_two_hop_neighbors()
+    expected = cugraph.jaccard(G, pairs).to_pandas()
+    expected = expected.sort_values(
+        ["source", "jaccard_coeff", "destination"],
+        ascending=[True, False, True])
+    expected = expected.groupby("source").head(k).reset_index(drop=True)
+
+    assert len(df) == len(expected)
+    assert (df["source"].values_host == expected["source"].values).all()
+    assert abs(df["jaccard_coeff"].values_host -
+               expected["jaccard_coeff"].values).max() < 1e-6
+
+
+def test_jaccard_topk_max_degree():
+    cu_M = utils.read_csv_file(utils.RAPIDS_DATASET_ROOT_DIR_PATH /
+                               "karate.csv")
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    df = cugraph.jaccard_topk(G, 5, vertices=[0, 33], max_degree=4)
+    assert set(df["source"].values_host.tolist()) <= {0, 33}
+    assert (df.groupby("source").size() <= 5).all()
+
+    # The scores count every common neighbor, hubs included
+    expected = cugraph.jaccard(G, df[["source", "destination"]])
+    assert_series_equal(df["jaccard_coeff"], expected["jaccard_coeff"],
+                        check_exact=False, atol=1e-6, check_dtype=False,
+                        check_index=False)
+
+
+def test_minhash_index():
+    cu_M = utils.read_csv_file(utils.RAPIDS_DATASET_ROOT_DIR_PATH /
+                               "karate.csv")
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+    index = cugraph.MinHashIndex(G, num_hashes=256, bits=8, bands=64)
+    assert len(index) == G.number_of_vertices()
+    assert index.signatures.dtype.itemsize == 1
+
+    pairs = G.get_two_hop_neighbors()
+    exact = cugraph.jaccard(G, pairs)
+    estimate = index.estimate(pairs)
+    error = abs(estimate["jaccard_coeff"].values_host -
+                exact["jaccard_coeff"].values_host)
+    assert error.mean() < 0.05
+
+    df = index.query([0, 33], k=4)
+    assert set(df["source"].values_host.tolist()) <= {0, 33}
+    assert (df.groupby("source").size() <= 4).all()
+    assert (df["source"] != df["destination"]).all()
+
+    with pytest.raises(ValueError):
+        index.estimate(cudf.DataFrame({"first": [0], "second": [1000]}))
+
+
+def test_minhash_index_update():
+    cu_M = utils.read_csv_file(utils.RAPIDS_DATASET_ROOT_DIR_PATH /
+                               "karate.csv")
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1")
+
+    # Drop the edges of vertex 0, index, then add them back
+    src, dst = cu_M["0"], cu_M["1"]
+    removed = (src == 0) | (dst == 0)
+    G_removed = cugraph.Graph()
+    G_removed.from_cudf_edgelist(cu_M[~removed], source="0",
+                                 destination="1")
+    index = cugraph.MinHashIndex(G_removed, num_hashes=64, bands=16)
+
+    changed = cudf.concat([src[removed], dst[removed]]).unique()
+    index.update(G, changed)
+    expected = cugraph.MinHashIndex(G, num_hashes=64, bands=16)
+
+    assert (index.vertices == expected.vertices).all()
+    assert (index.signatures == expected.signatures).all()
+    assert (index.empty == expected.empty).all()
+
+    # The buckets were updated in place, queries match a fresh index
+    queries = index.vertices.tolist()
+    result = index.query(queries, k=5).to_pandas()
+    expected_result = expected.query(queries, k=5).to_pandas()
+    assert result.equals(expected_result)
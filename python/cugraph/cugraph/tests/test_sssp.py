@@ -360,9 +360,6 @@ def test_scipy_api_compat():
     with pytest.raises(TypeError):
         cugraph.shortest_path(input_cugraph_graph, source=0,
                               overwrite=False)
-    with pytest.raises(TypeError):
-        cugraph.shortest_path(input_cugraph_graph, source=0,
-                              return_predecessors=False)
 
     # Ensure cugraph-compatible options work as expected
     # cannot set both source and indices, but must set one
@@ -377,6 +374,12 @@ def test_scipy_api_compat():
     with pytest.raises(ValueError):
         cugraph.shortest_path(input_cugraph_graph, indices=[0, 1, 2])
     cugraph.shortest_path(input_cugraph_graph, source=0, method="auto")
+    df = cugraph.shortest_path(input_cugraph_graph, source=0,
+                               return_predecessors=False)
+    assert "predecessor" not in df.columns
+    with pytest.raises(ValueError):
+        cugraph.shortest_path(input_cugraph_graph, source=0,
+                              output="compact")
 
     # Ensure SciPy options for matrix inputs work as expected
     # cannot set both source and indices, but must set one
@@ -418,4 +421,25 @@ def test_scipy_api_compat():
 
     with pytest.raises(ValueError):
         cugraph.shortest_path(input_coo_matrix, indices=[0, 1, 2])
+    with pytest.raises(ValueError):
+        cugraph.shortest_path(input_coo_matrix, source=0, output="sparse")
     cugraph.shortest_path(input_coo_matrix, indices=0)
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+@pytest.mark.parametrize("return_predecessors", [True, False])
+def test_sssp_sparse_output(graph_file, return_predecessors):
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.DiGraph()
+    G.from_cudf_edgelist(cu_M, source="0", destination="1", edge_attr="2")
+
+    dense = cugraph.filter_unreachable(cugraph.sssp(G, 1))
+    sparse = cugraph.sssp(G, 1, output="sparse",
+                          return_predecessors=return_predecessors)
+
+    assert ("predecessor" in sparse.columns) == return_predecessors
+    columns = list(sparse.columns)
+    dense = dense[columns].sort_values("vertex").reset_index(drop=True)
+    sparse = sparse.sort_values("vertex").reset_index(drop=True)
+    assert dense.to_pandas().equals(sparse.to_pandas())
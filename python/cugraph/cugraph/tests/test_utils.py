@@ -97,3 +97,51 @@ def test_get_traversed_cost(graph_file):
 
     assert df.shape[0] == answer.shape[0]
     assert np.allclose(df['distance'], answer['info'])
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_get_traversed_paths(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source='0', destination='1', edge_attr='2')
+
+    df = cugraph.sssp(G, 16)
+    # Shuffle the result, it must not be used as positions
+    df = df.sample(frac=1, random_state=42).reset_index(drop=True)
+    targets = df['vertex'].to_arrow().to_pylist()
+
+    offsets, vertices = cugraph.utils.get_traversed_paths(df, targets)
+    offsets = offsets.to_arrow().to_pylist()
+    vertices = vertices.to_arrow().to_pylist()
+    assert len(offsets) == len(targets) + 1
+    for i, target in enumerate(targets):
+        expected = cugraph.utils.get_traversed_path_list(df, int(target))
+        assert vertices[offsets[i]:offsets[i + 1]] == expected
+
+    with pytest.raises(ValueError):
+        cugraph.utils.get_traversed_paths(df, [100000])
+
+
+@pytest.mark.parametrize("graph_file", utils.DATASETS_SMALL)
+def test_get_traversed_cost_batch(graph_file):
+    cu_M = utils.read_csv_file(graph_file)
+
+    G = cugraph.Graph()
+    G.from_cudf_edgelist(cu_M, source='0', destination='1', edge_attr='2')
+
+    sources = [0, 16, 33]
+    results = []
+    for source in sources:
+        df = cugraph.sssp(G, source)
+        df['source'] = source
+        results.append(df)
+    df = cudf.concat(results, ignore_index=True)
+    offsets = cudf.Series(np.arange(len(sources) + 1) *
+                          G.number_of_vertices())
+
+    for answer in [cugraph.utilities.get_traversed_cost_batch(G, df, offsets),
+                   cugraph.utilities.get_traversed_cost_batch(G, df)]:
+        assert answer.shape[0] == df.shape[0]
+        assert np.allclose(answer['distance'].values_host,
+                           answer['info'].values_host)
@@ -20,3 +20,4 @@ from cugraph.traversal.sssp import (
     shortest_path_length,
 )
 from cugraph.traversal.ms_bfs import concurrent_bfs, multi_source_bfs
+from cugraph.traversal.bfs_offload import OffloadedBFS
@@ -11,9 +11,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 import cudf
 
 from cugraph.traversal import bfs_wrapper
+from cugraph.traversal.host_graph import graph_csr, frontier_edges
+from cugraph.traversal.sssp import _ensure_output, _finalize_output
 from cugraph.structure.graph_classes import Graph, DiGraph
 from cugraph.utilities import (ensure_cugraph_obj,
                                is_matrix_type,
@@ -23,7 +27,7 @@ from cugraph.utilities import (ensure_cugraph_obj,
                                )
 
 
-def _ensure_args(G, start, i_start, directed):
+def _ensure_args(G, start, i_start, directed, return_predecessors):
     """
     Ensures the args passed in are usable for the API api_name and returns the
     args with proper defaults if not specified, or raises TypeError or
@@ -34,6 +38,9 @@ def _ensure_args(G, start, i_start, directed):
         raise TypeError("cannot specify both 'start' and 'i_start'")
     if (start is None) and (i_start is None):
         raise TypeError("must specify 'start' or 'i_start', but not both")
+    if (return_predecessors is not None) and \
+       (type(return_predecessors) != bool):
+        raise ValueError("'return_predecessors' must be a bool")
 
     G_type = type(G)
     # Check for Graph-type inputs
@@ -45,14 +52,19 @@ def _ensure_args(G, start, i_start, directed):
     start = start if start is not None else i_start
     if directed is None:
         directed = True
+    if return_predecessors is None:
+        return_predecessors = True
 
-    return (start, directed)
+    return (start, directed, return_predecessors)
 
 
-def _convert_df_to_output_type(df, input_type):
+def _convert_df_to_output_type(df, input_type, return_predecessors=True):
     """
     Given a cudf.DataFrame df, convert it to a new type appropriate for the
     graph algos in this module, based on input_type.
+
+    return_predecessors is only used for return values from cupy/scipy input
+    types.
     """
     if input_type in [Graph, DiGraph]:
         return df
@@ -67,10 +79,14 @@ def _convert_df_to_output_type(df, input_type):
         sorted_df = df.sort_values("vertex")
         if is_cp_matrix_type(input_type):
             distances = cp.fromDlpack(sorted_df["distance"].to_dlpack())
+            if not return_predecessors:
+                return distances
             preds = cp.fromDlpack(sorted_df["predecessor"].to_dlpack())
             return (distances, preds)
         else:
             distances = sorted_df["distance"].to_array()
+            if not return_predecessors:
+                return distances
             preds = sorted_df["predecessor"].to_array()
             return (distances, preds)
     else:
@@ -82,7 +98,8 @@ def bfs(G,
         depth_limit=None,
         i_start=None,
         directed=None,
-        return_predecessors=None):
+        return_predecessors=None,
+        output="dense"):
     """
     Find the distances and predecessors for a breadth first traversal of a
     graph.
@@ -112,6 +129,15 @@ def bfs(G,
         If True (default), then convert the input matrix to a cugraph.DiGraph,
         otherwise a cugraph.Graph object will be used.
 
+    return_predecessors : bool, optional (default=True)
+        If False, the predecessors are not returned, and not unrenumbered.
+
+    output : str, optional (default='dense')
+        'dense' returns all the vertices of the graph, 'sparse' only the
+        vertices reached from start, so that unrenumbering and copying the
+        result scale with the reached set.  Not supported for CuPy or SciPy
+        matrix inputs.
+
     Returns
     -------
     Return value type is based on the input type.  If G is a cugraph.Graph,
@@ -123,7 +149,8 @@ def bfs(G,
           df['distance'] path distance for each vertex from the starting vertex
 
           df['predecessor'] for each i'th position in the column, the vertex ID
-          immediately preceding the vertex at position i in the 'vertex' column
+          immediately preceding the vertex at position i in the 'vertex'
+          column, if return_predecessors is True
 
     If G is a networkx.Graph, returns:
 
@@ -156,13 +183,14 @@ def bfs(G,
     >>> df = cugraph.bfs(G, 0)
 
     """
-    (start, directed) = \
-        _ensure_args(G, start, i_start, directed)
+    (start, directed, return_predecessors) = \
+        _ensure_args(G, start, i_start, directed, return_predecessors)
 
     # FIXME: allow nx_weight_attr to be specified
     (G, input_type) = ensure_cugraph_obj(
         G, nx_weight_attr="weight",
         matrix_graph_type=DiGraph if directed else Graph)
+    _ensure_output(output, input_type)
 
     # The BFS C++ extension assumes the start vertex is a cudf.Series object,
     # and operates on internal vertex IDs if renumbered.
@@ -175,18 +203,182 @@ def bfs(G,
         start = cudf.Series(start)
 
     df = bfs_wrapper.bfs(G, start, depth_limit)
-    if G.renumbered:
-        df = G.unrenumber(df, "vertex")
-        df = G.unrenumber(df, "predecessor")
-        df.fillna(-1, inplace=True)
+    df = _finalize_output(G, df, output, return_predecessors)
+
+    return _convert_df_to_output_type(df, input_type, return_predecessors)
 
-    return _convert_df_to_output_type(df, input_type)
 
+# Direction-optimizing BFS switches to bottom-up steps when the edges
+# leaving the frontier outnumber the edges into the unvisited vertices by
+# more than ALPHA, and back to top-down steps when the frontier holds less
+# than 1 / BETA of the vertices.
+ALPHA = 14
+BETA = 24
+# Number of in-edges of every unvisited vertex checked one at a time by a
+# bottom-up step before the remaining in-edges are scanned at once
+BOTTOM_UP_ROUNDS = 4
 
-def bfs_edges(G, source, reverse=False, depth_limit=None, sort_neighbors=None):
+
+def _top_down_step(offsets, indices, frontier, visited):
     """
-    Find the distances and predecessors for a breadth first traversal of a
-    graph.
+    Return the unvisited neighbors of the frontier and one parent in the
+    frontier for each, found by scanning the edges leaving the frontier.
+    """
+    owners, positions = frontier_edges(offsets, frontier)
+    children = indices[positions]
+    unvisited = ~visited[children]
+    children, parents = children[unvisited], frontier[owners[unvisited]]
+    children, first = np.unique(children, return_index=True)
+    return children, parents[first]
+
+
+def _bottom_up_step(t_offsets, t_indices, frontier, visited):
+    """
+    Return the unvisited vertices with a parent in the frontier, and that
+    parent, found by scanning the in-edges of the unvisited vertices.  Most
+    vertices find a parent within their first in-edges when the frontier is
+    large, so these are checked one at a time before the others.
+    """
+    in_frontier = np.zeros(len(visited), dtype=bool)
+    in_frontier[frontier] = True
+    candidates = np.flatnonzero(~visited)
+    starts = t_offsets[candidates]
+    degrees = t_offsets[candidates + 1] - starts
+    children = []
+    parents = []
+
+    for k in range(BOTTOM_UP_ROUNDS):
+        left = degrees > k
+        candidates, starts, degrees = \
+            candidates[left], starts[left], degrees[left]
+        if len(candidates) == 0:
+            break
+        candidate_parents = t_indices[starts + k]
+        hit = in_frontier[candidate_parents]
+        children.append(candidates[hit])
+        parents.append(candidate_parents[hit])
+        candidates, starts, degrees = \
+            candidates[~hit], starts[~hit], degrees[~hit]
+
+    left = degrees > BOTTOM_UP_ROUNDS
+    candidates, starts, degrees = \
+        candidates[left], starts[left], degrees[left]
+    if len(candidates) > 0:
+        counts = degrees - BOTTOM_UP_ROUNDS
+        owners = np.repeat(np.arange(len(candidates)), counts)
+        first = np.cumsum(counts) - counts
+        positions = np.arange(counts.sum()) + \
+            np.repeat(starts + BOTTOM_UP_ROUNDS - first, counts)
+        candidate_parents = t_indices[positions]
+        hit = in_frontier[candidate_parents]
+        owners, first_hit = np.unique(owners[hit], return_index=True)
+        children.append(candidates[owners])
+        parents.append(candidate_parents[hit][first_hit])
+
+    if len(children) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    children = np.concatenate(children)
+    parents = np.concatenate(parents)
+    order = np.argsort(children)
+    return children[order], parents[order]
+
+
+def _direction_optimizing_bfs(csr, csc, source, depth_limit=None):
+    """
+    Run a BFS from source over the host (offsets, indices) csr, with csc its
+    transpose, switching between top-down and bottom-up steps.  The
+    traversal stops after depth_limit levels.
+
+    Returns the parents, vertices and distances of the reached vertices
+    other than source, in BFS order.
+    """
+    offsets, indices = csr
+    t_offsets, t_indices = csc
+    num_vertices = len(offsets) - 1
+    out_degrees = np.diff(offsets)
+    in_degrees = np.diff(t_offsets)
+
+    visited = np.zeros(num_vertices, dtype=bool)
+    visited[source] = True
+    frontier = np.array([source], dtype=np.int64)
+    unvisited_edges = len(t_indices) - in_degrees[source]
+    levels = []
+    bottom_up = False
+    depth = 0
+    while len(frontier) > 0 and (depth_limit is None or depth < depth_limit):
+        depth += 1
+        if bottom_up:
+            bottom_up = len(frontier) * BETA >= num_vertices
+        else:
+            bottom_up = out_degrees[frontier].sum() * ALPHA > unvisited_edges
+        if bottom_up:
+            children, parents = _bottom_up_step(t_offsets, t_indices,
+                                                frontier, visited)
+        else:
+            children, parents = _top_down_step(offsets, indices, frontier,
+                                               visited)
+        visited[children] = True
+        unvisited_edges -= in_degrees[children].sum()
+        levels.append((parents, children,
+                       np.full(len(children), depth, dtype=np.int32)))
+        frontier = children
+
+    if len(levels) == 0:
+        return (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.int32))
+    return tuple(np.concatenate(column) for column in zip(*levels))
+
+
+class BFSEdges:
+    """
+    Tree edges of a breadth first traversal, in BFS order.  The edges are
+    kept as host or device arrays of internal vertex ids, and only converted
+    to a cudf.DataFrame with external vertex ids when first used.
+
+    Iterating over a BFSEdges yields (u, v) tuples like networkx.bfs_edges.
+    """
+
+    def __init__(self, G, parents, children, distances):
+        self._G = G
+        self._parents = parents
+        self._children = children
+        self._distances = distances
+        self._frame = None
+
+    def __len__(self):
+        return len(self._children)
+
+    def __iter__(self):
+        df = self.to_frame().to_pandas()
+        return zip(df["src"], df["dst"])
+
+    def to_frame(self):
+        """
+        Return the tree edges as a cudf.DataFrame:
+
+          df['src'] the parent of each vertex in the BFS tree
+
+          df['dst'] the vertex
+
+          df['distance'] the distance of the vertex from the source
+        """
+        if self._frame is None:
+            df = cudf.DataFrame()
+            df["src"] = self._parents.astype(np.int32)
+            df["dst"] = self._children.astype(np.int32)
+            df["distance"] = self._distances
+            if self._G.renumbered:
+                df = self._G.unrenumber(df, "src", preserve_order=True)
+                df = self._G.unrenumber(df, "dst", preserve_order=True)
+            self._frame = df
+        return self._frame
+
+
+def bfs_edges(G, source, reverse=False, depth_limit=None, sort_neighbors=None,
+              engine="gpu"):
+    """
+    Find the edges of a breadth first traversal tree of a graph, like
+    networkx.bfs_edges.
 
     Parameters
     ----------
@@ -199,8 +391,7 @@ def bfs_edges(G, source, reverse=False, depth_limit=None, sort_neighbors=None):
         The starting vertex index
 
     reverse : boolean
-        If a directed graph, then process edges in a reverse direction
-        Currently not implemented
+        If a directed graph, then process edges in a reverse direction.
 
     depth_limit : Int or None
         Limit the depth of the search
@@ -208,40 +399,21 @@ def bfs_edges(G, source, reverse=False, depth_limit=None, sort_neighbors=None):
     sort_neighbors : None or Function
         Currently not implemented
 
+    engine : str, optional (default='gpu')
+        'gpu' runs the BFS on the device, over the transposed graph if
+        reverse is True.  'cpu' runs a direction-optimizing BFS on host
+        copies of the CSR and CSC cached on the graph, which alternates
+        top-down and bottom-up steps and stops expanding the frontier at
+        depth_limit.
+
     Returns
     -------
-    Return value type is based on the input type.  If G is a cugraph.Graph,
-    returns:
-
-       cudf.DataFrame
-          df['vertex'] vertex IDs
-
-          df['distance'] path distance for each vertex from the starting vertex
-
-          df['predecessor'] for each i'th position in the column, the vertex ID
-          immediately preceding the vertex at position i in the 'vertex' column
-
-    If G is a networkx.Graph, returns:
-
-       pandas.DataFrame with contents equivalent to the cudf.DataFrame
-       described above.
-
-    If G is a CuPy or SciPy matrix, returns:
-       a 2-tuple of CuPy ndarrays (if CuPy matrix input) or Numpy ndarrays (if
-       SciPy matrix input) representing:
-
-       distance: cupy or numpy ndarray
-          ndarray of shortest distances between source and vertex.
-
-       predecessor: cupy or numpy ndarray
-          ndarray of predecessors of a vertex on the path from source, which
-          can be used to reconstruct the shortest paths.
-
-       ...or if return_sp_counter is True, returns a 3-tuple with the above two
-       arrays plus:
-
-       sp_counter: cupy or numpy ndarray
-          ndarray of number of shortest paths leading to each vertex.
+    BFSEdges
+        The tree edges in BFS order, which iterates over (u, v) tuples like
+        networkx.bfs_edges, and whose to_frame() returns a cudf.DataFrame
+        with df['src'], df['dst'] and df['distance'].  Both engines return
+        the same tree edges up to the choice of parent among the vertices
+        of the previous level.
 
     Examples
     --------
@@ -249,12 +421,42 @@ def bfs_edges(G, source, reverse=False, depth_limit=None, sort_neighbors=None):
     >>>                   dtype=['int32', 'int32', 'float32'], header=None)
     >>> G = cugraph.Graph()
     >>> G.from_cudf_edgelist(M, source='0', destination='1')
-    >>> df = cugraph.bfs_edges(G, 0)
+    >>> df = cugraph.bfs_edges(G, 0).to_frame()
+    >>> edges = list(cugraph.bfs_edges(G, 0, depth_limit=2, engine='cpu'))
     """
+    if engine not in ("gpu", "cpu"):
+        raise ValueError("engine must be 'gpu' or 'cpu'")
 
-    if reverse is True:
-        raise NotImplementedError(
-            "reverse processing of graph is currently not supported"
-        )
-
-    return bfs(G, source, depth_limit)
+    (G, _) = ensure_cugraph_obj(G, nx_weight_attr="weight",
+                                matrix_graph_type=DiGraph)
+    if G.renumbered is True:
+        source = G.lookup_internal_vertex_id(cudf.Series([source]))[0]
+        if source is cudf.NA:
+            raise ValueError("Graph does not contain source vertex")
+    if not 0 <= source < G.number_of_vertices():
+        raise ValueError("Graph does not contain source vertex")
+
+    if engine == "gpu":
+        traversed = G
+        if reverse and G.is_directed():
+            # The edge list holds internal ids, the transposed graph shares
+            # them
+            edges = G.edgelist.edgelist_df
+            traversed = DiGraph()
+            traversed.from_cudf_edgelist(edges, source="dst",
+                                         destination="src", renumber=False)
+        df = bfs_wrapper.bfs(traversed,
+                             cudf.Series([source], dtype=np.int32),
+                             depth_limit)
+        # The source and the unreached vertices have no predecessor
+        df = df[df["predecessor"] != -1].sort_values("distance")
+        return BFSEdges(G, df["predecessor"].values, df["vertex"].values,
+                        df["distance"].values)
+
+    csr = graph_csr(G)[:2]
+    csc = graph_csr(G, transposed=True)[:2]
+    if reverse and G.is_directed():
+        csr, csc = csc, csr
+    parents, children, distances = _direction_optimizing_bfs(
+        csr, csc, source, depth_limit)
+    return BFSEdges(G, parents, children, distances)
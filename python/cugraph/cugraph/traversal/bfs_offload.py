@@ -0,0 +1,233 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Disk offload of the multi-source BFS output.
+#
+# The output directory holds a JSON header, the (vertex, distance,
+# predecessor) rows of every source and an offsets index.  The rows are
+# appended batch by batch while the traversals run, grouped by source in the
+# order of the sources, either as one raw little-endian file per column
+# ('binary', which can be memory-mapped) or as a Parquet file with one row
+# group per batch ('parquet').  The offsets index holds the first row of
+# each source, followed by the number of rows, so the result of one source
+# is read back without scanning the others.
+
+import json
+import os
+
+import numpy as np
+import pyarrow.parquet as pq
+import cudf
+
+from cugraph.structure.graph_snapshot import _read_array, _write_array
+
+
+OFFLOAD_FORMAT = "cugraph-ms-bfs"
+OFFLOAD_VERSION = 1
+HEADER_FILE = "header.json"
+PARQUET_FILE = "bfs.parquet"
+COLUMNS = ["vertex", "distance", "predecessor"]
+
+
+class BFSOutputWriter:
+    """
+    Write the multi-source BFS output to the directory path, one batch of
+    sources at a time.  file_format is 'binary' or 'parquet'.
+    """
+
+    def __init__(self, path, source_names, file_format="binary"):
+        if file_format not in ("binary", "parquet"):
+            raise ValueError("file_format must be 'binary' or 'parquet', "
+                             f"got: {file_format}")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.source_names = source_names
+        self.file_format = file_format
+        self.counts = np.zeros(len(source_names), dtype=np.int64)
+        self.columns = {}
+        self.row_groups = []
+        if file_format == "binary":
+            self.files = {
+                name: open(os.path.join(path, name + ".bin"), "wb")
+                for name in COLUMNS
+            }
+        else:
+            self.parquet_writer = None
+
+    def write(self, source_pos, df):
+        """
+        Append the rows of df, the 'vertex', 'distance' and 'predecessor'
+        columns of the sources at positions source_pos, grouped by source in
+        increasing position.
+        """
+        self.counts += np.bincount(source_pos, minlength=len(self.counts))
+        if self.file_format == "binary":
+            for name in COLUMNS:
+                if df[name].dtype == object:
+                    raise ValueError("the 'binary' format only supports "
+                                     "numeric vertex ids, use 'parquet'")
+                values = df[name].values_host
+                values = values.astype(values.dtype.newbyteorder("<"),
+                                       copy=False)
+                values.tofile(self.files[name])
+                self.columns[name] = values.dtype.str
+        else:
+            table = df[COLUMNS].to_arrow(preserve_index=False)
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(
+                    os.path.join(self.path, PARQUET_FILE), table.schema)
+            self.parquet_writer.write_table(table,
+                                            row_group_size=max(len(table), 1))
+            self.row_groups.append(len(table))
+
+    def close(self):
+        """
+        Write the offsets index and the header.  The header is written last,
+        so an interrupted traversal does not leave an output that looks
+        complete.
+        """
+        offsets = np.zeros(len(self.counts) + 1, dtype=np.int64)
+        np.cumsum(self.counts, out=offsets[1:])
+        num_rows = int(offsets[-1])
+
+        if self.file_format == "binary":
+            for f in self.files.values():
+                f.close()
+            columns = {
+                name: {"file": name + ".bin", "dtype": dtype,
+                       "length": num_rows}
+                for name, dtype in self.columns.items()
+            }
+        else:
+            if self.parquet_writer is not None:
+                self.parquet_writer.close()
+            columns = None
+
+        header = {
+            "format": OFFLOAD_FORMAT,
+            "version": OFFLOAD_VERSION,
+            "file_format": self.file_format,
+            "sources": self.source_names,
+            "num_rows": num_rows,
+            "offsets": _write_array(self.path, "offsets", offsets),
+            "columns": columns,
+            "row_groups": self.row_groups,
+        }
+        header_file = os.path.join(self.path, HEADER_FILE)
+        with open(header_file + ".tmp", "w") as f:
+            json.dump(header, f, indent=2)
+        os.replace(header_file + ".tmp", header_file)
+
+
+class OffloadedBFS:
+    """
+    Multi-source BFS output written to disk by multi_source_bfs.  The
+    result of each source is read on demand, the binary columns being
+    memory-mapped if mmap is True.
+
+    Parameters
+    ----------
+    path : str
+        Output directory of multi_source_bfs.
+    mmap : bool, optional (default=True)
+        Memory-map the binary columns instead of reading the requested rows
+        from the files.
+
+    Examples
+    --------
+    >>> output = cugraph.multi_source_bfs(G, sources, offload=True,
+    >>>                                   offload_path="bfs_output")
+    >>> df = output.read_source(sources[0])
+    """
+
+    def __init__(self, path, mmap=True):
+        header_file = os.path.join(path, HEADER_FILE)
+        if not os.path.isfile(header_file):
+            raise FileNotFoundError(f"{path} is not a multi-source BFS "
+                                    "output")
+        with open(header_file) as f:
+            header = json.load(f)
+        if header.get("format") != OFFLOAD_FORMAT:
+            raise ValueError(f"{path} is not a multi-source BFS output")
+        if header.get("version") != OFFLOAD_VERSION:
+            raise ValueError("unsupported multi-source BFS output version "
+                             f"{header.get('version')}")
+
+        self.path = path
+        self.header = header
+        self.sources = header["sources"]
+        self.offsets = _read_array(path, header["offsets"], mmap=False)
+        if header["file_format"] == "binary":
+            self.columns = {
+                name: _read_array(path, entry, mmap)
+                for name, entry in header["columns"].items()
+            }
+        else:
+            self.row_group_offsets = np.zeros(len(header["row_groups"]) + 1,
+                                              dtype=np.int64)
+            np.cumsum(header["row_groups"], out=self.row_group_offsets[1:])
+
+    def __len__(self):
+        return len(self.sources)
+
+    def read(self, i):
+        """
+        Return the 'vertex', 'distance' and 'predecessor' of the vertices
+        reached from the i-th source as a cudf.DataFrame.
+        """
+        if not 0 <= i < len(self.sources):
+            raise IndexError(f"source index {i} out of range")
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1])
+
+        if self.header["file_format"] == "binary":
+            df = cudf.DataFrame()
+            for name in COLUMNS:
+                if name in self.columns:
+                    df[name] = np.asarray(self.columns[name][start:end])
+            return df
+
+        # Only read the row groups holding rows [start, end)
+        first = np.searchsorted(self.row_group_offsets, start,
+                                side="right") - 1
+        last = np.searchsorted(self.row_group_offsets, end, side="left")
+        row_groups = list(range(first, max(last, first + 1)))
+        table = pq.ParquetFile(os.path.join(self.path, PARQUET_FILE)) \
+            .read_row_groups(row_groups, columns=COLUMNS)
+        table = table.slice(int(start - self.row_group_offsets[first]),
+                            end - start)
+        return cudf.DataFrame.from_arrow(table)
+
+    def read_source(self, source):
+        """
+        Return the 'vertex', 'distance' and 'predecessor' of the vertices
+        reached from source as a cudf.DataFrame.
+        """
+        if source not in self.sources:
+            raise ValueError(f"{source} is not one of the sources")
+        return self.read(self.sources.index(source))
+
+    def read_all(self):
+        """
+        Return the rows of all the sources, grouped by source, as a
+        cudf.DataFrame along with the offsets of each source.
+        """
+        if self.header["file_format"] == "binary":
+            df = cudf.DataFrame()
+            for name in COLUMNS:
+                if name in self.columns:
+                    df[name] = np.asarray(self.columns[name])
+        else:
+            df = cudf.DataFrame.from_arrow(
+                pq.read_table(os.path.join(self.path, PARQUET_FILE),
+                              columns=COLUMNS))
+        return df, cudf.Series(self.offsets)
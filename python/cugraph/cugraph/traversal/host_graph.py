@@ -0,0 +1,74 @@
+# Copyright (c) 2021, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Host (numpy) CSR views of the traversal inputs, used by the CPU traversal
+# engines.  Vertex ids are the internal ids of the cugraph graph, or the row
+# and column indices of a matrix input.
+
+import numpy as np
+
+from cugraph.utilities import (is_cp_matrix_type,
+                               cupy_package as cp,
+                               )
+
+
+def csr_from_coo(row, col, data, num_vertices):
+    """
+    Build a host CSR from COO arrays.  The edges of each row keep their
+    input order.
+    """
+    order = np.argsort(row, kind="stable")
+    offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row, minlength=num_vertices), out=offsets[1:])
+    return (offsets, col[order],
+            None if data is None else data[order])
+
+
+def matrix_csr(M, symmetrize=True):
+    """
+    Return the host CSR (offsets, indices, weights) of a CuPy or SciPy
+    sparse matrix over max(M.shape) vertices, symmetrized by default like
+    the undirected cugraph.Graph built from a matrix input.
+    """
+    coo = M.tocoo()
+    if is_cp_matrix_type(type(M)):
+        row, col, data = (cp.asnumpy(coo.row), cp.asnumpy(coo.col),
+                          cp.asnumpy(coo.data))
+    else:
+        row, col, data = coo.row, coo.col, coo.data
+    if symmetrize:
+        row, col = np.concatenate([row, col]), np.concatenate([col, row])
+        data = np.concatenate([data, data])
+    return csr_from_coo(row, col, data, max(M.shape))
+
+
+def graph_csr(G, transposed=False):
+    """
+    Return the host CSR (or the CSC if transposed) of a single-GPU cugraph
+    graph as numpy arrays (offsets, indices, weights).  weights is None for
+    unweighted graphs.  The host copies are cached on the graph.
+    """
+    return G.view_host_adj_list(transposed)
+
+
+def frontier_edges(offsets, frontier):
+    """
+    Return, for every edge leaving the vertices of frontier, the position of
+    its source in frontier and the position of the edge in the CSR.
+    """
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    owners = np.repeat(np.arange(len(frontier)), counts)
+    first = np.cumsum(counts) - counts
+    positions = np.arange(counts.sum()) + np.repeat(starts - first, counts)
+    return owners, positions
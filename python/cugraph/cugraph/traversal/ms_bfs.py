@@ -11,13 +11,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
+import warnings
+
 import numpy as np
 import cudf
 
-import warnings
+from cugraph.structure.graph_classes import null_check
+from cugraph.traversal import bfs_wrapper
+from cugraph.traversal.bfs_offload import BFSOutputWriter, OffloadedBFS
+from cugraph.traversal.host_graph import graph_csr, frontier_edges
+from cugraph.utilities.utils import get_device_memory_info
+
 
+# Number of sources traversed at once by the bitset engine, one bit of a
+# 64-bit word per source
+BITSET_WIDTH = 64
 
-def _get_feasibility(G, sources, components=None, depth_limit=None):
+
+def _get_memory_bound(engine):
+    """
+    Return the memory available to the engine in Bytes: the device memory
+    for the 'gpu' engine, the physical host memory for the 'cpu' engine.
+    """
+    if engine == "cpu":
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    return get_device_memory_info()
+
+
+def _get_feasibility(G, sources, components=None, depth_limit=None,
+                     engine="gpu", warn=True):
     """
     Evaluate the feasibility for breadth first traversal from multiple sources
     in a graph.
@@ -48,16 +72,22 @@ def _get_feasibility(G, sources, components=None, depth_limit=None):
         components['color'] : cudf.Series
             component IDs/color for vertices.
 
+    engine : str, optional, default='gpu'
+        Engine running the traversals, 'gpu' or 'cpu'. The footprint is
+        compared to the device memory for 'gpu' and to the host memory for
+        'cpu'.
+
+    warn : bool, optional, default=True
+        Warn when the footprint exceeds the memory of the engine.  Callers
+        that offload the output in that case disable the warning.
+
     Returns
     -------
     mem_footprint : integer
         Estimated memory foot print size in Bytes
     """
 
-    # Fixme not implemented in RMM yet
-    # using 96GB upper bound for now
-    # mem = get_device_memory_info()
-    mem = 9.6e10
+    mem = _get_memory_bound(engine)
     n_sources = sources.size
     V = G.number_of_vertices()
     E = G.number_of_edges()
@@ -65,18 +95,11 @@ def _get_feasibility(G, sources, components=None, depth_limit=None):
     n_components = 1
 
     # Retreive types
-    size_of_v = 4
-    size_of_e = 4
+    size_of_v = G.adjlist.offsets.dtype.itemsize
+    size_of_e = G.adjlist.indices.dtype.itemsize
     size_of_w = 0
     if G.adjlist.weights is not None:
-        if G.adjlist.weights.dtype is np.float64:
-            size_of_w = 8
-        else:
-            size_of_w = 4
-    if G.adjlist.offsets.dtype is np.float64:
-        size_of_v = 8
-    if G.adjlist.indices.dtype is np.float64:
-        size_of_e = 8
+        size_of_w = G.adjlist.weights.dtype.itemsize
 
     # Graph size
     G_sz = E * size_of_e + E * size_of_w + V * size_of_v
@@ -97,21 +120,261 @@ def _get_feasibility(G, sources, components=None, depth_limit=None):
                 "High number of seeds per component result in large output."
             )
         mean_component_sz = tmp.mean()
-        output_sz = mean_component_sz * n_sources * 2 * size_of_e
+        output_sz = mean_component_sz * n_sources * 3 * size_of_e
 
     # counting 10% for context, handle and temporary allocations
     mem_footprint = (G_sz + output_sz) * 1.1
-    if mem_footprint > mem:
+    if warn and mem_footprint > mem:
         warnings.warn(f"Cannot execute in-memory :{mem_footprint} Bytes")
 
     return mem_footprint
 
 
-def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False):
+def _bitset_bfs(offsets, indices, sources, depth_limit=None):
+    """
+    Run a BFS from each of the (at most BITSET_WIDTH) sources at once over a
+    host CSR.  Bit i of the frontier and visited words of a vertex is set
+    when the BFS from sources[i] reaches the vertex, so each level scans the
+    edges leaving the frontier once for all the sources.
+
+    Returns the source positions, vertices, distances and predecessors of
+    the reached (source, vertex) pairs, in the order they were reached.
+    """
+    num_vertices = len(offsets) - 1
+    n_sources = len(sources)
+    bits = np.left_shift(np.uint64(1),
+                         np.arange(n_sources, dtype=np.uint64))
+    visited = np.zeros(num_vertices, dtype=np.uint64)
+    np.bitwise_or.at(visited, sources, bits)
+    frontier = visited.copy()
+
+    reached = [(np.arange(n_sources, dtype=np.int32),
+                sources.astype(np.int32),
+                np.zeros(n_sources, dtype=np.int32),
+                np.full(n_sources, -1, dtype=np.int32))]
+    depth = 0
+    active = np.flatnonzero(frontier)
+    while len(active) > 0 and (depth_limit is None or depth < depth_limit):
+        depth += 1
+        owners, positions = frontier_edges(offsets, active)
+        src = active[owners]
+        dst = indices[positions]
+        new = frontier[src] & ~visited[dst]
+        discovering = new != 0
+        src, dst, new = src[discovering], dst[discovering], new[discovering]
+
+        # The words stay packed: only their nonzero bytes are unpacked, so
+        # the temporaries grow with the number of newly set bits rather than
+        # with 64 bytes per edge
+        new_bytes = new.astype("<u8").view(np.uint8).reshape(-1, 8)
+        edge, byte = np.nonzero(new_bytes)
+        hit, bit = np.nonzero(np.unpackbits(
+            new_bytes[edge, byte][:, np.newaxis], axis=1, bitorder="little"))
+        edge = edge[hit]
+        source_pos = byte[hit] * 8 + bit
+
+        # Keep the first edge reaching each vertex from each source
+        vertex = dst[edge]
+        _, first = np.unique(
+            vertex.astype(np.int64) * BITSET_WIDTH + source_pos,
+            return_index=True)
+        vertex = vertex[first]
+        source_pos = source_pos[first]
+        predecessor = src[edge[first]]
+
+        frontier = np.zeros(num_vertices, dtype=np.uint64)
+        np.bitwise_or.at(frontier, vertex, bits[source_pos])
+        visited |= frontier
+        reached.append((source_pos.astype(np.int32),
+                        vertex.astype(np.int32),
+                        np.full(len(vertex), depth, dtype=np.int32),
+                        predecessor.astype(np.int32)))
+        active = np.flatnonzero(frontier)
+
+    return tuple(np.concatenate(column) for column in zip(*reached))
+
+
+def _cpu_bfs_batches(offsets, indices, sources, depth_limit):
+    """
+    Run the BFS from the vertices sources of the host CSR with the bitset
+    engine, BITSET_WIDTH sources at a time, yielding the reached (source
+    position, vertex, distance, predecessor) of each batch.
+    """
+    for start in range(0, len(sources), BITSET_WIDTH):
+        source_pos, vertex, distance, predecessor = _bitset_bfs(
+            offsets, indices, sources[start:start + BITSET_WIDTH],
+            depth_limit)
+        yield source_pos + start, vertex, distance, predecessor
+
+
+def _gpu_bfs_batches(G, sources, depth_limit):
+    """
+    Run the BFS from the internal vertex ids sources on the device, one
+    source at a time, yielding the reached (source position, vertex,
+    distance, predecessor) of each source.
+    """
+    unreachable = np.iinfo(np.int32).max
+    for i, source in enumerate(sources.tolist()):
+        df = bfs_wrapper.bfs(G, cudf.Series([source], dtype=np.int32),
+                             depth_limit)
+        df = df[df["distance"] != unreachable]
+        distance = df["distance"].values_host
+        order = np.argsort(distance, kind="stable")
+        yield (np.full(len(df), i, dtype=np.int32),
+               df["vertex"].values_host[order],
+               distance[order],
+               df["predecessor"].values_host[order])
+
+
+def _bfs_batches(G, sources, depth_limit, engine):
+    if engine == "cpu":
+        offsets, indices, _ = graph_csr(G)
+        return _cpu_bfs_batches(offsets, indices, sources, depth_limit)
+    return _gpu_bfs_batches(G, sources, depth_limit)
+
+
+def _reached_frame(G, vertex, distance, predecessor, base=0):
+    """
+    Return the reached vertices as a cudf.DataFrame with external vertex
+    ids, in the order of the arrays.  base is the first vertex of G in the
+    block-diagonal CSR the vertices come from.
+    """
+    if base != 0:
+        vertex = vertex - base
+        predecessor = np.where(predecessor >= 0, predecessor - base, -1)
+    df = cudf.DataFrame()
+    df["vertex"] = vertex.astype(np.int32)
+    df["distance"] = distance
+    df["predecessor"] = predecessor.astype(np.int32)
+    if G.renumbered:
+        df = G.unrenumber(df, "vertex", preserve_order=True)
+        df = G.unrenumber(df, "predecessor", preserve_order=True)
+        df.fillna(-1, inplace=True)
+    return df
+
+
+def _sparse_output(G, n_sources, source_pos, vertex, distance, predecessor):
+    """
+    Return the reached vertices grouped by source, with the offsets of each
+    source in the returned DataFrame.
+    """
+    order = np.argsort(source_pos, kind="stable")
+    offsets = np.zeros(n_sources + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source_pos, minlength=n_sources), out=offsets[1:])
+    df = _reached_frame(G, vertex[order], distance[order],
+                        predecessor[order])
+    return df, cudf.Series(offsets)
+
+
+def _offload_output(Graphs, paths, source_names, source_starts, bases,
+                    batches, file_format):
+    """
+    Write the reached vertices of each batch to disk as soon as the batch
+    is traversed, and return one OffloadedBFS per graph reading them back.
+    The sources of Graphs[i] are at positions [source_starts[i],
+    source_starts[i + 1]) and its vertices start at bases[i].
+    """
+    writers = {}
+    closed = set()
+
+    def writer(i):
+        if i not in writers:
+            writers[i] = BFSOutputWriter(paths[i], source_names[i],
+                                         file_format)
+        return writers[i]
+
+    for source_pos, vertex, distance, predecessor in batches:
+        order = np.argsort(source_pos, kind="stable")
+        source_pos, vertex, distance, predecessor = (
+            source_pos[order], vertex[order], distance[order],
+            predecessor[order])
+
+        # A batch can hold the sources of several graphs
+        graph_ids = np.searchsorted(source_starts, source_pos,
+                                    side="right") - 1
+        bounds = np.flatnonzero(np.diff(graph_ids)) + 1
+        for first, last in zip(np.concatenate([[0], bounds]),
+                               np.concatenate([bounds, [len(source_pos)]])):
+            i = graph_ids[first]
+            writer(i).write(
+                source_pos[first:last] - source_starts[i],
+                _reached_frame(Graphs[i], vertex[first:last],
+                               distance[first:last],
+                               predecessor[first:last], bases[i]))
+
+        # Every source reaches itself, so the batch ends after the largest
+        # source position and the graphs before it are complete
+        batch_end = source_pos[-1] + 1
+        for i in [i for i in writers if source_starts[i + 1] <= batch_end]:
+            writers.pop(i).close()
+            closed.add(i)
+
+    for i in range(len(Graphs)):
+        if i not in closed:
+            writer(i).close()
+    return [OffloadedBFS(path) for path in paths]
+
+
+def _dense_output(G, source_names, source_pos, vertex, distance,
+                  predecessor):
+    """
+    Return one distance and one predecessor column per source for all the
+    vertices of G.  Unreachable vertices have the maximum int32 distance and
+    a -1 predecessor, like in bfs.
+    """
+    num_vertices = G.number_of_vertices()
+    distances = np.full((len(source_names), num_vertices),
+                        np.iinfo(np.int32).max, dtype=np.int32)
+    predecessors = np.full((len(source_names), num_vertices), -1,
+                           dtype=np.int32)
+    distances[source_pos, vertex] = distance
+    predecessors[source_pos, vertex] = predecessor
+
+    df = cudf.DataFrame()
+    df["vertex"] = np.arange(num_vertices, dtype=np.int32)
+    for i, name in enumerate(source_names):
+        df[f"distance_{name}"] = distances[i]
+        df[f"predecessor_{name}"] = predecessors[i]
+    if G.renumbered:
+        for column in ["vertex"] + [f"predecessor_{name}"
+                                    for name in source_names]:
+            df = G.unrenumber(df, column, preserve_order=True)
+        df.fillna(-1, inplace=True)
+    return df
+
+
+def _block_diagonal_csr(Graphs):
+    """
+    Concatenate the host CSRs of Graphs into a single block-diagonal CSR.
+    Returns the CSR offsets and indices, and the first vertex of each graph
+    followed by the total number of vertices.
+    """
+    offsets = [np.zeros(1, dtype=np.int64)]
+    indices = []
+    bases = np.zeros(len(Graphs) + 1, dtype=np.int64)
+    num_edges = 0
+    for i, G in enumerate(Graphs):
+        graph_offsets, graph_indices, _ = graph_csr(G)
+        offsets.append(graph_offsets[1:].astype(np.int64) + num_edges)
+        indices.append(graph_indices + bases[i])
+        num_edges += len(graph_indices)
+        bases[i + 1] = bases[i] + len(graph_offsets) - 1
+    if bases[-1] >= np.iinfo(np.int32).max:
+        raise ValueError("too many vertices to traverse the graphs at once")
+    return (np.concatenate(offsets),
+            np.concatenate(indices).astype(np.int32), bases)
+
+
+def concurrent_bfs(Graphs, sources, depth_limit=None, offload=None,
+                   offload_path=None, offload_format="binary"):
     """
     Find the breadth first traversals of multiple graphs with multiple sources
     in each graph.
 
+    The graphs are concatenated in a single block-diagonal graph on the host,
+    which is traversed from all the sources at once with the bitset engine
+    of multi_source_bfs, so small graphs share the cost of each traversal.
+
     Parameters
     ----------
     Graphs : list of cugraph.Graph or cugraph.DiGraph
@@ -129,30 +392,44 @@ def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False):
         Limit the depth of the search. Terminates if no more vertices are
         reachable within the distance of depth_limit
 
-    offload : boolean, optional, default=False
+    offload : boolean, optional, default=None
         Indicates if output should be written to the disk.
         When not provided, the algorithms decides if offloading is needed
         based on the input parameters.
 
+    offload_path : str, optional, default=None
+        Directory the output is written to when offloading, one
+        subdirectory per graph. A temporary directory is created when not
+        provided.
+
+    offload_format : str, optional, default='binary'
+        'binary' or 'parquet', see multi_source_bfs.
+
     Returns
     -------
     Return type is decided based on the input parameters (size of
     sources, size of the graph, number of graphs and offload setting)
 
-    If G is a cugraph.Graph and output fits in memory:
+    If the output fits in memory, returns a list with one tuple per graph:
         BFS_edge_lists : cudf.DataFrame
-            GPU data frame containing all BFS edges
+            GPU data frame containing all BFS edges: the 'vertex', 'distance'
+            and 'predecessor' of each vertex reached from each source of the
+            graph, grouped by source in the order of the sources.
         source_offsets: cudf.Series
             Series containing the starting offset in the returned edge list
-            for each source.
+            for each source, followed by the size of the edge list.
 
     If offload is True, or if the output does not fit in memory :
-        Writes csv files containing BFS output to the disk.
+        Writes the BFS output of each graph to the disk, and returns a list
+        with one cugraph.traversal.bfs_offload.OffloadedBFS per graph.
+
+    Examples
+    --------
+    >>> Graphs = [G1, G2]
+    >>> sources = [cudf.Series([0, 3]), cudf.Series([1])]
+    >>> results = cugraph.concurrent_bfs(Graphs, sources)
+    >>> edge_list, source_offsets = results[0]
     """
-    raise NotImplementedError(
-        "concurrent_bfs is coming soon! Please up vote the github issue 1465\
-             to help us prioritize"
-    )
     if not isinstance(Graphs, list):
         raise TypeError(
             "Graphs should be a list of cugraph.Graph or cugraph.DiGraph"
@@ -164,28 +441,76 @@ def concurrent_bfs(Graphs, sources, depth_limit=None, offload=False):
             "The size of the sources list must match\
              the size of the graph list."
         )
-    if offload is True:
-        raise NotImplementedError(
-            "Offloading is coming soon! Please up vote the github issue 1461\
-             to help us prioritize"
-        )
+    if len(Graphs) == 0:
+        raise ValueError("Graphs should contain at least one graph")
 
     # Consolidate graphs in a single graph and record components
-
-    # Renumber and concatenate sources in a single df
-
-    # Call multi_source_bfs
-    # multi_source_bfs(
-    #    G,
-    #    sources,
-    #    components=components,
-    #    depth_limit=depth_limit,
-    #    offload=offload,
-    # )
+    offsets, indices, bases = _block_diagonal_csr(Graphs)
+
+    # Renumber and concatenate sources in a single array
+    source_names = []
+    source_starts = np.zeros(len(Graphs) + 1, dtype=np.int64)
+    block_sources = []
+    footprint = 0
+    for i, (G, graph_sources) in enumerate(zip(Graphs, sources)):
+        if not isinstance(graph_sources, cudf.Series):
+            graph_sources = cudf.Series(graph_sources)
+        null_check(graph_sources)
+        num_vertices = bases[i + 1] - bases[i]
+        if graph_sources.size > num_vertices:
+            raise ValueError(f"Graphs[{i}] has more sources than vertices")
+        source_names.append(graph_sources.to_arrow().to_pylist())
+        if G.renumbered is True:
+            graph_sources = G.lookup_internal_vertex_id(graph_sources)
+        if graph_sources.size > 0 and (
+                graph_sources.null_count != 0 or
+                graph_sources.min() < 0 or
+                graph_sources.max() >= num_vertices):
+            raise ValueError(f"Graphs[{i}] does not contain all its sources")
+        block_sources.append(graph_sources.values_host.astype(np.int64) +
+                             bases[i])
+        source_starts[i + 1] = source_starts[i] + graph_sources.size
+        if offload is None and graph_sources.size > 0:
+            footprint += _get_feasibility(G, graph_sources, engine="cpu",
+                                          warn=False)
+    block_sources = np.concatenate(block_sources).astype(np.int32)
+    if len(block_sources) == 0:
+        raise ValueError("sources should contain at least one source")
+
+    if offload is None:
+        offload = footprint > _get_memory_bound("cpu")
+
+    batches = _cpu_bfs_batches(offsets, indices, block_sources, depth_limit)
+    if offload:
+        if offload_path is None:
+            offload_path = tempfile.mkdtemp(prefix="cugraph_concurrent_bfs_")
+        paths = [os.path.join(offload_path, f"graph_{i}")
+                 for i in range(len(Graphs))]
+        return _offload_output(Graphs, paths, source_names, source_starts,
+                               bases, batches, offload_format)
+
+    # Split the results back per graph
+    batches = list(batches)
+    source_pos, vertex, distance, predecessor = (
+        np.concatenate(column) for column in zip(*batches))
+    order = np.argsort(source_pos, kind="stable")
+    row_offsets = np.zeros(len(block_sources) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(source_pos, minlength=len(block_sources)),
+              out=row_offsets[1:])
+
+    results = []
+    for i, G in enumerate(Graphs):
+        graph_offsets = row_offsets[source_starts[i]:source_starts[i + 1] + 1]
+        rows = order[graph_offsets[0]:graph_offsets[-1]]
+        df = _reached_frame(G, vertex[rows], distance[rows],
+                            predecessor[rows], bases[i])
+        results.append((df, cudf.Series(graph_offsets - graph_offsets[0])))
+    return results
 
 
 def multi_source_bfs(
-    G, sources, components=None, depth_limit=None, offload=False
+    G, sources, components=None, depth_limit=None, offload=None,
+    engine="auto", offload_path=None, offload_format="binary"
 ):
     """
     Find the breadth first traversal from multiple sources in a graph.
@@ -216,11 +541,26 @@ def multi_source_bfs(
         components['color'] : cudf.Series
             component IDs/color for vertices.
 
-    offload : boolean, optional, default=False
+    offload : boolean, optional, default=None
         Indicates if output should be written to the disk.
         When not provided, the algorithms decides if offloading is needed
         based on the input parameters.
 
+    engine : str, optional, default='auto'
+        'cpu' runs the traversals on the host with a bitset engine, which
+        traverses 64 sources at once and scans the edges of each frontier
+        once for all of them. 'gpu' runs one BFS per source on the device.
+        'auto' uses 'cpu' when there is more than one source.
+
+    offload_path : str, optional, default=None
+        Directory the output is written to when offloading. A temporary
+        directory is created when not provided.
+
+    offload_format : str, optional, default='binary'
+        'binary' writes one raw file per column, which can be memory-mapped,
+        'parquet' writes a Parquet file with one row group per batch of
+        sources. Vertex ids that are not numeric require 'parquet'.
+
     Returns
     -------
     Return value type is decided based on the input parameters (size of
@@ -238,43 +578,78 @@ def multi_source_bfs(
 
     If G is a cugraph.Graph and component information is present returns :
         BFS_edge_lists : cudf.DataFrame
-            GPU data frame containing all BFS edges
+            GPU data frame containing all BFS edges: the 'vertex', 'distance'
+            and 'predecessor' of each vertex reached from each source,
+            grouped by source in the order of sources.
         source_offsets: cudf.Series
             Series containing the starting offset in the returned edge list
-            for each source.
+            for each source, followed by the size of the edge list.
 
     If offload is True, or if the output does not fit in memory :
-        Writes csv files containing BFS output to the disk.
+        Writes the BFS output of each source to the disk as soon as it is
+        computed, along with an offsets index, and returns:
+
+        output : cugraph.traversal.bfs_offload.OffloadedBFS
+            Reads back the 'vertex', 'distance' and 'predecessor' of the
+            vertices reached from a single source with
+            output.read_source(source), or from the i'th source with
+            output.read(i), without reading the other sources.
+
+    Examples
+    --------
+    >>> M = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(M, source='0', destination='1')
+    >>> df = cugraph.multi_source_bfs(G, cudf.Series([0, 5, 12]))
     """
-    raise NotImplementedError(
-        "concurrent_bfs is coming soon! Please up vote the github issue 1465\
-             to help us prioritize"
-    )
-    # if components is not None:
-    #    null_check(components["vertex"])
-    #    null_check(components["colors"])
-    #
-    # if depth_limit is not None:
-    #    raise NotImplementedError(
-    #        "depth limit implementation of BFS is not currently supported"
-    #    )
-
-    # if offload is True:
-    #    raise NotImplementedError(
-    #        "Offloading is coming soon! Please up vote the github issue 1461
-    #         to help us prioritize"
-    #    )
-    if isinstance(sources, list):
+    if engine not in ("auto", "cpu", "gpu"):
+        raise ValueError("engine must be 'auto', 'cpu' or 'gpu'")
+    if components is not None:
+        null_check(components["vertex"])
+        null_check(components["color"])
+    if not isinstance(sources, cudf.Series):
         sources = cudf.Series(sources)
+    null_check(sources)
+    num_vertices = G.number_of_vertices()
+    if sources.size == 0 or sources.size > num_vertices:
+        raise ValueError("The number of sources should be between 1 and the "
+                         "number of vertices")
+    source_names = sources.to_arrow().to_pylist()
     if G.renumbered is True:
-        sources = G.lookup_internal_vertex_id(cudf.Series(sources))
+        sources = G.lookup_internal_vertex_id(sources)
+    if sources.null_count != 0 or sources.min() < 0 or \
+            sources.max() >= num_vertices:
+        raise ValueError("Graph does not contain all the sources")
+    sources = sources.values_host.astype(np.int32)
+
+    if engine == "auto":
+        engine = "cpu" if len(sources) > 1 else "gpu"
+
     if not G.adjlist:
         G.view_adj_list()
     # Memory footprint check
     footprint = _get_feasibility(
-        G, sources, components=components, depth_limit=depth_limit
+        G, cudf.Series(sources), components=components,
+        depth_limit=depth_limit, engine=engine, warn=offload is False
     )
-    print(footprint)
-    # Call multi_source_bfs
-    # FIXME remove when implemented
-    # raise NotImplementedError("Commming soon")
+    if offload is None:
+        offload = footprint > _get_memory_bound(engine)
+
+    batches = _bfs_batches(G, sources, depth_limit, engine)
+    if offload:
+        if offload_path is None:
+            offload_path = tempfile.mkdtemp(prefix="cugraph_ms_bfs_")
+        return _offload_output(
+            [G], [offload_path], [source_names],
+            np.array([0, len(sources)]), [0], batches, offload_format)[0]
+
+    batches = list(batches)
+    source_pos, vertex, distance, predecessor = (
+        np.concatenate(column) for column in zip(*batches))
+
+    if components is not None:
+        return _sparse_output(G, len(sources), source_pos, vertex, distance,
+                              predecessor)
+    return _dense_output(G, source_names, source_pos, vertex, distance,
+                         predecessor)
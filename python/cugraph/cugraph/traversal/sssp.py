@@ -11,14 +11,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import heapq
+
 import numpy as np
 
 import cudf
 from cugraph.structure import Graph, DiGraph, MultiGraph, MultiDiGraph
 from cugraph.traversal import sssp_wrapper
+from cugraph.traversal.host_graph import (graph_csr,
+                                          matrix_csr,
+                                          frontier_edges,
+                                          )
 from cugraph.utilities import (ensure_cugraph_obj,
                                is_matrix_type,
                                is_cp_matrix_type,
+                               is_sp_matrix_type,
                                is_nx_graph_type,
                                cupy_package as cp,
                                )
@@ -40,6 +47,9 @@ def _ensure_args(G, source, method, directed,
         raise TypeError("cannot specify both 'source' and 'indices'")
     if (indices is None) and (source is None):
         raise TypeError("must specify 'source' or 'indices', but not both")
+    if (return_predecessors is not None) and \
+       (type(return_predecessors) != bool):
+        raise ValueError("'return_predecessors' must be a bool")
 
     G_type = type(G)
     # Check for Graph-type inputs
@@ -47,8 +57,6 @@ def _ensure_args(G, source, method, directed,
         exc_value = "'%s' cannot be specified for a Graph-type input"
         if directed is not None:
             raise TypeError(exc_value % "directed")
-        if return_predecessors is not None:
-            raise TypeError(exc_value % "return_predecessors")
         if unweighted is not None:
             raise TypeError(exc_value % "unweighted")
         if overwrite is not None:
@@ -60,9 +68,6 @@ def _ensure_args(G, source, method, directed,
     else:
         if (directed is not None) and (type(directed) != bool):
             raise ValueError("'directed' must be a bool")
-        if (return_predecessors is not None) and \
-           (type(return_predecessors) != bool):
-            raise ValueError("'return_predecessors' must be a bool")
         if (unweighted is not None) and (unweighted is not True):
             raise ValueError("'unweighted' currently must be True if "
                              "specified")
@@ -124,7 +129,8 @@ def sssp(G,
          return_predecessors=None,
          unweighted=None,
          overwrite=None,
-         indices=None):
+         indices=None,
+         output="dense"):
     """
     Compute the distance and predecessors for shortest paths from the specified
     source to all the vertices in the graph. The distances column will store
@@ -143,6 +149,13 @@ def sssp(G,
         point values.
     source : int
         Index of the source vertex.
+    return_predecessors : bool, optional (default=True)
+        If False, the predecessors are not returned, and not unrenumbered.
+    output : str, optional (default='dense')
+        'dense' returns all the vertices of the graph, 'sparse' only the
+        vertices reached from source, so that unrenumbering and copying the
+        result scale with the reached set.  Not supported for CuPy or SciPy
+        matrix inputs.
 
     Returns
     -------
@@ -157,7 +170,7 @@ def sssp(G,
               gives the path distance from the starting vertex
 
           df['predecessor']
-              the vertex it was reached from
+              the vertex it was reached from, if return_predecessors is True
 
     If G is a networkx.Graph, returns:
 
@@ -192,6 +205,8 @@ def sssp(G,
         G, nx_weight_attr="weight",
         matrix_graph_type=DiGraph if directed else Graph)
 
+    _ensure_output(output, input_type)
+
     if G.renumbered:
         if isinstance(source, cudf.DataFrame):
             source = G.lookup_internal_vertex_id(
@@ -204,13 +219,39 @@ def sssp(G,
             "Starting vertex should be between 0 to number of vertices")
 
     df = sssp_wrapper.sssp(G, source)
+    df = _finalize_output(G, df, output, return_predecessors)
+
+    return _convert_df_to_output_type(df, input_type, return_predecessors)
+
+
+def _ensure_output(output, input_type):
+    """
+    Check the output argument of sssp and bfs for input_type.
+    """
+    if output not in ("dense", "sparse"):
+        raise ValueError("output must be 'dense' or 'sparse', got: "
+                         f"{output}")
+    if output == "sparse" and is_matrix_type(input_type):
+        raise ValueError("output='sparse' is not supported for matrix "
+                         "inputs")
+
 
+def _finalize_output(G, df, output, return_predecessors):
+    """
+    Drop the unreached vertices of the sssp or bfs result df if output is
+    'sparse' and the predecessors if return_predecessors is False, before
+    converting the remaining internal vertex ids to external ids.
+    """
+    if output == "sparse":
+        df = filter_unreachable(df).reset_index(drop=True)
+    if not return_predecessors:
+        df = df.drop(columns="predecessor")
     if G.renumbered:
         df = G.unrenumber(df, "vertex")
-        df = G.unrenumber(df, "predecessor")
-        df.fillna(-1, inplace=True)
-
-    return _convert_df_to_output_type(df, input_type, return_predecessors)
+        if return_predecessors:
+            df = G.unrenumber(df, "predecessor")
+            df.fillna(-1, inplace=True)
+    return df
 
 
 def filter_unreachable(df):
@@ -250,29 +291,138 @@ def shortest_path(G,
                   return_predecessors=None,
                   unweighted=None,
                   overwrite=None,
-                  indices=None):
+                  indices=None,
+                  output="dense"):
     """
     Alias for sssp(), provided for API compatibility with NetworkX. See sssp()
     for details.
     """
     return sssp(G, source, method, directed, return_predecessors,
-                unweighted, overwrite, indices)
+                unweighted, overwrite, indices, output)
+
+
+def _bidirectional_bfs(forward, backward, source, target, num_vertices):
+    """
+    Return the number of hops from source to target, or None if target is
+    not reachable.  The smallest of the two frontiers is expanded one level
+    at a time and the search stops as soon as the frontiers meet.
+    """
+    if source == target:
+        return 0
+    graphs = (forward, backward)
+    visited = (np.zeros(num_vertices, dtype=bool),
+               np.zeros(num_vertices, dtype=bool))
+    visited[0][source] = True
+    visited[1][target] = True
+    frontiers = [np.array([source]), np.array([target])]
+    depth = 0
+    while len(frontiers[0]) > 0 and len(frontiers[1]) > 0:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        offsets, indices, _ = graphs[side]
+        _, positions = frontier_edges(offsets, frontiers[side])
+        neighbors = indices[positions]
+        depth += 1
+        if visited[1 - side][neighbors].any():
+            return depth
+        neighbors = np.unique(neighbors[~visited[side][neighbors]])
+        visited[side][neighbors] = True
+        frontiers[side] = neighbors
+    return None
+
+
+def _bidirectional_dijkstra(forward, backward, source, target):
+    """
+    Return the distance from source to target, or infinity if target is not
+    reachable.  The search stops once no unsettled vertex can lead to a
+    shorter path than the best one found, so only the vertices closer to
+    source or target than about half the distance are settled.
+    """
+    if source == target:
+        return 0.0
+    graphs = (forward, backward)
+    distances = ({source: 0.0}, {target: 0.0})
+    settled = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    best = np.inf
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        distance, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        offsets, indices, weights = graphs[side]
+        start, end = offsets[u], offsets[u + 1]
+        for v, weight in zip(indices[start:end].tolist(),
+                             weights[start:end].tolist()):
+            new_distance = distance + weight
+            if new_distance < distances[side].get(v, np.inf):
+                distances[side][v] = new_distance
+                heapq.heappush(heaps[side], (new_distance, v))
+                if v in distances[1 - side]:
+                    best = min(best, new_distance + distances[1 - side][v])
+    return best
+
+
+def _point_to_point_length(G, source, target):
+    """
+    Compute the distance from source to target with a bidirectional search
+    on the host CSR of G: BFS for unweighted graphs, Dijkstra otherwise.
+    """
+    matrix_input = is_matrix_type(type(G))
+    if matrix_input:
+        num_vertices = max(G.shape)
+    else:
+        (G, _) = ensure_cugraph_obj(G, nx_weight_attr="weight")
+        if G.renumbered:
+            source = G.lookup_internal_vertex_id(cudf.Series([source]))[0]
+            target = G.lookup_internal_vertex_id(cudf.Series([target]))[0]
+            if source is cudf.NA or target is cudf.NA:
+                raise ValueError("Graph does not contain source or target "
+                                 "vertex")
+        num_vertices = G.number_of_vertices()
+
+    if not (0 <= source < num_vertices and 0 <= target < num_vertices):
+        raise ValueError("Graph does not contain source or target vertex")
+
+    if matrix_input:
+        forward = backward = matrix_csr(G)
+    else:
+        forward = graph_csr(G)
+        backward = graph_csr(G, transposed=True) if G.is_directed() \
+            else forward
+
+    weights = forward[2]
+    if weights is None:
+        distance = _bidirectional_bfs(forward, backward, source, target,
+                                      num_vertices)
+        distance_type = np.dtype(np.float32)
+    else:
+        distance = _bidirectional_dijkstra(forward, backward, source, target)
+        distance_type = weights.dtype
+
+    # Unreachable vertices get the maximum value like in sssp
+    if distance is None or np.isinf(distance):
+        return np.finfo(distance_type).max
+    return distance_type.type(distance)
 
 
-def shortest_path_length(G, source, target=None):
+def shortest_path_length(G, source, target=None, engine="auto"):
     """
     Compute the distance from a source vertex to one or all vertexes in graph.
-    Uses Single Source Shortest Path (SSSP).
+    Uses Single Source Shortest Path (SSSP), or a bidirectional search that
+    stops as soon as the distance to target is known.
 
     Parameters
     ----------
-    graph : cuGraph.Graph, NetworkX.Graph, or CuPy sparse COO matrix
+    graph : cuGraph.Graph, NetworkX.Graph, or CuPy or SciPy sparse matrix
         cuGraph graph descriptor with connectivity information. Edge weights,
         if present, should be single or double precision floating point values.
 
     source : Dependant on graph type. Index of the source vertex.
 
-    If graph is an instance of cuGraph.Graph or CuPy sparse COO matrix:
+    If graph is an instance of cuGraph.Graph or a sparse matrix:
         int
 
     If graph is an instance of a NetworkX.Graph:
@@ -280,12 +430,21 @@ def shortest_path_length(G, source, target=None):
 
     target: Dependant on graph type. Vertex to find distance to.
 
-    If graph is an instance of cuGraph.Graph or CuPy sparse COO matrix:
+    If graph is an instance of cuGraph.Graph or a sparse matrix:
         int
 
     If graph is an instance of a NetworkX.Graph:
         str
 
+    engine : str, optional (default='auto')
+        How the distance to target is computed, if target is not None.
+        'gpu' runs SSSP from source and reads the distance of target.
+        'cpu' runs a bidirectional BFS (unweighted graphs) or Dijkstra
+        (weighted graphs) from source and target on the host, which only
+        visits the vertices around source and target.  'auto' uses 'cpu'
+        for SciPy matrices, which are already on the host, and 'gpu'
+        otherwise.
+
     Returns
     -------
     Return value type is based on the input type.
@@ -303,37 +462,40 @@ def shortest_path_length(G, source, target=None):
 
         Distance from source to target vertex.
     """
+    if engine not in ("auto", "gpu", "cpu"):
+        raise ValueError("engine must be 'auto', 'gpu' or 'cpu'")
+
+    input_type = type(G)
 
     # verify target is in graph before traversing
     if target is not None:
-        if not hasattr(G, "has_node"):
-            # G is a cupy coo_matrix. Extract maximum possible vertex value
-            as_matrix = G.toarray()
-            if target < 0 or target >= max(as_matrix.shape[0],
-                                           as_matrix.shape[1]):
+        if is_matrix_type(input_type):
+            # Only the shape is needed, the matrix is never densified
+            if target < 0 or target >= max(G.shape):
                 raise ValueError("Graph does not contain target vertex")
         elif not G.has_node(target):
             # G is an instance of cugraph or networkx graph
             raise ValueError("Graph does not contain target vertex")
 
-    df = sssp(G, source)
+        if engine == "cpu" or \
+                (engine == "auto" and is_sp_matrix_type(input_type)):
+            return _point_to_point_length(G, source, target)
 
-    if isinstance(df, tuple):
-        # cupy path, df is tuple of (distance, predecessor)
-        if target:
-            return df[0][target-1]
-        results = cudf.DataFrame()
-        results["vertex"] = range(df[0].shape[0])
-        results["distance"] = df[0]
-        return results
+    if is_matrix_type(input_type):
+        # Traverse the graph built from the matrix directly, so the results
+        # keep the matrix indices as vertex ids
+        (G, _) = ensure_cugraph_obj(G, matrix_graph_type=Graph)
 
-    else:
-        # cugraph and networkx path
-        if target:
-            target_distance = df.loc[df["vertex"] == target]
-            return target_distance.iloc[0]["distance"]
-
-        results = cudf.DataFrame()
-        results["vertex"] = df["vertex"]
-        results["distance"] = df["distance"]
-        return results
+    df = sssp(G, source)
+
+    if target is not None:
+        target_distance = df.loc[df["vertex"] == target]
+        if len(target_distance) == 0:
+            # Vertices without edges in a matrix are not part of the graph
+            return np.finfo(df["distance"].dtype).max
+        return target_distance.iloc[0]["distance"]
+
+    results = cudf.DataFrame()
+    results["vertex"] = df["vertex"]
+    results["distance"] = df["distance"]
+    return results
@@ -27,4 +27,5 @@ from cugraph.utilities.utils import (import_optional,
                                      renumber_vertex_pair,
                                      cupy_package,
                                      )
-from cugraph.utilities.path_retrieval import get_traversed_cost
+from cugraph.utilities.path_retrieval import (get_traversed_cost,
+                                              get_traversed_cost_batch)
@@ -21,52 +21,69 @@ ensure code using these utilities has done the proper checks prior to calling.
 import cugraph
 from .utils import import_optional
 import cudf
-from cudf import from_pandas
+import numpy as np
+import pandas as pd
 
 # nx will be a MissingModule instance if NetworkX is not installed (any
 # attribute access on a MissingModule instance results in a RuntimeError).
 nx = import_optional("networkx")
 
 
+def _nx_to_coo(NX_G, weight=None):
+    """
+    Export the edges of NX_G in bulk as a scipy COO matrix over the node
+    positions, along with the array mapping each position to its node label.
+    Each edge of an undirected graph is only returned once, and the parallel
+    edges of a multigraph are returned as separate rows.
+    """
+    nodes = list(NX_G)
+    # pandas infers a typed array for homogeneous labels, such as integers
+    labels = pd.Series(nodes, dtype=None if nodes else object).to_numpy()
+
+    if NX_G.is_multigraph():
+        # The sparse export sums parallel edges, walk the edge list instead
+        # so that each parallel edge stays a separate row
+        positions = {node: i for i, node in enumerate(nodes)}
+        if weight is None:
+            edges = [(u, v, 1.0) for u, v in NX_G.edges()]
+        else:
+            edges = list(NX_G.edges(data=weight, default=1.0))
+        row = np.array([positions[u] for u, _, _ in edges], dtype=np.int64)
+        col = np.array([positions[v] for _, v, _ in edges], dtype=np.int64)
+        data = np.array([w for _, _, w in edges])
+        return row, col, data, labels
+
+    to_scipy_sparse = getattr(nx, "to_scipy_sparse_array", None) or \
+        nx.to_scipy_sparse_matrix
+    coo = to_scipy_sparse(NX_G, nodelist=nodes, weight=weight,
+                          format="coo")
+    # The undirected export writes each self-loop as several entries that
+    # only add up to its weight, combine them before keeping one triangle
+    coo.sum_duplicates()
+    if not NX_G.is_directed():
+        upper = coo.row <= coo.col
+        return coo.row[upper], coo.col[upper], coo.data[upper], labels
+    return coo.row, coo.col, coo.data, labels
+
+
 def convert_unweighted_to_gdf(NX_G):
-    _edges = NX_G.edges(data=False)
-    src = [s for s, _ in _edges]
-    dst = [d for _, d in _edges]
+    row, col, _, labels = _nx_to_coo(NX_G)
 
     _gdf = cudf.DataFrame()
-    _gdf['src'] = src
-    _gdf['dst'] = dst
+    _gdf['src'] = labels[row]
+    _gdf['dst'] = labels[col]
 
     return _gdf
 
 
 def convert_weighted_named_to_gdf(NX_G, weight):
-    _edges = NX_G.edges(data=weight)
-
-    src = [s for s, _, _ in _edges]
-    dst = [d for _, d, _ in _edges]
-    wt = [w for _, _, w in _edges]
+    row, col, data, labels = _nx_to_coo(NX_G, weight=weight)
 
     _gdf = cudf.DataFrame()
-    _gdf['src'] = src
-    _gdf['dst'] = dst
-    _gdf['weight'] = wt
-
-    return _gdf
-
-
-def convert_weighted_unnamed_to_gdf(NX_G):
-    _pdf = nx.to_pandas_edgelist(NX_G)
-    nx_col = ["source", "target"]
-    wt_col = [col for col in _pdf.columns if col not in nx_col]
-    if len(wt_col) != 1:
-        raise ValueError(
-            "Unable to determine weight column name")
-
-    if wt_col[0] != "weight":
-        _pdf.rename(columns={wt_col[0]: "weight"})
+    _gdf['src'] = labels[row]
+    _gdf['dst'] = labels[col]
+    _gdf['weight'] = data
 
-    _gdf = from_pandas(_pdf)
     return _gdf
 
 
@@ -86,19 +103,17 @@ def convert_from_nx(nxG, weight=None, do_renumber=True):
 
     is_weighted = nx.is_weighted(nxG)
 
+    # The edges are exported in bulk through a scipy sparse matrix, see
+    # _nx_to_coo
     if is_weighted is False:
         _gdf = convert_unweighted_to_gdf(nxG)
         G.from_cudf_edgelist(_gdf, source="src", destination="dst",
                              edge_attr=None, renumber=do_renumber)
     else:
-        if weight is None:
-            _gdf = convert_weighted_unnamed_to_gdf(nxG)
-            G.from_cudf_edgelist(_gdf, source="source", destination="target",
-                                 edge_attr='weight', renumber=do_renumber)
-        else:
-            _gdf = convert_weighted_named_to_gdf(nxG, weight)
-            G.from_cudf_edgelist(_gdf, source="src", destination="dst",
-                                 edge_attr='weight', renumber=do_renumber)
+        # nx.is_weighted checks that every edge has a 'weight' attribute
+        _gdf = convert_weighted_named_to_gdf(nxG, weight or "weight")
+        G.from_cudf_edgelist(_gdf, source="src", destination="dst",
+                             edge_attr='weight', renumber=do_renumber)
 
     return G
 
@@ -177,10 +192,19 @@ def cugraph_to_nx(G):
     pdf = G.view_edge_list().to_pandas()
     num_col = len(pdf.columns)
 
+    if G.is_directed():
+        Gnx = nx.DiGraph()
+    else:
+        Gnx = nx.Graph()
+    # Add the edges in bulk from the numpy columns rather than through
+    # nx.from_pandas_edgelist, which builds an attribute dict per row
+    src = pdf["src"].to_numpy().tolist()
+    dst = pdf["dst"].to_numpy().tolist()
     if num_col == 2:
-        Gnx = nx.from_pandas_edgelist(pdf, source="src", target="dst")
+        Gnx.add_edges_from(zip(src, dst))
     else:
-        Gnx = nx.from_pandas_edgelist(pdf, source="src", target="dst",
-                                      edge_attr="weights")
+        Gnx.add_weighted_edges_from(
+            zip(src, dst, pdf["weights"].to_numpy().tolist()),
+            weight="weights")
 
     return Gnx
@@ -98,3 +98,147 @@ def get_traversed_cost(df, source, source_col, dest_col, value_col):
     out_df['vertex'] = renumber_map.unrenumber(renumbered_gdf, 'vertex',
                                                preserve_order=True)["vertex"]
     return out_df
+
+
+def _internal_ids(G, column):
+    """
+    Return the internal ids of the external vertex ids of column as a host
+    int64 array, -1 for the ids that are not vertices of G.
+    """
+    if G.renumbered:
+        column = G.lookup_internal_vertex_id(column).fillna(-1)
+    return column.values_host.astype(np.int64)
+
+
+def _edge_weights(G, row, col):
+    """
+    Look up the weights of the edges (row, col), given as internal ids, in
+    the CSR of G.  The smallest weight is used for multi-edges and the
+    weight of unweighted graphs is 1.  Returns the weights and the mask of
+    the edges found.
+    """
+    offsets, indices, weights = G.view_host_adj_list()
+    num_vertices = len(offsets) - 1
+    rows = np.repeat(np.arange(num_vertices, dtype=np.int64),
+                     np.diff(offsets))
+    keys = rows * num_vertices + indices
+    if weights is None:
+        weights = np.ones(len(keys), dtype=np.float32)
+    elif not np.issubdtype(weights.dtype, np.floating):
+        weights = weights.astype(np.float64)
+
+    # Binary search over the (row, col) keys, sorting them only if the
+    # rows of the CSR are not already sorted and free of multi-edges
+    if len(keys) > 1 and not (keys[1:] > keys[:-1]).all():
+        order = np.lexsort((weights, keys))
+        keys, weights = keys[order], weights[order]
+
+    query = row * num_vertices + col
+    if len(keys) == 0:
+        return (np.zeros(len(query), dtype=weights.dtype),
+                np.zeros(len(query), dtype=bool))
+    pos = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+    return weights[pos], keys[pos] == query
+
+
+def get_traversed_cost_batch(G, df, offsets=None):
+    """
+    Sum the edge weights of G along the path from each vertex to its source
+    for the results of many BFS or SSSP traversals at once, such as the
+    output of multi_source_bfs with components.
+
+    The predecessor edge of each vertex is looked up in the cached CSR of G
+    and the costs are accumulated for all the sources together by pointer
+    jumping up the predecessor trees.
+
+    Parameters
+    ----------
+    G : cugraph.Graph or cugraph.DiGraph
+        The graph the traversals were run on.
+    df : cudf.DataFrame
+        The stacked results of the traversals, with the 'vertex', 'distance'
+        and 'predecessor' columns.  The rows of each traversal are given by
+        offsets, or by a 'source' column.  If there are neither, df is the
+        result of a single traversal.
+    offsets : cudf.Series, optional (default=None)
+        The first row of the result of each traversal in df, followed by
+        the number of rows.
+
+    Returns
+    -------
+    df : cudf.DataFrame
+        A copy of df with an 'info' column holding the cost of the path to
+        each vertex.  The sources have a cost of 0 and the unreachable
+        vertices the max value of the weight type.
+
+    Examples
+    --------
+    >>> df, offsets = cugraph.multi_source_bfs(G, sources,
+    >>>                                        components=components)
+    >>> costs = get_traversed_cost_batch(G, df, offsets)
+    """
+    for column in ['vertex', 'distance', 'predecessor']:
+        if column not in df.columns:
+            raise ValueError("DataFrame does not appear to be a BFS or "
+                             f"SSP result - '{column}' column missing")
+
+    num_rows = len(df)
+    if offsets is not None:
+        offsets = np.asarray(offsets.values_host
+                             if hasattr(offsets, 'values_host') else offsets,
+                             dtype=np.int64)
+        if len(offsets) == 0 or offsets[0] != 0 or \
+                offsets[-1] != num_rows:
+            raise ValueError("offsets do not match the rows of df")
+        group = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64),
+                          np.diff(offsets))
+    elif 'source' in df.columns:
+        _, group = np.unique(df['source'].values_host, return_inverse=True)
+        group = group.astype(np.int64)
+    else:
+        group = np.zeros(num_rows, dtype=np.int64)
+
+    num_vertices = G.number_of_vertices()
+    vertex = _internal_ids(G, df['vertex'])
+    predecessor = _internal_ids(G, df['predecessor'])
+    is_source = df['distance'].values_host == 0
+    has_predecessor = (predecessor >= 0) & ~is_source
+
+    # Row of the predecessor of each vertex, in the same traversal
+    keys = group * num_vertices + vertex
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    query = group[has_predecessor] * num_vertices + \
+        predecessor[has_predecessor]
+    pos = np.minimum(np.searchsorted(keys, query), max(num_rows - 1, 0))
+    parent = np.full(num_rows, -1, dtype=np.int64)
+    found = keys[pos] == query
+    parent[np.flatnonzero(has_predecessor)[found]] = order[pos[found]]
+
+    # Weight of the predecessor edge of each vertex
+    weights, edge_found = _edge_weights(G, predecessor[has_predecessor],
+                                        vertex[has_predecessor])
+    cost = np.zeros(num_rows, dtype=weights.dtype)
+    cost[has_predecessor] = weights
+    unreachable = ~is_source
+    unreachable[has_predecessor] = ~(found & edge_found)
+
+    # Pointer jumping: after each round cost holds the cost from the vertex
+    # up to ancestor, whose distance to the vertex doubles every round
+    ancestor = parent
+    active = np.flatnonzero(ancestor >= 0)
+    for _ in range(max(num_rows, 1).bit_length() + 1):
+        if len(active) == 0:
+            break
+        up = ancestor[active]
+        cost[active] += cost[up]
+        unreachable[active] |= unreachable[up]
+        ancestor[active] = ancestor[up]
+        active = active[ancestor[active] >= 0]
+    if len(active) != 0:
+        raise ValueError("the predecessors of df contain a cycle")
+
+    cost[unreachable] = np.finfo(cost.dtype).max
+    out_df = df.copy()
+    out_df['info'] = cost
+    return out_df
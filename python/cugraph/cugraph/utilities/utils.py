@@ -16,6 +16,7 @@ import importlib
 from numba import cuda
 
 import cudf
+import numpy as np
 from rmm._cuda.gpu import (
     getDeviceAttribute,
     cudaDeviceAttr,
@@ -199,6 +200,111 @@ def get_traversed_path_list(df, id):
     return answer
 
 
+def get_traversed_paths(df, targets):
+    """
+    Take the DataFrame result from a BFS or SSSP function call and extract
+    the paths to all the specified vertices at once.  A dense predecessor
+    array is built once and the paths are resolved together by pointer
+    jumping, in O(log(max path length)) passes over the result instead of
+    one pass per hop and per path.
+
+    Input Parameters
+    ----------
+    df : cudf.DataFrame
+        The dataframe containing the results of a BFS or SSSP call
+    targets : cudf.Series or iterable container
+        The vertex IDs, of the same data type as df['vertex']
+
+    Returns
+    ---------
+    offsets : cudf.Series
+        Series of size len(targets) + 1.  The path to targets[i] is stored in
+        vertices[offsets[i]:offsets[i + 1]].
+    vertices : cudf.Series
+        The steps of the paths, each one ordered from the target to the root
+        as in get_traversed_path_list.
+
+    Examples
+    --------
+    >>> gdf = cudf.read_csv('datasets/karate.csv', delimiter=' ',
+    >>>                   dtype=['int32', 'int32', 'float32'], header=None)
+    >>>
+    >>> G = cugraph.Graph()
+    >>> G.from_cudf_edgelist(gdf, source='0', destination='1')
+    >>> sssp_df = cugraph.sssp(G, 1)
+    >>> offsets, vertices = cugraph.utils.get_traversed_paths(sssp_df,
+    >>>                                                       [32, 33])
+    """
+
+    for column in ["vertex", "distance", "predecessor"]:
+        if column not in df.columns:
+            raise ValueError(
+                "DataFrame does not appear to be a BFS or "
+                f"SSP result - '{column}' column missing"
+            )
+
+    # There is no guarantee that the dataframe has not been filtered
+    # or edited, so vertices are resolved to row positions through a sorted
+    # copy of the vertex column rather than used as positions
+    order = df["vertex"].argsort().astype(np.int64)
+    keys = df["vertex"].take(order).reset_index(drop=True)
+    num_rows = len(keys)
+
+    def _row_positions(values):
+        values = values.reset_index(drop=True).astype(keys.dtype)
+        if num_rows == 0:
+            return cudf.Series(np.full(len(values), -1, dtype=np.int64))
+        pos = cudf.Series(keys.searchsorted(values)).clip(upper=num_rows - 1)
+        found = keys.take(pos).reset_index(drop=True) == values
+        return order.take(pos).reset_index(drop=True).where(found, -1)
+
+    if not isinstance(targets, cudf.Series):
+        targets = cudf.Series(targets)
+    target_rows = _row_positions(targets)
+    if (target_rows < 0).any():
+        raise ValueError("Some targets are not in the result set")
+
+    # jumps[j][r] is the row of the 2^j-th ancestor of row r, -1 past the
+    # root.  depth is computed by pointer jumping alongside.
+    parent = _row_positions(df["predecessor"])
+    has_parent = parent >= 0
+    depth = has_parent.astype(np.int64)
+    ancestor = parent
+    jumps = [parent]
+    # The 2^i-th ancestors are all past the root once 2^i >= num_rows
+    for _ in range(int(np.log2(num_rows + 1)) + 2):
+        valid = ancestor >= 0
+        if not valid.any():
+            break
+        safe = ancestor.clip(lower=0)
+        depth = depth + depth.take(safe).reset_index(drop=True).where(valid, 0)
+        ancestor = ancestor.take(safe).reset_index(drop=True).where(valid, -1)
+        jumps.append(ancestor)
+    else:
+        raise ValueError("The predecessors contain a cycle")
+
+    lengths = depth.take(target_rows).reset_index(drop=True) + 1
+    offsets = cudf.concat([cudf.Series([0], dtype=np.int64),
+                           lengths.cumsum()], ignore_index=True)
+    total = int(offsets.iloc[-1])
+
+    # Step k of the path to a target is its k-th ancestor, reached by
+    # following the jumps of the bits of k
+    steps = (
+        cudf.Series(np.arange(total, dtype=np.int64)) -
+        offsets[:-1].repeat(lengths).reset_index(drop=True)
+    )
+    rows = target_rows.repeat(lengths).reset_index(drop=True)
+    for j, jump in enumerate(jumps):
+        take_jump = ((steps >> j) & 1) == 1
+        if not take_jump.any():
+            continue
+        rows = jump.take(rows).reset_index(drop=True).where(take_jump, rows)
+
+    vertices = df["vertex"].take(rows).reset_index(drop=True)
+    return offsets, vertices
+
+
 def is_cuda_version_less_than(min_version=(10, 2)):
     """
     Returns True if the version of CUDA being used is less than min_version